@@ -1,7 +1,7 @@
 import numpy as np
 from .model import AssignmentProblem, Assignment, NormalizedAssignmentProblem
 from ..simplex.model import Model
-from ..simplex.expressions.expression import Expression
+from ..simplex.expressions.builder import LinearExpressionBuilder
 from dataclasses import dataclass
 from typing import List
 
@@ -24,38 +24,33 @@ class Solver:
     def solve(self) -> Assignment:
         model = Model("assignment")
 
-        # 1) creates variables, one for each cost in the cost matrix
+        # 1) creates variables, one for each cost in the cost matrix, every variable has to be <= 1
         # 2) add constraint, that sum of every row has to be equal 1
         # 3) add constraint, that sum of every col has to be equal 1
-        # 4) add constraint, that every variable has to be <= 1
-        # 5) create an objective expression, involving all variables weighted by their cost
-        # 6) add the objective to model (minimize it!)
+        # 4) create an objective expression, involving all variables weighted by their cost
+        # 5) add the objective to model (minimize it!)
 
         ilosc_wierszy = len(self.problem.costs)
         ilosc_kolumn = len(self.problem.costs[0])
-        xs = [[model.create_variable(f'x{i, j}') for j in range(ilosc_kolumn)] for i in range(ilosc_wierszy)]
+        xs = [[model.create_variable(f'x{i, j}', upper=1) for j in range(ilosc_kolumn)] for i in range(ilosc_wierszy)]
 
         for i in range(ilosc_wierszy):
-            constraint = Expression()
+            constraint = LinearExpressionBuilder()
             for j in range(ilosc_kolumn):
                 constraint += xs[i][j]
-            model.add_constraint(constraint == 1)
+            model.add_constraint(constraint.build() == 1)
 
         for j in range(ilosc_kolumn):
-            constraint = Expression()
+            constraint = LinearExpressionBuilder()
             for i in range(ilosc_wierszy):
                 constraint += xs[i][j]
-            model.add_constraint(constraint == 1)
+            model.add_constraint(constraint.build() == 1)
 
+        obj = LinearExpressionBuilder()
         for i in range(ilosc_wierszy):
             for j in range(ilosc_kolumn):
-                model.add_constraint(xs[i][j] <= 1)
-
-        obj = Expression()
-        for i in range(ilosc_wierszy):
-            for j in range(ilosc_kolumn):
-                obj += xs[i][j] * self.problem.costs[i][j]
-        model.minimize(obj)
+                obj.add(xs[i][j], self.problem.costs[i][j])
+        model.minimize(obj.build())
 
         solution = model.solve()
 
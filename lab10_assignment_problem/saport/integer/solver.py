@@ -1,4 +1,3 @@
-from copy import deepcopy
 from ..simplex import solver as lpsolver
 import math
 import time 
@@ -34,13 +33,16 @@ class Solver:
 
         solve(model: Model, timelimit: int) -> Solution:
             solves the given model within a specified timelimit
-        branch_and_bound(model: Model):
-            processes given model in branch and bound fashion (recursively)
+        branch_and_bound(model: Model, start_basis: Basis | None):
+            processes given model in branch and bound fashion (recursively),
+            relaxations are warm started from the optimal basis of the parent relaxation,
+            their solutions are lightweight (without tableaux, see Solution.discard_tableaux), so the search doesn't hold dense tables
         find_float_assignment(solution: Solution):
             finds a variable with non-integer value in the current solution
             returns None if the solution is a correct integer solution
-        model_with_new_constraint(self, model, constraint):
-            creates a new model with an additional constraint
+        model_with_new_bounds(self, model, var, lower, upper):
+            creates a new model (a snapshot sharing the expressions) with tightened bounds of the given variable
+            returns None if the bounds become contradictory
     """  
 
     def solve(self, model, timelimit):
@@ -59,8 +61,8 @@ class Solver:
 
         return self.best_solution
            
-    def branch_and_bound(self, model):
-        relaxed_solution = lpsolver.Solver().solve(model)
+    def branch_and_bound(self, model, start_basis = None):
+        relaxed_solution = lpsolver.Solver(keep_tableaux=False).solve(model, start_basis)
 
         if relaxed_solution.assignment == None:
             if self.best_solution == None:
@@ -84,10 +86,12 @@ class Solver:
             return 
 
         current_value = relaxed_solution.value(var_to_branch)
-        new_model = self.model_with_new_constraint(model, var_to_branch >= math.ceil(current_value))
-        self.branch_and_bound(new_model)
-        new_model = self.model_with_new_constraint(model, var_to_branch <= math.floor(current_value))
-        self.branch_and_bound(new_model)
+        new_model = self.model_with_new_bounds(model, var_to_branch, lower = math.ceil(current_value))
+        if new_model != None:
+            self.branch_and_bound(new_model, relaxed_solution.basis)
+        new_model = self.model_with_new_bounds(model, var_to_branch, upper = math.floor(current_value))
+        if new_model != None:
+            self.branch_and_bound(new_model, relaxed_solution.basis)
 
         
     def find_float_assignment(self, solution):
@@ -98,9 +102,14 @@ class Solver:
                 return var
         return None
 
-    def model_with_new_constraint(self, model, constraint):
-        new_model = deepcopy(model)
-        new_model.add_constraint(constraint)
+    def model_with_new_bounds(self, model, var, lower = float('-inf'), upper = float('inf')):
+        old_var = model.variables[var.index]
+        lower = max(old_var.lower, lower)
+        upper = min(old_var.upper, upper)
+        if lower > upper:
+            return None
+        new_model = model.snapshot()
+        new_model.set_variable_bounds(old_var, lower, upper)
         return new_model
 
     def start_timer(self):
@@ -1,35 +1,31 @@
+import numpy as np
+import scipy.sparse as sp
 from .solver import AbstractSolver
 from ...simplex.model import Model as LinearModel
-from ...simplex.expressions.expression import Expression as LinearExpression
 from ..model import Network 
 
 class SimplexSolver(AbstractSolver):
 
     def solve(self) -> int:
         m = LinearModel(self.network.name)
-        vars = {(u,v) : m.create_variable(f"f({u},{v})") for u,v in self.network.digraph.edges()}
-
-        for (u,v), var in vars.items():
-            m.add_constraint(var <= Network.capacity(self.network.digraph, u, v))
-
-        for u in self.network.digraph.nodes():
-            if u in { self.network.sink_node, self.network.source_node }:
-                continue
-
+        edges = list(self.network.digraph.edges())
+        edge_index = {edge: i for (i, edge) in enumerate(edges)}
+        for (u, v) in edges:
+            m.create_variable(f"f({u},{v})", upper=Network.capacity(self.network.digraph, u, v))
+
+        # flow conservation: inflows - outflows == 0 for every node except the source and the sink
+        rows, cols, factors = [], [], []
+        inner_nodes = [u for u in self.network.digraph.nodes() if u not in { self.network.sink_node, self.network.source_node }]
+        for (row, u) in enumerate(inner_nodes):
             preds = [v for v in self.network.digraph.predecessors(u) if v != self.network.sink_node]
             succs = [v for v in self.network.digraph.successors(u) if v != self.network.source_node]
+            rows += [row] * (len(preds) + len(succs))
+            cols += [edge_index[(v, u)] for v in preds] + [edge_index[(u, v)] for v in succs]
+            factors += [1.0] * len(preds) + [-1.0] * len(succs)
+        conservation = sp.csr_matrix((factors, (rows, cols)), shape=(len(inner_nodes), len(edges)))
+        m.add_constraints_from_matrix(conservation, np.zeros(len(inner_nodes)), "=")
 
-            inflows_vars = [vars[(v, u)] for v in preds]
-            outflows_vars = [vars[(u, v)] for v in succs]
-
-            expression = LinearExpression.from_vectors(inflows_vars + outflows_vars, [1.0] * len(inflows_vars) + [-1.0] * len(outflows_vars))
-            m.add_constraint(expression == 0)
-
-        source_vars = [vars[(u,v)] for (u,v) in vars.keys() if u == self.network.source_node]
-        expression = LinearExpression.from_vectors(source_vars, [1.0] * len(source_vars))
-        m.maximize(expression)
+        m.set_objective_vector([1.0 if u == self.network.source_node else 0.0 for (u, _) in edges], "max")
 
         solution = m.solve()
-        return int(solution.objective_value())
-
-
+        return int(round(solution.objective_value()))
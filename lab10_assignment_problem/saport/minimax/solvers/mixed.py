@@ -3,7 +3,6 @@ from .solver import AbstractSolver
 from ..model import Game, Equilibrium, Strategy
 from ...simplex import model as lpmodel
 from ...simplex import solution as lpsolution
-from ...simplex.expressions import expression as expr
 import numpy as np
 from typing import Tuple, List
 
@@ -17,8 +16,9 @@ class MixedSolver(AbstractSolver):
 
         a_model = self.create_max_model(shifted_game)
         b_model = self.create_min_model(shifted_game)       
-        a_solution = a_model.solve()
-        b_solution = b_model.solve()
+        # models of the games with many more actions of the opponent are solved through their duals
+        a_solution = a_model.solve(strategy="auto")
+        b_solution = b_model.solve(strategy="auto")
 
         a_probabilities = self.extract_probabilities(a_solution)
         b_probabilities = self.extract_probabilities(b_solution)
@@ -33,31 +33,31 @@ class MixedSolver(AbstractSolver):
 
     def create_max_model(self, game: Game) -> lpmodel.Model:
         a_num_actions, _ = game.reward_matrix.shape
-        a_actions = range(a_num_actions)
         a_model = lpmodel.Model("A")
 
-        v = a_model.create_variable("v")
-        xs = [a_model.create_variable(f"x{i}") for i in a_actions]
-        
-        a_model.add_constraint(expr.Expression.from_vectors(xs, [1 for _ in xs]) == 1)
-        for col in game.reward_matrix.T:
-            a_model.add_constraint(expr.Expression.from_vectors([v] + xs, [1] + list(-1 * col)) <= 0)
-        a_model.maximize(v)
+        a_model.create_variable("v")
+        a_model.create_variables("x", a_num_actions)
+
+        # sum(xs) == 1, v - rewards^T * xs <= 0
+        a_model.add_constraints_from_matrix(np.hstack([[[0]], np.ones((1, a_num_actions))]), [1], "=")
+        rewards = game.reward_matrix.T
+        a_model.add_constraints_from_matrix(np.hstack([np.ones((rewards.shape[0], 1)), -rewards]), np.zeros(rewards.shape[0]), "<=")
+        a_model.set_objective_vector([1] + [0] * a_num_actions, "max")
 
         return a_model
 
     def create_min_model(self, game: Game) -> lpmodel.Model:
         _, b_num_actions = game.reward_matrix.shape
-        b_actions = range(b_num_actions)
 
         b_model = lpmodel.Model("B")
-        v = b_model.create_variable("v")
-        ys = [b_model.create_variable(f"y{i}") for i in b_actions]
-        
-        b_model.add_constraint(expr.Expression.from_vectors(ys, [1 for _ in ys]) == 1)
-        for row in game.reward_matrix:
-            b_model.add_constraint(expr.Expression.from_vectors([v] + ys, [1] + list(-1 * row)) >= 0)
-        b_model.minimize(v)
+        b_model.create_variable("v")
+        b_model.create_variables("y", b_num_actions)
+
+        # sum(ys) == 1, v - rewards * ys >= 0
+        b_model.add_constraints_from_matrix(np.hstack([[[0]], np.ones((1, b_num_actions))]), [1], "=")
+        rewards = game.reward_matrix
+        b_model.add_constraints_from_matrix(np.hstack([np.ones((rewards.shape[0], 1)), -rewards]), np.zeros(rewards.shape[0]), ">=")
+        b_model.set_objective_vector([1] + [0] * b_num_actions, "min")
 
         return b_model
 
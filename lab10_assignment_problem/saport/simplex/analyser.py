@@ -1,4 +1,5 @@
 from .analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from .analysis_tools.rhs_sensitivity import RhsSensitivityAnalyser
 
 class Analyser:
     """
@@ -19,7 +20,7 @@ class Analyser:
     """
     
     def __init__(self):
-        self.tools = [ObjectiveSensitivityAnalyser()]
+        self.tools = [ObjectiveSensitivityAnalyser(), RhsSensitivityAnalyser()]
 
     def analyse(self, solution):
         result = dict()
@@ -1,3 +1,10 @@
+import numpy as np
+import scipy.sparse as sp
+
+from .. import matrix as mx
+from .. import tableaux as t
+
+
 class ObjectiveSensitivityAnalyser:
     """
         A class used to analyse sensitivity to changes of the cost factors.
@@ -10,12 +17,13 @@ class ObjectiveSensitivityAnalyser:
 
         Methods
         -------
-        analyse(solution: Solution) -> List[(float, float)]
-            analyses the solution and returns list of tuples containing acceptable bounds for every objective coefficient, i.e.
-            if the results contain tuple (-inf, 5.0) at index 1, it means that objective coefficient at index 1 should have value >= -inf and <= 5.0
-            to keep the current solution an optimum
+        analyse(solution: Solution) -> numpy.Array
+            analyses the solution and returns array of shape (variables, 2) containing acceptable bounds for every objective coefficient, i.e.
+            if the results contain row [-inf, 5.0] at index 1, it means that objective coefficient at index 1 should have value >= -inf and <= 5.0
+            to keep the current solution an optimum (all the ranges are computed at once from the final tableaux,
+            columns of the bounded variables are mapped back through their substitutions)
 
-         interpret_results(solution: Solution, results : List(float, float), print_function : Callable = print):
+         interpret_results(solution: Solution, results : numpy.Array, print_function : Callable = print):
             prints an interpretation of the given analysis results via given print function
     """    
 
@@ -27,32 +35,42 @@ class ObjectiveSensitivityAnalyser:
         self.name = ObjectiveSensitivityAnalyser.name()
     
     def analyse(self, solution):
-        obj_coeffs = solution.normal_model.objective.expression.factors(solution.model)
-        final_obj_coeffs = solution.tableaux.table[0,:-1]
-        obj_coeffs_ranges = []
-
-        basis = solution.tableaux.extract_basis()
-        for (i, obj_coeff) in enumerate(obj_coeffs):
-            left_side, right_side = None, None
-            if i in basis:
-                row = basis.index(i)
-                row_coeffs = solution.tableaux.table[row + 1, :-1]
-                
-                left_side_bounds = [final_obj_coeffs[j] / a for (j, a) in enumerate(row_coeffs) if a > 0 and j != i]
-                left_side = float('-inf') if len(left_side_bounds) == 0 else obj_coeff - min(left_side_bounds)
-                right_side_bounds = [final_obj_coeffs[j] / a for (j, a) in enumerate(row_coeffs) if a < 0 and j != i]
-                right_side = float('inf') if len(right_side_bounds) == 0 else obj_coeff - max(right_side_bounds)           
-            else:
-                left_side = float('-inf')
-                right_side = obj_coeff + solution.tableaux.table[0,i]
-
-            obj_coeffs_ranges.append((left_side, right_side))
-        
-        return obj_coeffs_ranges
+        if solution.normal_columns is None:
+            raise Exception("Cost coefficients of a presolved model can't be analysed, its normal model doesn't contain all the variables")
+        if solution.tableaux is None:
+            raise Exception("Cost coefficients can't be analysed, the final tableaux is too big to be materialized (see matrix.DENSE_TABLEAUX_LIMIT)")
+
+        tableaux = solution.tableaux
+        (column_variables, column_factors) = solution.normal_columns
+        variables_n = len(solution.model.variables)
+        columns = np.arange(len(column_variables))
+
+        # changes of the tableaux cost factors per unit change of every cost coefficient,
+        # columns of the substituted and split variables follow the changes scaled by their factors and complemented columns are negated
+        factors = column_factors * np.where(tableaux.complemented[columns], -1.0, 1.0)
+        rows = np.full(tableaux.table.shape[1] - 1, -1)
+        rows[tableaux.basis[tableaux.basis >= 0]] = np.flatnonzero(tableaux.basis >= 0)
+        column_rows = rows[columns]
+        basic = column_rows >= 0
+        basic_costs = sp.csr_matrix((factors[basic], (column_variables[basic], column_rows[basic])), shape=(variables_n, len(tableaux.basis)))
+        changes = basic_costs @ tableaux.table[1:, :-1]
+        changes[column_variables, columns] -= factors
+
+        # the current solution stays optimal as long as the cost factors of the nonbasic columns stay nonnegative
+        # (basic and fixed columns don't limit the changes)
+        changes[:, (rows >= 0) | (tableaux.upper == 0)] = 0.0
+        cost_factors = np.maximum(tableaux.table[0, :-1], 0.0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratios = -cost_factors / changes
+        lower_steps = np.where(changes > t.eps, ratios, -np.inf).max(axis=1, initial=-np.inf)
+        upper_steps = np.where(changes < -t.eps, ratios, np.inf).min(axis=1, initial=np.inf)
+
+        obj_coeffs = mx.objective_vector(solution.model)
+        return np.column_stack([obj_coeffs + lower_steps, obj_coeffs + upper_steps])
 
 
     def interpret_results(self, solution, obj_coeffs_ranges, print_function):        
-        org_coeffs = solution.normal_model.objective.expression.factors(solution.model)
+        org_coeffs = mx.objective_vector(solution.model)
 
         print_function("* Cost Coefficients Sensitivity Analysis:")
         print_function("-> To keep the the current optimum, the cost coefficients should stay in following ranges:")
@@ -0,0 +1,110 @@
+import numpy as np
+import scipy.linalg as la
+import scipy.sparse as sp
+
+from .. import matrix as mx
+from .. import tableaux as t
+
+
+class RhsSensitivityAnalyser:
+    """
+        A class used to analyse sensitivity to changes of the right hand sides of the constraints.
+        The analysis uses the inverse of the final basis, so all the constraints are analysed at once, without solving the model again,
+        columns of the inverse are read from the final tableaux (columns of the slack variables and other singleton columns),
+        only rows without any singleton column (e.g. equality constraints) require solving the basis.
+
+
+        Attributes
+        ----------
+        name : str
+            unique name of the analysis tool
+
+        Methods
+        -------
+        analyse(solution: Solution) -> (numpy.Array, numpy.Array)
+            analyses the solution and returns a tuple of arrays:
+            - array of shape (constraints, 2) containing acceptable bounds for every right hand side, i.e.
+              if the array contains row [2.0, inf] at index 1, it means that right hand side of the constraint at index 1 should have value >= 2.0
+              to keep the current basis optimal (values of the basic variables change, but they stay within their bounds)
+            - array of the shadow prices, i.e. changes of the objective value per unit increase of every right hand side (within its bounds)
+
+        interpret_results(solution: Solution, results : (numpy.Array, numpy.Array), print_function : Callable = print):
+            prints an interpretation of the given analysis results via given print function
+    """
+
+    @classmethod
+    def name(self):
+        return "Right Hand Side Sensitivity Analysis"
+
+    def __init__(self):
+        self.name = RhsSensitivityAnalyser.name()
+
+    def analyse(self, solution):
+        if solution.normal_rows is None:
+            raise Exception("Right hand sides of a presolved model can't be analysed, its normal model doesn't contain all the constraints")
+        if solution.tableaux is None:
+            raise Exception("Right hand sides can't be analysed, the final tableaux is too big to be materialized (see matrix.DENSE_TABLEAUX_LIMIT)")
+
+        tableaux = solution.tableaux
+        (row_constraints, row_factors) = solution.normal_rows
+        inverse = self._basis_inverse(tableaux, solution.normal_model)
+
+        # directions map changes of the constraints bounds onto changes of the normal model rhs
+        rows_n = len(row_constraints)
+        constraints_n = len(solution.model.constraints)
+        directions = sp.csr_matrix((row_factors, (np.arange(rows_n), row_constraints)), shape=(rows_n, constraints_n))
+
+        shadow_prices = solution.dual_values()
+
+        # steps are changes of the basic variables per unit change of the bounds,
+        # the basic variables of the redundant rows (artificial ones) have to stay at zero
+        # (variables not changing get NaN limits, ignored by fmin / fmax)
+        steps = inverse @ directions
+        steps[np.abs(steps) <= t.eps] = np.nan
+        upper = np.where(tableaux.basis >= 0, tableaux.basic_upper(), 0.0)[:, None]
+        # values slightly outside of the bounds (due to the rounding errors) would exclude the current bound from its range
+        values = np.clip(tableaux.basic_values()[:, None], 0.0, upper)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            to_lower = -values / steps
+            to_upper = (upper - values) / steps
+        lower_steps = np.fmax.reduce(np.fmin(to_lower, to_upper), axis=0, initial=-np.inf)
+        upper_steps = np.fmin.reduce(np.fmax(to_lower, to_upper), axis=0, initial=np.inf)
+
+        bounds = np.array([constraint.bound for constraint in solution.model.constraints])
+        ranges = np.column_stack([bounds + lower_steps, bounds + upper_steps])
+        return (ranges, shadow_prices)
+
+    def _basis_inverse(self, tableaux, normal_model):
+        """
+            _basis_inverse(tableaux: Tableaux, normal_model: Model) -> numpy.Array:
+                returns the inverse of the basis of the tableaux, columns of the complemented variables are negated,
+                rows without a basic variable get the column of their (removed) artificial variable
+        """
+        rows_n = len(tableaux.basis)
+        matrix = sp.csc_matrix(mx.constraint_matrix(normal_model))
+        inverse = np.empty((rows_n, rows_n))
+
+        # column a * e_row of the constraint matrix is transformed in the tableaux into (+/-) a * inverse[:, row]
+        singletons = np.flatnonzero(np.diff(matrix.indptr) == 1)
+        rows = matrix.indices[matrix.indptr[singletons]]
+        factors = np.where(tableaux.complemented[singletons], -1.0, 1.0) / matrix.data[matrix.indptr[singletons]]
+        inverse[:, rows] = tableaux.table[1:, singletons] * factors
+
+        missing = np.setdiff1d(np.arange(rows_n), rows)
+        if len(missing) > 0:
+            basic = tableaux.basis >= 0
+            basis_matrix = np.zeros((rows_n, rows_n))
+            basis_matrix[:, basic] = matrix[:, tableaux.basis[basic]].toarray() * np.where(tableaux.complemented[tableaux.basis[basic]], -1.0, 1.0)
+            basis_matrix[~basic, ~basic] = 1.0
+            inverse[:, missing] = la.lu_solve(la.lu_factor(basis_matrix), np.eye(rows_n)[:, missing])
+        return inverse
+
+    def interpret_results(self, solution, results, print_function = print):
+        (ranges, shadow_prices) = results
+        bounds = [constraint.bound for constraint in solution.model.constraints]
+
+        print_function("* Right Hand Side Sensitivity Analysis:")
+        print_function("-> To keep the the current basis optimal, the right hand sides should stay in following ranges:")
+        col_width = max([max(len(f'{r[0]:.3f}'), len(f'{r[1]:.3f}')) for r in ranges], default=0)
+        for (i, r) in enumerate(ranges):
+            print_function(f"\t {r[0]:{col_width}.3f} <= b{i} <= {r[1]:{col_width}.3f}, (originally: {bounds[i]:.3f}, shadow price: {shadow_prices[i]:.3f})")
@@ -0,0 +1,39 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+import numpy as np
+
+
+@dataclass
+class Basis:
+    """
+        A class to represent a simplex basis independently of the tableaux, so it can be used to warm start another solve.
+        Variables are identified by their names in the normal model (e.g. "x1", slack "s3"),
+        names missing in the model being solved are just ignored.
+
+        Attributes
+        ----------
+        basic : List[str]
+            names of the basic variables
+        at_upper : List[str]
+            names of the nonbasic variables being at their upper bounds
+        values : Dict[str, float]
+            values of the variables not known to be at their bounds (e.g. an interior point solution),
+            the nonbasic ones are pushed to their bounds when the basis is installed (missing variables are at their bounds)
+
+        Methods
+        -------
+        from_tableaux(tableaux: Tableaux | RevisedTableaux) -> Basis:
+            returns the basis of the given tableaux (columns not belonging to the normal model, e.g. artificial ones, are skipped)
+    """
+    basic: List[str]
+    at_upper: List[str] = field(default_factory=list)
+    values: Dict[str, float] = field(default_factory=dict)
+
+    @staticmethod
+    def from_tableaux(tableaux):
+        variables = tableaux.model.variables
+        basic = [variables[col].name for col in tableaux.basis if 0 <= col < len(variables)]
+        nonbasic = np.ones(len(variables), dtype=bool)
+        nonbasic[[col for col in tableaux.basis if 0 <= col < len(variables)]] = False
+        at_upper = np.flatnonzero(tableaux.complemented[:len(variables)] & nonbasic)
+        return Basis(basic, [variables[col].name for col in at_upper])
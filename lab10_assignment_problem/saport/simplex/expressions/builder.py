@@ -0,0 +1,55 @@
+from . import expression as e
+from . import atom as a
+
+
+class LinearExpressionBuilder:
+    """
+        A class to accumulate a linear expression in place, e.g. in loops like `builder += x * cost`.
+        Unlike the repeated Expression.__add__ (copying all the atoms every time), the total cost is linear in the number of terms,
+        factors of the same variable are summed up on the fly.
+
+        Attributes
+        ----------
+        factors : dict[int, (Variable, float)]
+            map from the variable index to the variable and its accumulated factor (in the order of the first occurrence)
+
+        Methods
+        -------
+        __init__(*expressions: *Expression) -> LinearExpressionBuilder:
+            constructs a builder containing the given expressions
+        add(expression: Expression, factor: float = 1.0) -> LinearExpressionBuilder:
+            adds the expression multiplied by the factor, returns the builder itself
+        __iadd__(expression: Expression) -> LinearExpressionBuilder:
+            adds the expression in place
+        __isub__(expression: Expression) -> LinearExpressionBuilder:
+            subtracts the expression in place
+        build() -> Expression:
+            returns an expression with the accumulated atoms (one atom per variable)
+    """
+
+    def __init__(self, *expressions):
+        self.factors = dict()
+        for expression in expressions:
+            self.add(expression)
+
+    def add(self, expression, factor = 1.0):
+        if isinstance(expression, LinearExpressionBuilder):
+            atoms = ((var, f) for (var, f) in expression.factors.values())
+        else:
+            atoms = ((atom.var, atom.factor) for atom in expression.atoms)
+        for (var, f) in atoms:
+            entry = self.factors.get(var.index)
+            self.factors[var.index] = (var, f * factor if entry is None else entry[1] + f * factor)
+        return self
+
+    def __iadd__(self, expression):
+        return self.add(expression)
+
+    def __isub__(self, expression):
+        return self.add(expression, -1.0)
+
+    def build(self):
+        return e.Expression(*[a.Atom(var, factor) for (var, factor) in self.factors.values()])
+
+    def __len__(self):
+        return len(self.factors)
@@ -18,6 +18,19 @@ class ConstraintType(Enum):
             ConstraintType.GE: ">="
         }[self]
 
+    @staticmethod
+    def create(type):
+        """
+            create(type: ConstraintType | str) -> ConstraintType:
+                returns the given type or the type with the given symbol ("<=", "=", ">=")
+        """
+        if isinstance(type, ConstraintType):
+            return type
+        symbols = {str(t): t for t in ConstraintType}
+        if type not in symbols:
+            raise Exception(f"There is no constraint type {type}, available types: {', '.join(symbols.keys())}")
+        return symbols[type]
+
 class Constraint:
     """
         A class to represent a constraint in the linear programming expression, e.g. 4x + 5y <= 13, etc.
@@ -1,6 +1,6 @@
 from . import constraint as co
 
-from itertools import groupby
+import numpy as np
 from functools import reduce
 
 
@@ -12,6 +12,8 @@ class Expression:
         ----------
         atoms : list[Atom]
             list of the atoms in the polynomial
+            (assigning new atoms invalidates the compiled representation,
+            expressions created from arrays build their atoms only when they are accessed)
 
         Methods
         -------
@@ -19,13 +21,25 @@ class Expression:
             constructs an expression with atoms given in the paremeter list
         @classmethod from_vectors(variables : Iterable[Variable], factors: Iterable[float]) -> Expression:
             constructs an expression with collections of factors and corresponding variables
+        @classmethod from_arrays(variables: list[Variable], indices: numpy.Array, factors: numpy.Array) -> Expression:
+            constructs an expression directly from its compiled representation, i.e. sorted unique indices of the variables
+            (in the given list, e.g. model.variables) and their factors, without creating any atoms
+        atoms_count() -> int:
+            returns number of the atoms (without creating them)
         evaluate(assignment: list[float]) -> float:
             returns value of the expression for the given assignment
             assignment is just a list of values with order corresponding to the variables in the model
+        compiled() -> (numpy.Array, numpy.Array):
+            returns sorted unique indices of the variables and their summed factors,
+            computed once and cached until the atoms change
+        is_simplified() -> bool:
+            checks whether the atoms are already sorted and reduced
         simplify() -> Expression:
-            returns a new expression with sorted and atoms and reduced factors 
+            returns an expression with sorted and atoms and reduced factors (the expression itself if it's already simplified)
         factors(model: Model) -> list[float]:
             return list of factors corresponding to the variables in the model
+        factor(variable: Variable) -> float:
+            returns the (summed) factor of the given variable, 0 if the expression doesn't contain it
         __add__(other: Expression) -> Expression:
             returns sum of the two polynomials
         __sub__(other: Expression) -> Expression:
@@ -44,6 +58,19 @@ class Expression:
     def __init__(self, *atoms):
         self.atoms = atoms 
 
+    @property
+    def atoms(self):
+        if self._atoms is None:
+            from .atom import Atom
+            (_, factors, variables, _) = self._compiled
+            self._atoms = tuple(Atom(var, factor) for (var, factor) in zip(variables, factors.tolist()))
+        return self._atoms
+
+    @atoms.setter
+    def atoms(self, atoms):
+        self._atoms = tuple(atoms)
+        self._compiled = None
+
     @classmethod
     def from_vectors(self, variables, factors):
         from .atom import Atom
@@ -51,28 +78,68 @@ class Expression:
         atoms = [Atom(v,f) for (v,f) in zip(variables, factors)]
         return Expression(*atoms)
 
+    @classmethod
+    def from_arrays(self, variables, indices, factors):
+        indices = np.asarray(indices, dtype=int)
+        return Expression._from_compiled(indices, np.asarray(factors, dtype=float), [variables[i] for i in indices.tolist()])
+
+    @staticmethod
+    def _from_compiled(indices, factors, variables):
+        expression = Expression()
+        expression._atoms = None
+        expression._compiled = (indices, factors, variables, True)
+        return expression
+
+    def atoms_count(self):
+        return len(self._compiled[0]) if self._atoms is None else len(self._atoms)
+
     def evaluate(self, assignment):
         adder = lambda val, a: val + a.evaluate_with_value(assignment[a.var.index])
         return reduce(adder, self.atoms, 0) 
 
+    def compiled(self):
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled[0], self._compiled[1]
+
+    def is_simplified(self):
+        self.compiled()
+        return self._compiled[3]
+
+    def _compile(self):
+        atoms_n = len(self.atoms)
+        indices = np.fromiter((a.var.index for a in self.atoms), dtype=int, count=atoms_n)
+        factors = np.fromiter((a.factor for a in self.atoms), dtype=float, count=atoms_n)
+        if atoms_n > 1 and np.any(indices[1:] <= indices[:-1]):
+            order = np.argsort(indices, kind='stable')
+            indices, factors = indices[order], factors[order]
+            starts = np.flatnonzero(np.concatenate(([True], indices[1:] != indices[:-1])))
+            indices, factors = indices[starts], np.add.reduceat(factors, starts)
+            variables = [self.atoms[i].var for i in order[starts]]
+            return indices, factors, variables, False
+        return indices, factors, [a.var for a in self.atoms], True
+
     def simplify(self):
         from . import atom
-        projection = lambda a: a.var.index
-        reduce_atoms = lambda a1, a2: atom.Atom(a1.var, a1.factor + a2.factor)
-        reduce_group = lambda g: reduce(reduce_atoms, g[1:], g[0])
-    
-        sorted_atoms = sorted(self.atoms, key=projection)
-        grouped_atoms = [list(g[1]) for g in groupby(sorted_atoms, key=projection)]
- 
-        new_atoms = (reduce_group(g) for g in grouped_atoms) 
-        return Expression(*new_atoms)
+        if self.is_simplified():
+            # expressions are never modified in place, so the already simplified one can be shared
+            return self
+        (_, factors, variables, _) = self._compiled
+        new_atoms = (atom.Atom(var, factor) for (var, factor) in zip(variables, factors.tolist()))
+        simplified = Expression(*new_atoms)
+        simplified._compiled = self._compiled[:3] + (True,)
+        return simplified
 
     def factors(self, model):
-        simplified_expression = self.simplify()
-        factors = [0.0 for _ in model.variables]
-        for a in simplified_expression.atoms:
-            factors[a.var.index] = a.factor
-        return factors
+        (indices, factors) = self.compiled()
+        dense_factors = np.zeros(len(model.variables))
+        dense_factors[indices] = factors
+        return dense_factors.tolist()
+
+    def factor(self, variable):
+        (indices, factors) = self.compiled()
+        position = np.searchsorted(indices, variable.index)
+        return float(factors[position]) if position < len(indices) and indices[position] == variable.index else 0.0
 
     def __add__(self, other):
         new_atoms = list(self.atoms)
@@ -88,6 +155,9 @@ class Expression:
         return Expression(*new_atoms)
 
     def __mul__(self, factor):
+        if self._atoms is None:
+            (indices, factors, variables, _) = self._compiled
+            return Expression._from_compiled(indices, factors * factor, variables)
         new_atoms = [a * factor for a in self.atoms]
         return Expression(*new_atoms)
 
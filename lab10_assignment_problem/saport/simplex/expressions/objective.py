@@ -16,6 +16,19 @@ class ObjectiveType(Enum):
             ObjectiveType.MIN: 'min'
         }[self]
 
+    @staticmethod
+    def create(type):
+        """
+            create(type: ObjectiveType | str) -> ObjectiveType:
+                returns the given type or the type with the given name ("max", "min")
+        """
+        if isinstance(type, ObjectiveType):
+            return type
+        names = {str(t): t for t in ObjectiveType}
+        if type not in names:
+            raise Exception(f"There is no objective type {type}, available types: {', '.join(names.keys())}")
+        return names[type]
+
 class Objective: 
     """
         A class to represent an objective in the linear programming expression, e.g. 4x + 5y -> max, etc.
@@ -56,7 +69,7 @@ class Objective:
         return Objective(self.expression.simplify(), self.type, self.factor)
 
     def depends_on_variable(self, model, variable):
-        return self.expression.factors(model)[variable.index] != 0
+        return self.expression.factor(variable) != 0
 
     def evaluate(self, assignment):
         return self.expression.evaluate(assignment)
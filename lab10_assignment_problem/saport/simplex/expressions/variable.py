@@ -14,17 +14,30 @@ class Variable(a.Atom):
             index of the variable used in the model
         type : VariableType
             type of the variable
+        lower : float
+            lower bound of the variable (0 by default, -inf for a free variable)
+        upper : float
+            upper bound of the variable (inf by default)
 
         Methods
         -------
-        __init__(name: str, index: int) -> Variable:
-            constructs new variable with a specified name and index
+        __init__(name: str, index: int, lower: float = 0.0, upper: float = inf) -> Variable:
+            constructs new variable with a specified name, index and bounds
+        has_default_bounds() -> bool:
+            checks whether the variable is just nonnegative (0 <= var < inf)
     """
-    def __init__(self, name, index):
+    def __init__(self, name, index, lower = 0.0, upper = float('inf')):
+        if lower > upper:
+            raise Exception(f"Lower bound of the variable {name} ({lower}) is greater than the upper one ({upper})")
         self.name = name
         self.index = index
+        self.lower = float(lower)
+        self.upper = float(upper)
         super().__init__(self, 1)
 
+    def has_default_bounds(self):
+        return self.lower == 0.0 and self.upper == float('inf')
+
     def __str__(self):
         return self.name
 
@@ -0,0 +1,229 @@
+import time
+import numpy as np
+import scipy.linalg as la
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from . import basis as b
+from . import matrix as mx
+from .expressions import constraint as c
+
+# the interior point method stops when the relative primal and dual infeasibilities and the relative duality gap are below it
+# (the crossover only needs to tell the basic variables apart, so there is no need to push the iterates further)
+IPM_TOLERANCE = 1e-6
+
+# maximal number of the interior point iterations, if the method doesn't converge (e.g. the model is infeasible or unbounded),
+# the crossover solves the model from the slack basis
+IPM_ITERATIONS = 100
+
+# fraction of the step to the boundary of the positive orthant taken by the corrector
+STEP_FRACTION = 0.99
+
+# if the method stalls (which happens close to unbounded optimal faces, e.g. with free variables), its best iterate is still used
+# for the crossover if its relative infeasibilities and gap are below this tolerance
+CROSSOVER_TOLERANCE = 1e-3
+
+# number of iterations without any improvement of the best iterate after which the method is considered stalled
+STALL_ITERATIONS = 5
+
+# regularization added to the diagonal of the normal equations (relative to its biggest element), keeping them solvable for dependent rows
+REGULARIZATION = 1e-10
+
+
+class InteriorPointSolver:
+    """
+        A class to solve linear programming models with the Mehrotra's predictor-corrector interior point method.
+        The method works on the standard model of the crossover solver (maximized, with all the variables bounded from below by 0),
+        turned into min -c * x, A * x + s = b, 0 <= x <= upper, s >= 0 (the upper bounds are kept out of the constraint matrix).
+        Each iteration solves the normal equations A * D * A^T * dy = r twice (for the predictor and the corrector) with one factorization,
+        the Cholesky one for the dense models and the sparse LU for the sparse ones.
+        The interior solution isn't basic, so it's followed by a crossover: variables far from their bounds (relative to their reduced costs)
+        make the start basis of the simplex solver, the ones not fitting into the basis are pushed to their bounds
+        and the simplex optimizes the resulting vertex in a few pivots,
+        so the final solution has the tableaux, basis, etc. of the simplex (and its status is always determined by the simplex).
+
+        Attributes
+        ----------
+        crossover_solver : Solver | RevisedSolver
+            simplex solver finishing the optimization, its options (pricing, scaling, limits, statistics) are used for the crossover
+        iterations : int
+            number of the interior point iterations of the last solve
+        converged : bool
+            whether the interior point method got close enough to the optimum in the last solve to give the crossover basis
+            (otherwise the crossover started from the slack basis)
+
+        Methods
+        -------
+        __init__(crossover_solver: Solver | RevisedSolver) -> InteriorPointSolver:
+            constructs a solver using the given simplex solver for the crossover
+        solve(model: Model, start_basis: Basis | None = None) -> Solution:
+            solves the given model and returns the solution found by the crossover
+            (the interior point method can't be warm started and the model can't be presolved)
+    """
+
+    def __init__(self, crossover_solver):
+        self.crossover_solver = crossover_solver
+        self.iterations = 0
+        self.converged = False
+
+    def solve(self, model, start_basis = None):
+        if start_basis is not None:
+            raise Exception("The interior point method can't be warm started")
+        if self.crossover_solver.presolve:
+            raise Exception("The interior point method doesn't support presolving, the crossover basis refers to the rows of the original model")
+
+        start = time.perf_counter()
+        crossover_basis = self._interior_basis(model)
+        interior_time = time.perf_counter() - start
+        solution = self.crossover_solver.solve(model, crossover_basis)
+        if solution.stats is not None:
+            solution.stats.stage_times["interior point"] = interior_time
+            solution.stats.interior_point_iterations = self.iterations
+        return solution
+
+    def _interior_basis(self, model):
+        """
+            _interior_basis(model: Model) -> Basis | None:
+                solves the model with the interior point method and returns the crossover basis (None if the method didn't get close to the optimum),
+                variables are named like in the normal model of the crossover solver (slack of the row i is "s{i}")
+        """
+        self.iterations = 0
+        self.converged = False
+        standard_model = self.crossover_solver.standard_model(model)
+        A = mx.constraint_matrix(standard_model)
+        (rows_n, columns_n) = A.shape
+        if rows_n == 0:
+            return None
+
+        # columns: variables and slacks of the inequalities
+        slack_rows = np.array([i for (i, constraint) in enumerate(standard_model.constraints) if constraint.type == c.ConstraintType.LE], dtype=int)
+        slacks = (np.ones(len(slack_rows)), (slack_rows, np.arange(len(slack_rows))))
+        if sp.issparse(A):
+            matrix = sp.hstack([A, sp.csc_matrix(slacks, shape=(rows_n, len(slack_rows)))], format='csr')
+        else:
+            matrix = np.hstack([A, sp.csc_matrix(slacks, shape=(rows_n, len(slack_rows))).toarray()])
+        upper = np.concatenate([mx.upper_bound_vector(standard_model), np.full(len(slack_rows), np.inf)])
+        costs = np.concatenate([-mx.objective_vector(standard_model), np.zeros(len(slack_rows))])
+
+        with np.errstate(over='ignore', divide='ignore', invalid='ignore'):
+            result = self._mehrotra(matrix, mx.rhs_vector(standard_model), costs, upper)
+        if result is None:
+            return None
+        self.converged = True
+        (x, z, w, v) = result
+
+        # a variable is basic if it's far from its bounds relative to their reduced costs, the clearest ones are pivoted in first
+        (ratios, upper_ratios) = (x / z, w / v)
+        candidates = np.minimum(ratios, upper_ratios)
+        names = [var.name for var in standard_model.variables] + [f"s{row}" for row in slack_rows]
+        order = [i for i in np.argsort(-candidates, kind='stable') if candidates[i] > 1.0]
+        at_upper = [names[i] for i in np.flatnonzero((upper_ratios <= 1.0) & (ratios > 1.0))]
+        # the candidates not fitting into the basis (the optimal face isn't a vertex) are pushed to their bounds by the crossover
+        return b.Basis([names[i] for i in order], at_upper, {names[i]: x[i] for i in order})
+
+    def _mehrotra(self, matrix, rhs, costs, upper):
+        """
+            _mehrotra(matrix: numpy.Array | scipy.sparse.csr_matrix, rhs: numpy.Array, costs: numpy.Array, upper: numpy.Array) -> (numpy.Array, numpy.Array, numpy.Array, numpy.Array) | None:
+                solves min costs * x, matrix * x = rhs, 0 <= x <= upper with the predictor-corrector method,
+                returns the primal solution, the reduced costs and the slacks of the upper bounds with their dual values (infinite and zero for the unbounded variables)
+                of the best iterate, None if the method didn't get close to the optimum
+        """
+        columns_n = matrix.shape[1]
+        bounded = upper < np.inf
+        solve = self._normal_equations_solver(matrix, np.ones(columns_n))
+
+        # Mehrotra's starting point: least squares solutions shifted into the positive orthant (and below the upper bounds),
+        # negative reduced costs of the bounded variables go to the dual values of their upper bounds
+        x = matrix.T @ solve(rhs)
+        y = solve(matrix @ costs)
+        z = costs - matrix.T @ y
+        v = np.where(bounded, np.maximum(-z, 0.0), 0.0)
+        z = np.where(bounded, np.maximum(z, 0.0), z)
+        x += max(-1.5 * x.min(), 0.0)
+        z += max(-1.5 * z.min(), 0.0)
+        x_z = x @ z
+        if x_z > 0.0:
+            (x, z) = (x + 0.5 * x_z / z.sum(), z + 0.5 * x_z / x.sum())
+        # (degenerate models, e.g. with zero costs, may still have some values at zero)
+        x[x <= 0.0] = 1.0
+        z[z <= 0.0] = 1.0
+        x = np.where(bounded & (x >= upper), 0.5 * upper, x)
+        w = upper - x
+        v[bounded & (v <= 0.0)] = 1.0
+
+        rhs_norm = 1.0 + np.linalg.norm(rhs)
+        costs_norm = 1.0 + np.linalg.norm(costs)
+        upper_norm = 1.0 + np.linalg.norm(upper[bounded])
+        (best, best_error, stalled) = (None, np.inf, 0)
+        while self.iterations < IPM_ITERATIONS and stalled < STALL_ITERATIONS:
+            primal_residuals = matrix @ x - rhs
+            upper_residuals = np.where(bounded, x + w - upper, 0.0)
+            dual_residuals = matrix.T @ y + z - v - costs
+            objective = costs @ x
+            gap = objective - rhs @ y + upper[bounded] @ v[bounded]
+            error = max(np.linalg.norm(primal_residuals) / rhs_norm, np.linalg.norm(upper_residuals) / upper_norm,
+                        np.linalg.norm(dual_residuals) / costs_norm, abs(gap) / (1.0 + abs(objective)))
+            if error < best_error:
+                (best, best_error, stalled) = ((x.copy(), z.copy(), w.copy(), v.copy()), error, 0)
+            else:
+                stalled += 1
+            if error < IPM_TOLERANCE:
+                break
+            self.iterations += 1
+
+            mu = (x @ z + w[bounded] @ v[bounded]) / (columns_n + np.count_nonzero(bounded))
+            d = 1.0 / (z / x + v / w)
+            # iterates of the infeasible and unbounded models diverge
+            if not np.all(np.isfinite(d)) or not np.isfinite(mu):
+                break
+            try:
+                solve = self._normal_equations_solver(matrix, d)
+            except (la.LinAlgError, RuntimeError):
+                break
+
+            def direction(x_complementarity, w_complementarity):
+                # the upper bounds are eliminated from the newton system, leaving only the normal equations for dy
+                residuals = -dual_residuals + x_complementarity / x - w_complementarity / w + v / w * upper_residuals
+                dy = solve(-primal_residuals + matrix @ (d * residuals))
+                dx = d * (matrix.T @ dy - residuals)
+                dw = np.where(bounded, -upper_residuals - dx, 0.0)
+                dz = (-x_complementarity - z * dx) / x
+                dv = np.where(bounded, (-w_complementarity - v * dw) / w, 0.0)
+                return (dx, dy, dz, dw, dv)
+
+            # predictor (affine scaling direction) estimates how much the complementarity can be reduced,
+            # the corrector compensates its second order term and centers the step
+            (dx, dy, dz, dw, dv) = direction(x * z, np.where(bounded, w * v, 0.0))
+            primal_step = min(self._max_step(x, dx), self._max_step(w, dw))
+            dual_step = min(self._max_step(z, dz), self._max_step(v, dv))
+            affine_mu = ((x + primal_step * dx) @ (z + dual_step * dz) + (w + primal_step * dw)[bounded] @ (v + dual_step * dv)[bounded]) \
+                / (columns_n + np.count_nonzero(bounded))
+            sigma = (affine_mu / mu) ** 3
+            (dx, dy, dz, dw, dv) = direction(x * z + dx * dz - sigma * mu, np.where(bounded, w * v + dw * dv - sigma * mu, 0.0))
+
+            primal_step = min(1.0, STEP_FRACTION * min(self._max_step(x, dx, np.inf), self._max_step(w, dw, np.inf)))
+            dual_step = min(1.0, STEP_FRACTION * min(self._max_step(z, dz, np.inf), self._max_step(v, dv, np.inf)))
+            (x, w) = (x + primal_step * dx, w + primal_step * dw)
+            (y, z, v) = (y + dual_step * dy, z + dual_step * dz, v + dual_step * dv)
+        return best if best_error < CROSSOVER_TOLERANCE else None
+
+    def _normal_equations_solver(self, A, d):
+        """
+            _normal_equations_solver(A: numpy.Array | scipy.sparse.csr_matrix, d: numpy.Array) -> Callable[[numpy.Array], numpy.Array]:
+                factorizes A * diag(d) * A^T (regularized) and returns a function solving the system for the given right hand side
+        """
+        if sp.issparse(A):
+            normal_matrix = sp.csc_matrix(A @ sp.diags(d) @ A.T)
+            shift = REGULARIZATION * max(1.0, normal_matrix.diagonal().max())
+            factorization = spla.splu(normal_matrix + shift * sp.identity(A.shape[0], format='csc'), permc_spec='MMD_AT_PLUS_A')
+            return factorization.solve
+        normal_matrix = (A * d) @ A.T
+        normal_matrix[np.diag_indices_from(normal_matrix)] += REGULARIZATION * max(1.0, normal_matrix.diagonal().max())
+        factorization = la.cho_factor(normal_matrix, check_finite=False)
+        return lambda rhs: la.cho_solve(factorization, rhs, check_finite=False)
+
+    def _max_step(self, values, directions, limit = 1.0):
+        decreasing = directions < 0
+        if not np.any(decreasing):
+            return limit
+        return min(limit, np.min(-values[decreasing] / directions[decreasing]))
@@ -0,0 +1,118 @@
+import numpy as np
+import scipy.sparse as sp
+
+# models with a smaller fraction of nonzero constraint factors are stored in a sparse (CSC) matrix
+DENSITY_THRESHOLD = 0.1
+
+# sparse models with a bigger tableaux (in number of cells) are solved with the revised simplex by default
+REVISED_SIMPLEX_CELLS = 10**6
+
+# the biggest tableaux (in number of cells) that is still worth materializing as a dense array
+DENSE_TABLEAUX_LIMIT = 10**7
+
+
+def nonzeros_count(model):
+    """
+        nonzeros_count(model: Model) -> int:
+            returns an upper bound on the number of nonzero factors in the model constraints (without simplifying them)
+    """
+    return sum(c.expression.atoms_count() for c in model.constraints)
+
+
+def density(model):
+    """
+        density(model: Model) -> float:
+            returns an estimated fraction of nonzero factors in the model constraints
+    """
+    cells = len(model.constraints) * len(model.variables)
+    return 1.0 if cells == 0 else nonzeros_count(model) / cells
+
+
+def is_sparse(model, density_threshold = None):
+    """
+        is_sparse(model: Model, density_threshold: float | None) -> bool:
+            checks whether constraints of the model should be stored in a sparse matrix (by default using DENSITY_THRESHOLD)
+    """
+    return density(model) < (DENSITY_THRESHOLD if density_threshold is None else density_threshold)
+
+
+def constraint_triplets(model):
+    """
+        constraint_triplets(model: Model) -> (numpy.Array, numpy.Array, numpy.Array):
+            returns rows, columns and factors of the compiled model constraints (factors of the same variable are merged)
+    """
+    compiled = [c.expression.compiled() for c in model.constraints]
+    if len(compiled) == 0:
+        return np.empty(0, dtype=int), np.empty(0, dtype=int), np.empty(0, dtype=float)
+    lengths = [len(indices) for (indices, _) in compiled]
+    rows = np.repeat(np.arange(len(compiled)), lengths)
+    cols = np.concatenate([indices for (indices, _) in compiled])
+    factors = np.concatenate([factors for (_, factors) in compiled])
+    return rows, cols, factors
+
+
+def constraint_matrix(model, sparse = None):
+    """
+        constraint_matrix(model: Model, sparse: bool | None) -> numpy.Array | scipy.sparse.csc_matrix:
+            returns matrix of the constraint factors, by default the storage is chosen based on the model density
+    """
+    sparse = is_sparse(model) if sparse is None else sparse
+    shape = (len(model.constraints), len(model.variables))
+    rows, cols, factors = constraint_triplets(model)
+    if sparse:
+        # duplicated entries are summed up while converting to CSC
+        matrix = sp.csc_matrix((factors, (rows, cols)), shape=shape)
+        matrix.eliminate_zeros()
+        return matrix
+    matrix = np.zeros(shape)
+    np.add.at(matrix, (rows, cols), factors)
+    return matrix
+
+
+def constraint_matrix_into(model, out):
+    """
+        constraint_matrix_into(model: Model, out: numpy.Array):
+            adds the constraint factors to the preallocated dense array (or its view), e.g. a part of the tableaux
+    """
+    rows, cols, factors = constraint_triplets(model)
+    np.add.at(out, (rows, cols), factors)
+
+
+def rhs_vector(model):
+    """
+        rhs_vector(model: Model) -> numpy.Array:
+            returns vector of the constraint bounds
+    """
+    return np.array([c.bound for c in model.constraints], dtype=float)
+
+
+def objective_vector(model):
+    """
+        objective_vector(model: Model) -> numpy.Array:
+            returns vector of the objective factors
+    """
+    factors = np.zeros(len(model.variables))
+    (indices, objective_factors) = model.objective.expression.compiled()
+    factors[indices] = objective_factors
+    return factors
+
+
+def upper_bound_vector(model):
+    """
+        upper_bound_vector(model: Model) -> numpy.Array:
+            returns vector of the variables upper bounds (inf for the unbounded ones)
+    """
+    return np.array([v.upper for v in model.variables], dtype=float)
+
+
+def column(matrix, index):
+    """
+        column(matrix: numpy.Array | scipy.sparse.csc_matrix, index: int) -> numpy.Array:
+            returns a dense copy of the column with the given index
+    """
+    if sp.issparse(matrix):
+        dense = np.zeros(matrix.shape[0])
+        start, end = matrix.indptr[index], matrix.indptr[index + 1]
+        dense[matrix.indices[start:end]] = matrix.data[start:end]
+        return dense
+    return matrix[:, index].copy()
@@ -1,13 +1,19 @@
-from copy import deepcopy
+from copy import copy
 import enum
 from itertools import permutations
 
 from . import solver as s
+from . import revised as r
+from . import ipm as ip
+from . import solution as so
+from . import matrix as mx
+from . import basis as b
 from .expressions import expression as ex
 from .expressions import variable as va
 from .expressions import objective as ob
 from .expressions import constraint as co
 import numpy as np
+import scipy.sparse as sp
 
 class Model:
     """
@@ -20,6 +26,8 @@ class Model:
             name of the problem
         variables : list[Variable]
             list with the problem variable, variable with index 'i' is always stored at the variables[i]
+        variables_by_name : dict[str, Variable]
+            index of the problem variables by their names
         constraints : list[Constraint]
             list containing problem constraints
         objective : Objective
@@ -29,44 +37,147 @@ class Model:
         -------
         __init__(name: str) -> Model:
             constructs new model with a specified name
-        create_variable(name: str) -> Variable
+        create_variable(name: str, lower: float = 0.0, upper: float = inf) -> Variable
             returns a new variable with a specified named, the variable is automatically indexed and added to the variables list
+            bounds are handled by the solver without any additional constraints (lower = -inf makes the variable free)
+        create_variables(prefix: str, count: int, lower: float = 0.0, upper: float = inf) -> list[Variable]
+            returns count new variables named prefix0, prefix1, ..., registered at once
+        variable(name: str) -> Variable
+            returns the variable with a specified name
+        set_variable_bounds(variable: Variable, lower: float, upper: float) -> Variable
+            replaces the variable with its copy having the given bounds and returns the copy
+            (variables may be shared by model snapshots, so they are never modified in place)
         add_constraint(constraint: Constraint)
             add a new constraint to the model
+        add_constraints_from_matrix(A: numpy.Array | scipy.sparse.spmatrix, b: Iterable[float], types: ConstraintType | str | Iterable = ConstraintType.LE)
+            adds constraints A[i] * variables (type) b[i], columns of A correspond to the model variables,
+            types can be given for every row or one for all of them (also as symbols: "<=", "=", ">=")
+        set_objective_vector(c: Iterable[float], sense: ObjectiveType | str = ObjectiveType.MAX)
+            sets objective to maximize / minimize (also as "max", "min") c * variables
         maximize(expression: Expression)
             sets objective to maximize the specified Expression
         minimize(expression: Expression)
             sets objective to minimize the specified Expression
+        to_matrix_form() -> (numpy.Array | scipy.sparse.csc_matrix, numpy.Array, list[ConstraintType], numpy.Array, ObjectiveType | None)
+            returns the model as (A, b, types, c, sense), A is sparse if the model is sparse (see matrix.DENSITY_THRESHOLD)
+        snapshot() -> Model
+            returns a copy of the model sharing variables and expressions with it (solvers never modify them in place),
+            lists of variables and constraints, constraints and objective are copied, so they can be changed independently
         translate_to_standard_form() -> Model
             creates a new equivalent model in a standard form (max objective and <= / = constraints)
         is_equivalent(other: Model) -> bool
             checks whether the model is equivalent to another one (ignores variables' names, etc.), useful when writing tests
         dual() -> Model
-            creates a dual model 
+            creates a dual model straight from the (sparse or dense) constraint matrix, with a dual variable for every constraint
+            (free for the equalities, nonnegative otherwise - GE constraints are inverted first) and for every bound other than x >= 0
+            (upper bounds and then nonzero lower bounds, in the order of the variables), dual constraints are equalities for variables
+            that are not bounded by 0 from below, the dual of a minimized model gives the negated optimum
 
-        solve() -> Solution
+        solve(method: SolverMethod = SolverMethod.AUTO, pricing: PricingRule | str | None = None, algorithm: SimplexAlgorithm = SimplexAlgorithm.AUTO, start_basis: Basis | None = None, presolve: bool = False, scaling: ScalingMethod | str | None = None, iteration_limit: int | None = None, time_limit: float | None = None, collect_stats: bool = False, keep_tableaux: bool = True, strategy: SolveStrategy | str = SolveStrategy.PRIMAL) -> Solution
             solves the current model using Simplex solver and returns the result
+            method (or its name, e.g. "revised") selects the variant of the simplex algorithm (or the interior point method with the crossover, "ipm"),
+            pricing (or its name, e.g. "devex") selects the rule choosing entering variables, Dantzig rule by default
+            algorithm (or its name, e.g. "dual") selects the primal or the dual simplex
+            start_basis (e.g. solution.basis of a similar model solved before) is used to warm start the solver
+            presolve reduces the model (removing redundant rows, fixed variables, etc.) before solving it, see solution.presolve_report
+            scaling (or its name, e.g. "geometric") scales the constraint matrix before solving the model, see scaling.ScalingMethod
+            iteration_limit and time_limit (in seconds) stop the solver early, see solution.status
+            collect_stats makes the solver collect statistics (pivots, stage times, etc.), see solution.stats
+            keep_tableaux=False makes the solver return a lightweight solution, see Solution.discard_tableaux
+            strategy (or its name, e.g. "auto") selects whether the model or its dual is solved, see SolveStrategy,
+            solution found through the dual is always a lightweight one (tableaux are rebuilt by solving the model when needed,
+            unless the dual is infeasible and the model is solved right away, keep_tableaux applies then),
+            its basis is the one complementary to the optimal basis of the dual (the tableaux are rebuilt in it),
+            its stats are the ones of the dual (the dual can't be presolved or warm started),
+            its dual values and reduced costs come from the assignment of the dual (without rebuilding the tableaux)
             when called, the model should already contain at least one variable and objective
+        solve_objectives(objectives: numpy.Array, sense: ObjectiveType | str = "max", method: SolverMethod = SolverMethod.AUTO, pricing: PricingRule | str | None = None, scaling: ScalingMethod | str | None = None) -> List[Solution]
+            solves the current model (ignoring its objective) for every row of the objectives matrix and returns the lightweight solutions,
+            the first phase is performed once and each objective is optimized starting from the optimal basis of the previous one
     """
     
     def __init__(self, name):
         self.name = name
         self.variables = []
+        self.variables_by_name = dict()
         self.constraints = []
         self.objective = None
 
-    def create_variable(self, name):
-        for var in self.variables:
-            if var.name == name:
-                raise Exception(f"There is already a variable named {name}")
+    def create_variable(self, name, lower = 0.0, upper = float('inf')):
+        if name in self.variables_by_name:
+            raise Exception(f"There is already a variable named {name}")
 
         new_index = len(self.variables)
-        variable = va.Variable(name, new_index)
+        variable = va.Variable(name, new_index, lower, upper)
         self.variables.append(variable)
+        self.variables_by_name[name] = variable
         return variable 
 
+    def create_variables(self, prefix, count, lower = 0.0, upper = float('inf')):
+        names = [f"{prefix}{i}" for i in range(count)]
+        for name in names:
+            if name in self.variables_by_name:
+                raise Exception(f"There is already a variable named {name}")
+
+        first_index = len(self.variables)
+        variables = [va.Variable(name, first_index + i, lower, upper) for (i, name) in enumerate(names)]
+        self.variables += variables
+        self.variables_by_name.update(zip(names, variables))
+        return variables
+
+    def variable(self, name):
+        if name not in self.variables_by_name:
+            raise Exception(f"There is no variable named {name}")
+        return self.variables_by_name[name]
+
+    def set_variable_bounds(self, variable, lower, upper):
+        new_variable = va.Variable(variable.name, variable.index, lower, upper)
+        self.variables[variable.index] = new_variable
+        self.variables_by_name[variable.name] = new_variable
+        return new_variable
+
     def add_constraint(self, constraint):
         self.constraints.append(constraint)
+
+    def add_constraints_from_matrix(self, A, b, types = co.ConstraintType.LE):
+        rows_n = A.shape[0]
+        if A.shape[1] != len(self.variables):
+            raise Exception(f"Matrix has {A.shape[1]} columns, but there are {len(self.variables)} variables in the model")
+        if isinstance(types, (co.ConstraintType, str)):
+            types = [types] * rows_n
+        types = [co.ConstraintType.create(type) for type in types]
+
+        if sp.issparse(A):
+            # expressions are built straight from the rows, so their columns have to be sorted and unique
+            A = sp.csr_matrix(A, dtype=float, copy=True)
+            A.sum_duplicates()
+        else:
+            A = np.asarray(A, dtype=float)
+        for (i, (bound, type)) in enumerate(zip(b, types)):
+            if sp.issparse(A):
+                columns, factors = A.indices[A.indptr[i]:A.indptr[i + 1]], A.data[A.indptr[i]:A.indptr[i + 1]]
+            else:
+                columns = np.flatnonzero(A[i])
+                factors = A[i, columns]
+            self.constraints.append(co.Constraint(self._expression_from_arrays(columns, factors), float(bound), type))
+
+    def set_objective_vector(self, c, sense = ob.ObjectiveType.MAX):
+        c = np.asarray(c, dtype=float)
+        if len(c) != len(self.variables):
+            raise Exception(f"Objective vector has {len(c)} factors, but there are {len(self.variables)} variables in the model")
+        columns = np.flatnonzero(c)
+        self.objective = ob.Objective(self._expression_from_arrays(columns, c[columns]), ob.ObjectiveType.create(sense))
+
+    def _expression_from_arrays(self, columns, factors):
+        return ex.Expression.from_arrays(self.variables, columns, factors)
+
+    def to_matrix_form(self):
+        A = mx.constraint_matrix(self)
+        b = mx.rhs_vector(self)
+        types = [constraint.type for constraint in self.constraints]
+        if self.objective is None:
+            return (A, b, types, np.zeros(len(self.variables)), None)
+        return (A, b, types, mx.objective_vector(self), self.objective.type)
          
     def maximize(self, expression):
         self.objective = ob.Objective(expression, ob.ObjectiveType.MAX)
@@ -114,42 +225,53 @@ class Model:
         return True
         
     def dual(self):
-        self._check_if_creating_dual_is_possible()
+        (A, b, types, c, sense) = self.to_matrix_form()
+        if sense == ob.ObjectiveType.MIN:
+            c = -c
 
-        primal = self.translate_to_standard_form()
-        dual = Model(f"{primal.name} (dual)")
-        self._create_dual_variables(primal, dual)
-        self._create_dual_objective(primal, dual)
-        self._create_dual_constraints(primal, dual)
+        # GE rows are inverted, so the dual variables of all the inequalities are nonnegative (and the ones of the equalities are free)
+        row_signs = np.array([-1.0 if type == co.ConstraintType.GE else 1.0 for type in types])
+        free_rows = np.array([type == co.ConstraintType.EQ for type in types], dtype=bool)
+        # bounds other than x >= 0 become rows x <= upper and -x <= -lower (variables with such a lower bound are then free)
+        lower = np.array([v.lower for v in self.variables], dtype=float)
+        upper = mx.upper_bound_vector(self)
+        upper_columns = np.flatnonzero(upper < float('inf'))
+        lower_columns = np.flatnonzero((lower > float('-inf')) & (lower != 0.0))
+        if sp.issparse(A):
+            identity = sp.identity(len(self.variables), format='csr')
+            rows = sp.vstack([sp.diags(row_signs) @ A, identity[upper_columns], -identity[lower_columns]], format='csr')
+        else:
+            identity = np.identity(len(self.variables))
+            rows = np.vstack([A * row_signs[:, None], identity[upper_columns], -identity[lower_columns]])
+        rhs = np.concatenate([b * row_signs, upper[upper_columns], -lower[lower_columns]])
+        free_rows = np.concatenate([free_rows, np.zeros(len(upper_columns) + len(lower_columns), dtype=bool)])
+
+        dual = Model(f"{self.name} (dual)")
+        dual.create_variables("y", rows.shape[0])
+        for i in np.flatnonzero(free_rows):
+            dual.set_variable_bounds(dual.variables[i], float('-inf'), float('inf'))
+        # columns of the nonnegative variables give >= constraints, the ones of the free variables give equalities
+        column_types = np.where(lower == 0.0, co.ConstraintType.GE, co.ConstraintType.EQ)
+        dual.add_constraints_from_matrix(rows.T, c, column_types)
+        dual.set_objective_vector(rhs, ob.ObjectiveType.MIN)
         return dual
 
+    def snapshot(self):
+        snapshot = copy(self)
+        snapshot.variables = list(self.variables)
+        snapshot.variables_by_name = dict(self.variables_by_name)
+        snapshot.constraints = [co.Constraint(c.expression, c.bound, c.type) for c in self.constraints]
+        if self.objective is not None:
+            snapshot.objective = ob.Objective(self.objective.expression, self.objective.type, self.objective.factor)
+        return snapshot
+
     def translate_to_standard_form(self):
-        standard = deepcopy(self)
+        standard = self.snapshot()
         standard._simplify()
         standard._change_constraints_to_LE()
         standard._change_objective_to_max()
         return standard
         
-    def _check_if_creating_dual_is_possible(self):
-        for constraint in self.constraints:
-            if constraint.type == co.ConstraintType.EQ:
-                raise Exception("Model doesn't support (yet) duals for problems with equality constraints")
-
-    def _create_dual_constraints(self, primal, dual):
-        factors_matrix = np.array([c.expression.factors(primal) for c in primal.constraints])
-        dual_factors_matrix = factors_matrix.T
-        for (i, f) in enumerate(primal.objective.expression.factors(primal)):
-            e = ex.Expression.from_vectors(dual.variables, dual_factors_matrix[i])
-            dual.add_constraint(e >= f)
-
-    def _create_dual_objective(self, primal, dual):
-        dual_obj_factors = [c.bound for c in primal.constraints]
-        dual.minimize(ex.Expression.from_vectors(dual.variables, dual_obj_factors))
-
-    def _create_dual_variables(self, primal, dual):
-        for (i, _) in enumerate(primal.constraints):
-            dual.create_variable(f"y{i}")
-
     def _change_objective_to_max(self):
         if self.objective.type == ob.ObjectiveType.MIN:
             self.objective.invert()
@@ -159,20 +281,112 @@ class Model:
             if constraint.type == co.ConstraintType.GE:
                 constraint.invert()
 
-    def solve(self):
+    def solve(self, method = s.SolverMethod.AUTO, pricing = None, algorithm = s.SimplexAlgorithm.AUTO, start_basis = None, presolve = False, scaling = None, iteration_limit = None, time_limit = None, collect_stats = False, keep_tableaux = True, strategy = s.SolveStrategy.PRIMAL):
         if len(self.variables) == 0:
             raise Exception("Can't solve a model without any variables")
 
         if self.objective == None:
             raise Exception("Can't solve a model without an objective")
 
-        solver = s.Solver()
-        return solver.solve(deepcopy(self))
+        if s.SolveStrategy(strategy) == s.SolveStrategy.DUAL and (presolve or start_basis is not None):
+            raise Exception("The dual model can't be presolved or warm started")
+        if presolve or start_basis is not None:
+            strategy = s.SolveStrategy.PRIMAL
+        if s.SolveStrategy.choose(self, strategy) == s.SolveStrategy.DUAL:
+            return self._solve_dual(method, pricing, algorithm, scaling, iteration_limit, time_limit, collect_stats, keep_tableaux)
+
+        interior_point = s.SolverMethod.choose(self, method) == s.SolverMethod.IPM
+        if s.SolverMethod.choose(self, s.SolverMethod.AUTO if interior_point else method) == s.SolverMethod.REVISED:
+            solver = r.RevisedSolver(pricing, algorithm, presolve=presolve, scaling=scaling, iteration_limit=iteration_limit, time_limit=time_limit, collect_stats=collect_stats, keep_tableaux=keep_tableaux)
+        else:
+            solver = s.Solver(pricing, algorithm, presolve, scaling, iteration_limit, time_limit, collect_stats, keep_tableaux)
+        if interior_point:
+            solver = ip.InteriorPointSolver(solver)
+        return solver.solve(self.snapshot(), start_basis)
+
+    def _solve_dual(self, method, pricing, algorithm, scaling, iteration_limit, time_limit, collect_stats, keep_tableaux):
+        primal = self.snapshot()
+        # the dual values are read from the final tableaux of the dual, discarding it would only make them rebuilt,
+        # the dual solution (with its tableaux) is dropped right after anyway
+        dual_solution = primal.dual().solve(method, pricing, algorithm, scaling=scaling, iteration_limit=iteration_limit, time_limit=time_limit, collect_stats=collect_stats, keep_tableaux=True)
+        if dual_solution.status == so.SolutionStatus.INFEASIBLE:
+            # the model is then either infeasible or unbounded, only solving it tells which one
+            return primal.solve(method, pricing, algorithm, scaling=scaling, iteration_limit=iteration_limit, time_limit=time_limit, collect_stats=collect_stats, keep_tableaux=keep_tableaux)
+
+        # constraints of the dual correspond to the variables, their dual values (read from the final tableaux of the dual) are the assignment
+        if dual_solution.status == so.SolutionStatus.OPTIMAL:
+            assignment = dual_solution.dual_values().tolist()
+            basis = primal._complementary_basis(dual_solution.basis, assignment)
+            solution = so.Solution.with_assignment(primal, assignment, None, None, None, basis)
+            # and the dual values of the constraints are the assignment of the dual (GE rows were inverted, the dual of a minimized model is negated)
+            row_signs = np.array([-1.0 if constraint.type == co.ConstraintType.GE else 1.0 for constraint in primal.constraints])
+            solution.duals = np.array(dual_solution.assignment[:len(primal.constraints)]) * row_signs * primal.objective.type.value + 0.0
+        elif dual_solution.status == so.SolutionStatus.UNBOUNDED:
+            solution = so.Solution.unfeasible(primal, None, None, None)
+        else:
+            solution = so.Solution.limit_reached(primal, None, None, None, None, dual_solution.status)
+        solution.stats = dual_solution.stats
+        # the tableaux are rebuilt in the complementary basis, so they describe the recovered assignment (even if the optimum isn't unique)
+        solution.discard_tableaux(lambda: primal.solve(method, pricing, algorithm, solution.basis, scaling=scaling))
+        return solution
+
+    def _complementary_basis(self, dual_basis, assignment):
+        """
+            _complementary_basis(dual_basis: Basis, assignment: list[float]) -> Basis:
+                returns the basis of the normal model complementary to the given optimal basis of the dual model (see dual):
+                slack of a constraint is basic if the dual variable of the constraint is nonbasic, a variable is nonbasic if its dual
+                constraint isn't tight or if the dual variable of one of its bounds is basic (the variable is then at this bound)
+        """
+        # (split free dual variables "y1" and "y1-" correspond to the same constraint)
+        dual_basic = set(name.rstrip('-') for name in dual_basis.basic)
+        rows_n = len(self.constraints)
+        lower = np.array([v.lower for v in self.variables], dtype=float)
+        upper = mx.upper_bound_vector(self)
+        upper_columns = np.flatnonzero(upper < float('inf'))
+        lower_columns = np.flatnonzero((lower > float('-inf')) & (lower != 0.0))
+        at_upper = {j for (k, j) in enumerate(upper_columns) if f"y{rows_n + k}" in dual_basic}
+        at_lower = {j for (k, j) in enumerate(lower_columns) if f"y{rows_n + len(upper_columns) + k}" in dual_basic}
+
+        basic = [f"s{i}" for (i, constraint) in enumerate(self.constraints) if constraint.type != co.ConstraintType.EQ and f"y{i}" not in dual_basic]
+        nonbasic_at_upper = []
+        for (j, var) in enumerate(self.variables):
+            # dual constraints of the variables bounded by 0 from below have slacks "s{j}", the other ones are equalities
+            if (var.lower == 0.0 and f"s{j}" in dual_basic) or j in at_lower:
+                continue
+            if var.lower == float('-inf') and var.upper == float('inf'):
+                # free variables are split into the positive and the negative part
+                basic.append(var.name if assignment[j] >= 0.0 else f"{var.name}-")
+            elif j in at_upper:
+                # variables bounded only from above are substituted by upper - var, which is then at zero
+                if var.lower > float('-inf'):
+                    nonbasic_at_upper.append(var.name)
+            else:
+                basic.append(var.name)
+        return b.Basis(basic, nonbasic_at_upper)
+
+    def solve_objectives(self, objectives, sense = ob.ObjectiveType.MAX, method = s.SolverMethod.AUTO, pricing = None, scaling = None):
+        if len(self.variables) == 0:
+            raise Exception("Can't solve a model without any variables")
+
+        if s.SolverMethod.choose(self, method) == s.SolverMethod.REVISED:
+            solver = r.RevisedSolver(pricing, scaling=scaling, keep_tableaux=False)
+        else:
+            solver = s.Solver(pricing, scaling=scaling, keep_tableaux=False)
+        return solver.solve_objectives(self.snapshot(), objectives, sense)
+
+    def _variable_domain(self, variable):
+        if variable.has_default_bounds():
+            return f"{variable.name} >= 0"
+        lower = "" if variable.lower == float('-inf') else f"{variable.lower} <= "
+        upper = "" if variable.upper == float('inf') else f" <= {variable.upper}"
+        if lower == "" and upper == "":
+            return f"{variable.name} free"
+        return f"{lower}{variable.name}{upper}"
 
     def __str__(self):
         separator = '\n\t'
         text = f'''- name: {self.name}
-- variables:{separator}{separator.join([f"{v.name} >= 0" for v in self.variables])}
+- variables:{separator}{separator.join([self._variable_domain(v) for v in self.variables])}
 - constraints:{separator}{separator.join([str(c) for c in self.constraints])}
 - objective:{separator}{self.objective}
 '''
@@ -0,0 +1,288 @@
+import numpy as np
+import scipy.sparse as sp
+from dataclasses import dataclass
+
+from . import model as m
+from . import matrix as mx
+from . import solution as so
+from . import tableaux as t
+from .expressions import constraint as co
+
+# reductions are repeated until they stop changing the model, but no more times than this
+MAX_PASSES = 20
+
+# bounds implied by the rows are applied only if they are tighter by more than this (relative) amount,
+# otherwise the bounds could be tightened over and over by tiny amounts
+BOUND_TIGHTENING_THRESHOLD = 1e-6
+
+
+@dataclass
+class PresolveReport:
+    """
+        A class to represent how much the presolve reduced a model.
+
+        Attributes
+        ----------
+        rows_removed : int
+            number of the removed constraints (empty, duplicated, singleton and redundant ones)
+        columns_removed : int
+            number of the removed (fixed) variables
+        bounds_tightened : int
+            number of the variable bounds tightened using the rows activity
+    """
+    rows_removed: int = 0
+    columns_removed: int = 0
+    bounds_tightened: int = 0
+
+
+class PresolvedModel:
+    """
+        A class to represent a result of the presolve: a reduced model and data needed to map its solution back onto the original model.
+
+        Attributes
+        ----------
+        model : Model
+            the original model
+        reduced_model : Model | None
+            the reduced model (with the same variable names), None if the presolve found the model infeasible
+        is_feasible : bool
+            whether the model may be feasible (False if the presolve proved it is infeasible)
+        columns : numpy.Array
+            indexes of the original variables kept in the reduced model (in the order of the reduced model variables)
+        values : numpy.Array
+            values of the removed (fixed) variables, indexed by the original variables
+        report : PresolveReport
+            numbers of the removed rows and columns
+
+        Methods
+        -------
+        postsolve(solution: Solution | None) -> Solution:
+            maps the solution of the reduced model onto the original model,
+            None is accepted when there is nothing to solve (the model is infeasible or all the variables are fixed)
+    """
+
+    def __init__(self, model, reduced_model, is_feasible, columns, values, report):
+        self.model = model
+        self.reduced_model = reduced_model
+        self.is_feasible = is_feasible
+        self.columns = columns
+        self.values = values
+        self.report = report
+
+    def postsolve(self, solution):
+        if not self.is_feasible:
+            result = so.Solution.unfeasible(self.model, None, None, None)
+        elif solution is None:
+            result = so.Solution.with_assignment(self.model, self.values.tolist(), None, None, None)
+        else:
+            assignment = None
+            if solution.assignment is not None:
+                values = self.values.copy()
+                values[self.columns] = solution.assignment
+                assignment = values.tolist()
+            result = so.Solution(self.model, assignment, solution.initial_tableaux, solution.tableaux, solution.normal_model, solution.is_feasible, solution.is_bounded, solution.basis, solution.status)
+        result.presolve_report = self.report
+        return result
+
+
+class Presolver:
+    """
+        A class to represent the LP presolve, i.e. reductions making the model smaller before the simplex starts.
+        Rows are handled as ranges (row_lower <= A[i] * x <= row_upper), so all the constraint types are reduced in the same way:
+        - empty rows are dropped (or prove infeasibility),
+        - duplicated (proportional) rows are merged into one,
+        - singleton rows become bounds of their variables,
+        - fixed variables (lower == upper) are substituted into the rows and removed,
+        - bounds of the variables are tightened using the minimal and maximal activities of the rows,
+          rows that can't be violated within the bounds are dropped
+        The reductions are repeated until they stop changing the model (at most MAX_PASSES times).
+
+        Methods
+        -------
+        presolve(model: Model) -> PresolvedModel:
+            returns the reduced model along with the data to map its solution back
+    """
+
+    def presolve(self, model):
+        self.model = model
+        self.matrix = sp.csr_matrix(mx.constraint_matrix(model, sparse=True))
+        self.matrix.sort_indices()
+        self.entry_rows = np.repeat(np.arange(self.matrix.shape[0]), np.diff(self.matrix.indptr))
+        rhs = mx.rhs_vector(model)
+        types = np.array([c.type.value for c in model.constraints], dtype=int)
+        self.row_lower = np.where(types >= co.ConstraintType.EQ.value, rhs, -np.inf)
+        self.row_upper = np.where(types <= co.ConstraintType.EQ.value, rhs, np.inf)
+        self.lower = np.array([v.lower for v in model.variables], dtype=float)
+        self.upper = mx.upper_bound_vector(model)
+        self.rows = np.ones(self.matrix.shape[0], dtype=bool)
+        self.columns = np.ones(self.matrix.shape[1], dtype=bool)
+        self.values = np.zeros(self.matrix.shape[1])
+        self.report = PresolveReport()
+        self.is_feasible = True
+
+        self._merge_duplicate_rows()
+        if not self.is_feasible:
+            return PresolvedModel(model, None, False, np.flatnonzero(self.columns), self.values, self.report)
+        reductions = [self._remove_empty_rows, self._remove_singleton_rows, self._remove_fixed_columns, self._tighten_bounds]
+        for _ in range(MAX_PASSES):
+            changed = False
+            for reduction in reductions:
+                changed = reduction() or changed
+                if not self.is_feasible:
+                    return PresolvedModel(model, None, False, np.flatnonzero(self.columns), self.values, self.report)
+            if not changed:
+                break
+        return PresolvedModel(model, self._reduced_model(), True, np.flatnonzero(self.columns), self.values, self.report)
+
+    def _active_entries(self):
+        active = self.rows[self.entry_rows] & self.columns[self.matrix.indices]
+        return self.entry_rows[active], self.matrix.indices[active], self.matrix.data[active]
+
+    def _remove_rows(self, rows):
+        self.rows[rows] = False
+        self.report.rows_removed += int(np.count_nonzero(rows))
+
+    def _merge_duplicate_rows(self):
+        # rows are scaled so their first factor is 1, rows with the same (scaled) factors differ only in their ranges
+        kept_rows = dict()
+        duplicates = np.zeros(len(self.rows), dtype=bool)
+        for row in range(len(self.rows)):
+            start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+            if start == end:
+                continue
+            scale = self.matrix.data[start]
+            key = (self.matrix.indices[start:end].tobytes(), np.round(self.matrix.data[start:end] / scale, 12).tobytes())
+            lower, upper = sorted([self.row_lower[row] / scale, self.row_upper[row] / scale])
+            if key not in kept_rows:
+                kept_rows[key] = row
+                continue
+            kept = kept_rows[key]
+            kept_scale = self.matrix.data[self.matrix.indptr[kept]]
+            kept_lower, kept_upper = sorted([self.row_lower[kept] / kept_scale, self.row_upper[kept] / kept_scale])
+            lower, upper = max(lower, kept_lower), min(upper, kept_upper)
+            if lower > upper + t.eps:
+                self.is_feasible = False
+            self.row_lower[kept], self.row_upper[kept] = sorted([lower * kept_scale, upper * kept_scale])
+            duplicates[row] = True
+        self._remove_rows(duplicates)
+
+    def _remove_empty_rows(self):
+        rows, _, _ = self._active_entries()
+        empty = self.rows & (np.bincount(rows, minlength=len(self.rows)) == 0)
+        if np.any(self.row_lower[empty] > t.eps) or np.any(self.row_upper[empty] < -t.eps):
+            self.is_feasible = False
+        self._remove_rows(empty)
+        return bool(np.any(empty))
+
+    def _remove_singleton_rows(self):
+        rows, cols, factors = self._active_entries()
+        counts = np.bincount(rows, minlength=len(self.rows))
+        singleton = counts[rows] == 1
+        rows, cols, factors = rows[singleton], cols[singleton], factors[singleton]
+        if len(rows) == 0:
+            return False
+        np.maximum.at(self.lower, cols, np.where(factors > 0, self.row_lower[rows], self.row_upper[rows]) / factors)
+        np.minimum.at(self.upper, cols, np.where(factors > 0, self.row_upper[rows], self.row_lower[rows]) / factors)
+        self._remove_rows(counts == 1)
+        self._check_bounds()
+        return True
+
+    def _remove_fixed_columns(self):
+        fixed = self.columns & np.isfinite(self.lower) & (self.upper - self.lower <= t.eps)
+        if not np.any(fixed):
+            return False
+        self.values[fixed] = self.lower[fixed]
+        rows, cols, factors = self._active_entries()
+        in_fixed = fixed[cols]
+        shift = np.bincount(rows[in_fixed], weights=factors[in_fixed] * self.values[cols[in_fixed]], minlength=len(self.rows))
+        self.row_lower -= shift
+        self.row_upper -= shift
+        self.columns[fixed] = False
+        self.report.columns_removed += int(np.count_nonzero(fixed))
+        return True
+
+    def _tighten_bounds(self):
+        rows, cols, factors = self._active_entries()
+        if len(rows) == 0:
+            return False
+        rows_n = len(self.rows)
+        lower, upper = self.lower[cols], self.upper[cols]
+        min_contributions = np.where(factors > 0, factors * lower, factors * upper)
+        max_contributions = np.where(factors > 0, factors * upper, factors * lower)
+        min_infinite = np.isinf(min_contributions)
+        max_infinite = np.isinf(max_contributions)
+        min_sum = np.bincount(rows, weights=np.where(min_infinite, 0.0, min_contributions), minlength=rows_n)
+        max_sum = np.bincount(rows, weights=np.where(max_infinite, 0.0, max_contributions), minlength=rows_n)
+        min_infinite_n = np.bincount(rows, weights=min_infinite, minlength=rows_n)
+        max_infinite_n = np.bincount(rows, weights=max_infinite, minlength=rows_n)
+        min_activity = np.where(min_infinite_n > 0, -np.inf, min_sum)
+        max_activity = np.where(max_infinite_n > 0, np.inf, max_sum)
+
+        if np.any(self.rows & ((min_activity > self.row_upper + t.eps) | (max_activity < self.row_lower - t.eps))):
+            self.is_feasible = False
+            return False
+
+        # sides of the rows that can't be violated within the bounds are dropped, rows without any side are removed
+        self.row_upper = np.where(self.rows & (max_activity <= self.row_upper), np.inf, self.row_upper)
+        self.row_lower = np.where(self.rows & (min_activity >= self.row_lower), -np.inf, self.row_lower)
+        redundant = self.rows & np.isinf(self.row_lower) & np.isinf(self.row_upper)
+        self._remove_rows(redundant)
+
+        # activity of the row without the given entry (infinite if any other variable is unbounded)
+        remaining = self.rows[rows]
+        rows, cols, factors = rows[remaining], cols[remaining], factors[remaining]
+        min_contributions, min_infinite = min_contributions[remaining], min_infinite[remaining]
+        max_contributions, max_infinite = max_contributions[remaining], max_infinite[remaining]
+        with np.errstate(invalid='ignore'):
+            min_residual = np.where(min_infinite_n[rows] == 0, min_sum[rows] - min_contributions,
+                                    np.where((min_infinite_n[rows] == 1) & min_infinite, min_sum[rows], -np.inf))
+            max_residual = np.where(max_infinite_n[rows] == 0, max_sum[rows] - max_contributions,
+                                    np.where((max_infinite_n[rows] == 1) & max_infinite, max_sum[rows], np.inf))
+            from_upper = (self.row_upper[rows] - min_residual) / factors
+            from_lower = (self.row_lower[rows] - max_residual) / factors
+        implied_upper = np.full(len(self.columns), np.inf)
+        implied_lower = np.full(len(self.columns), -np.inf)
+        np.minimum.at(implied_upper, cols, np.where(factors > 0, from_upper, from_lower))
+        np.maximum.at(implied_lower, cols, np.where(factors > 0, from_lower, from_upper))
+
+        with np.errstate(invalid='ignore'):
+            tightened_upper = self.columns & (implied_upper < self.upper - BOUND_TIGHTENING_THRESHOLD * (1.0 + np.abs(implied_upper)))
+            tightened_lower = self.columns & (implied_lower > self.lower + BOUND_TIGHTENING_THRESHOLD * (1.0 + np.abs(implied_lower)))
+        self.upper[tightened_upper] = implied_upper[tightened_upper]
+        self.lower[tightened_lower] = implied_lower[tightened_lower]
+        self.report.bounds_tightened += int(np.count_nonzero(tightened_upper) + np.count_nonzero(tightened_lower))
+        self._check_bounds()
+        return bool(np.any(redundant) or np.any(tightened_upper) or np.any(tightened_lower))
+
+    def _check_bounds(self):
+        crossed = self.columns & (self.lower > self.upper)
+        if np.any(self.lower[crossed] > self.upper[crossed] + t.eps):
+            self.is_feasible = False
+        # bounds crossed only by the rounding errors fix the variable
+        self.upper[crossed] = self.lower[crossed]
+
+    def _reduced_model(self):
+        reduced = m.Model(self.model.name)
+        columns = np.flatnonzero(self.columns)
+        for col in columns:
+            reduced.create_variable(self.model.variables[col].name, self.lower[col], self.upper[col])
+
+        # ranged rows (bounded from both sides) are split into two inequalities
+        constraints = []
+        for row in np.flatnonzero(self.rows):
+            (lower, upper) = (self.row_lower[row], self.row_upper[row])
+            if lower == upper:
+                constraints.append((row, upper, co.ConstraintType.EQ))
+                continue
+            if upper < np.inf:
+                constraints.append((row, upper, co.ConstraintType.LE))
+            if lower > -np.inf:
+                constraints.append((row, lower, co.ConstraintType.GE))
+        rows = [row for (row, _, _) in constraints]
+        bounds = [bound for (_, bound, _) in constraints]
+        types = [type for (_, _, type) in constraints]
+        reduced.add_constraints_from_matrix(self.matrix[rows][:, columns], bounds, types)
+
+        objective = mx.objective_vector(self.model)[columns]
+        reduced.set_objective_vector(objective, self.model.objective.type)
+        return reduced
@@ -0,0 +1,182 @@
+import numpy as np
+from . import tableaux as t
+
+
+class PricingRule:
+    """
+        A base class of the pricing rules, i.e. strategies choosing the variable entering the basis.
+        Pricing rules work with any tableaux-like object providing:
+        cost_factors(), column(col), row(row), project(vector), squared_column_norms(), basis,
+        choose_leaving_variable(col) and quotients(col), e.g. Tableaux or RevisedTableaux.
+
+        Attributes
+        ----------
+        name : str
+            name of the rule
+
+        Methods
+        -------
+        reset(tableaux: Tableaux):
+            prepares the rule for the optimization starting from the given tableaux
+        choose_entering_variable(tableaux: Tableaux) -> int | None:
+            returns index of the variable that should enter the basis, None if the tableaux is optimal
+        choose_leaving_variable(tableaux: Tableaux, col: int) -> int:
+            returns index of the row, that should leave the basis (by default the tableaux ratio test is used)
+        update(tableaux: Tableaux, row: int, col: int):
+            updates the rule state, it's called just before the pivot on the given row and column
+        create(rule: PricingRule | str | None) -> PricingRule:
+            returns the given rule, a new rule with the given name or the Dantzig rule if rule is None
+    """
+
+    name = None
+
+    def reset(self, tableaux):
+        pass
+
+    def choose_entering_variable(self, tableaux):
+        raise Exception("abstract pricing rule shouldn't be called!")
+
+    def choose_leaving_variable(self, tableaux, col):
+        return tableaux.choose_leaving_variable(col)
+
+    def update(self, tableaux, row, col):
+        pass
+
+    @staticmethod
+    def create(rule = None):
+        if rule is None:
+            return DantzigRule()
+        if isinstance(rule, PricingRule):
+            return rule
+        rules = {r.name: r for r in [DantzigRule, BlandRule, PartialPricingRule, DevexRule, SteepestEdgeRule]}
+        if rule not in rules:
+            raise Exception(f"There is no pricing rule named {rule}, available rules: {', '.join(rules.keys())}")
+        return rules[rule]()
+
+
+class DantzigRule(PricingRule):
+    """
+        Chooses the variable with the most negative factor in the cost row.
+    """
+
+    name = "dantzig"
+
+    def choose_entering_variable(self, tableaux):
+        cost_factors = tableaux.cost_factors()
+        col = cost_factors.argmin()
+        return None if cost_factors[col] >= -t.eps else col
+
+
+class BlandRule(PricingRule):
+    """
+        Bland's anti-cycling rule: chooses the improving variable with the smallest index
+        and, in case of ties in the ratio test, the leaving variable with the smallest index.
+    """
+
+    name = "bland"
+
+    def choose_entering_variable(self, tableaux):
+        improving = np.flatnonzero(tableaux.cost_factors() < -t.eps)
+        return None if len(improving) == 0 else improving[0]
+
+    def choose_leaving_variable(self, tableaux, col):
+        quotients = tableaux.quotients(col)
+        ties = np.flatnonzero(quotients <= quotients.min() + t.eps)
+        return ties[np.argmin(tableaux.basis[ties])] + 1
+
+
+class PartialPricingRule(PricingRule):
+    """
+        Partial pricing for wide models: cost factors are scanned in segments (cyclically, starting after the last chosen segment)
+        and the most negative factor of the first segment containing any improving variable is chosen.
+
+        Attributes
+        ----------
+        segments : int
+            number of segments the variables are divided into
+    """
+
+    name = "partial"
+
+    def __init__(self, segments = 8):
+        self.segments = segments
+        self.next_segment = 0
+
+    def reset(self, tableaux):
+        self.next_segment = 0
+
+    def choose_entering_variable(self, tableaux):
+        cost_factors = tableaux.cost_factors()
+        bounds = np.linspace(0, len(cost_factors), self.segments + 1).astype(int)
+        for k in range(self.segments):
+            segment = (self.next_segment + k) % self.segments
+            start, end = bounds[segment], bounds[segment + 1]
+            if start == end:
+                continue
+            col = start + cost_factors[start:end].argmin()
+            if cost_factors[col] < -t.eps:
+                self.next_segment = (segment + 1) % self.segments
+                return col
+        return None
+
+
+class DevexRule(PricingRule):
+    """
+        Devex pricing: chooses the variable maximizing cost_factor^2 / weight,
+        where weights approximate the steepest-edge norms in a reference framework (initially all equal 1).
+    """
+
+    name = "devex"
+
+    def reset(self, tableaux):
+        self.weights = np.ones(len(tableaux.cost_factors()))
+
+    def choose_entering_variable(self, tableaux):
+        cost_factors = tableaux.cost_factors()
+        scores = np.where(cost_factors < -t.eps, cost_factors ** 2 / self.weights, -1.0)
+        col = scores.argmax()
+        return None if scores[col] < 0 else col
+
+    def update(self, tableaux, row, col):
+        pivot_row = tableaux.row(row)
+        pivot = pivot_row[col]
+        leaving = tableaux.basis[row - 1]
+        entering_weight = self.weights[col]
+        ratios = pivot_row / pivot
+        self.weights = np.maximum(self.weights, ratios ** 2 * entering_weight)
+        if leaving >= 0:
+            self.weights[leaving] = max(entering_weight / pivot ** 2, 1.0)
+        self.weights[col] = 1.0
+
+
+class SteepestEdgeRule(PricingRule):
+    """
+        Steepest-edge pricing: chooses the variable maximizing cost_factor^2 / (1 + ||column||^2),
+        the norms are computed once per optimization and then updated with the Goldfarb-Reid recurrences.
+    """
+
+    name = "steepest_edge"
+
+    def reset(self, tableaux):
+        self.weights = 1.0 + tableaux.squared_column_norms()
+
+    def choose_entering_variable(self, tableaux):
+        cost_factors = tableaux.cost_factors()
+        scores = np.where(cost_factors < -t.eps, cost_factors ** 2 / self.weights, -1.0)
+        col = scores.argmax()
+        return None if scores[col] < 0 else col
+
+    def update(self, tableaux, row, col):
+        pivot_row = tableaux.row(row)
+        pivot_column = tableaux.column(col)
+        pivot = pivot_row[col]
+        leaving = tableaux.basis[row - 1]
+        entering_weight = self.weights[col]
+
+        ratios = pivot_row / pivot
+        products = tableaux.project(pivot_column)
+        weights = self.weights - 2.0 * ratios * products + ratios ** 2 * entering_weight
+        self.weights = np.maximum(weights, 1.0 + ratios ** 2)
+        if leaving >= 0:
+            self.weights[leaving] = max(entering_weight / pivot ** 2, 1.0)
+        self.weights[col] = 1.0
@@ -0,0 +1,468 @@
+import numpy as np
+import scipy.linalg as la
+import scipy.sparse as sp
+import scipy.sparse.linalg as spla
+
+from . import solver as s
+from . import solution as so
+from . import tableaux as t
+from . import matrix as mx
+
+
+class BasisFactorization:
+    """
+        A class to represent the inverse of a simplex basis in the product form, i.e. B^-1 = E_k * ... * E_1 * (LU)^-1,
+        where LU is a factorization of the basis computed during the last refactorization
+        and E_i are eta matrices corresponding to the pivots performed since then.
+        Sparse basis matrices are factorized with the sparse LU (SuperLU), dense ones with LAPACK.
+
+        Attributes
+        ----------
+        refactorization_period : int
+            maximal number of eta matrices stored before the basis gets factorized again
+        etas : list[(int, numpy.Array)]
+            list of eta matrices stored as pairs (pivot row, entering column expressed in the current basis)
+
+        Methods
+        -------
+        __init__(basis_matrix: numpy.Array, refactorization_period: int) -> BasisFactorization:
+            factorizes the given basis matrix
+        refactorize(basis_matrix: numpy.Array):
+            computes a new LU factorization of the given basis and drops all the eta matrices
+        needs_refactorization() -> bool:
+            checks whether the eta file got too long
+        ftran(vector: numpy.Array) -> numpy.Array:
+            returns B^-1 * vector (vector can be a matrix, then every column is transformed)
+        btran(vector: numpy.Array) -> numpy.Array:
+            returns vector^T * B^-1
+        update(row: int, column: numpy.Array):
+            appends an eta matrix corresponding to the pivot on the given row, column has to be already transformed by ftran
+    """
+
+    def __init__(self, basis_matrix, refactorization_period = 50):
+        self.refactorization_period = refactorization_period
+        self.refactorize(basis_matrix)
+
+    def refactorize(self, basis_matrix):
+        if basis_matrix.shape[0] == 0:
+            # models without constraints have an empty basis, there is nothing to factorize
+            self.lu = None
+        elif sp.issparse(basis_matrix):
+            self.lu = spla.splu(sp.csc_matrix(basis_matrix))
+        else:
+            self.lu = la.lu_factor(basis_matrix)
+        self.etas = []
+
+    def _solve(self, vector, transposed = False):
+        if self.lu is None:
+            return vector
+        if isinstance(self.lu, spla.SuperLU):
+            return self.lu.solve(vector, trans='T' if transposed else 'N')
+        return la.lu_solve(self.lu, vector, trans=1 if transposed else 0)
+
+    def needs_refactorization(self):
+        return len(self.etas) >= self.refactorization_period
+
+    def ftran(self, vector):
+        result = self._solve(np.array(vector, dtype=float))
+        for (row, column) in self.etas:
+            pivot_value = result[row] / column[row]
+            result -= np.multiply.outer(column, pivot_value)
+            result[row] = pivot_value
+        return result
+
+    def btran(self, vector):
+        result = np.array(vector, dtype=float)
+        for (row, column) in reversed(self.etas):
+            pivot_value = result[row]
+            result[row] = 0.0
+            result[row] = (pivot_value - result @ column) / column[row]
+        return self._solve(result, transposed=True)
+
+    def update(self, row, column):
+        self.etas.append((row, column))
+
+
+class RevisedTableaux:
+    """
+        A class to represent the state of the revised simplex, exposing the same interface as the Tableaux
+        (cost_factors, column, row, pivot, etc.) without storing the tableaux itself.
+        Rows are indexed like in the Tableaux, i.e. row 0 is the cost row and row i + 1 corresponds to the constraint i.
+
+        Attributes
+        ----------
+        model : Model
+            normal model corresponding to the tableaux
+        matrix : numpy.Array | scipy.sparse.csc_matrix
+            constraint matrix extended with the artificial columns (after the model variables),
+            columns of the complemented variables are negated
+        rhs : numpy.Array
+            right-hand sides of the constraints (shifted by the complemented variables)
+        upper : numpy.Array
+            upper bounds of the columns (inf if the column is bounded only from below by 0)
+        complemented : numpy.Array
+            mask of the columns replaced by their complements (upper - var), see Tableaux
+        costs : numpy.Array
+            objective factors (of the maximized objective) currently being optimized, negated for the complemented columns
+        eligible : numpy.Array
+            mask of the columns that are allowed to enter the basis
+        basis : numpy.Array
+            indexes of the basic columns
+        values : numpy.Array
+            values of the basic variables
+        factorization : BasisFactorization
+            factorized inverse of the basis
+
+        Methods
+        -------
+        __init__(model: Model, matrix: array, rhs: array, basis: array, upper: array, refactorization_period: int) -> RevisedTableaux:
+            constructs the revised tableaux starting in the given basis
+        set_costs(costs: numpy.Array, eligible: numpy.Array):
+            changes the objective (given for the original, not complemented columns) and the columns that can enter the basis
+        cost_factors() -> numpy.Array:
+            returns reduced costs of all the columns (with the sign used in the cost row of the Tableaux)
+        cost() -> float:
+            returns the objective value in the current basis
+        column(col: int) -> numpy.Array:
+            returns the given column expressed in the current basis (B^-1 * a_col)
+        row(row: int) -> numpy.Array:
+            returns the given row of B^-1 * A
+        project(vector: numpy.Array) -> numpy.Array:
+            returns dot products of the given vector with every column of B^-1 * A
+        squared_column_norms() -> numpy.Array:
+            returns squared norms of all the columns of B^-1 * A (expensive, it transforms the whole matrix)
+        is_unbounded(col: int) -> bool:
+            checks whether the problem is unbounded in the direction of the given column
+        quotients(col: int) -> numpy.Array:
+            returns ratios used in the bounded ratio test for the given column
+        flips_bound(col: int) -> bool:
+            checks whether the entering variable reaches its own upper bound before any basic variable reaches its bound
+        flip_bound(col: int):
+            moves the nonbasic variable to the opposite bound by complementing it
+        choose_leaving_variable(col: int) -> int:
+            finds index of the row, that should leave the basis next
+        pivot(row: int, col: int):
+            replaces the basic variable of the given row with the given column
+        leaves_at_upper(row: int, col: int) -> bool:
+            checks whether the basic variable of the row leaves at its upper bound when the given column enters (primal simplex)
+        basic_values() -> numpy.Array:
+            returns values of the basic variables
+        basic_upper() -> numpy.Array:
+            returns upper bounds of the basic variables
+        complement_basic(row: int):
+            replaces the basic variable of the given row with its complement (upper - var)
+        refactorize():
+            factorizes the current basis from scratch and recomputes values of the basic variables
+        extract_assignment() -> list[float]:
+            returns assignment of all the columns (including the artificial ones)
+        to_tableaux(columns_n: int) -> Tableaux | None:
+            materializes the Tableaux for the first columns_n columns, None if it would be too big
+    """
+
+    def __init__(self, model, matrix, rhs, basis, upper, refactorization_period = 50):
+        self.model = model
+        self.matrix = matrix
+        self.rhs = rhs
+        self.basis = np.array(basis, dtype=int)
+        self.upper = upper
+        self.complemented = np.zeros(matrix.shape[1], dtype=bool)
+        self.costs = np.zeros(matrix.shape[1])
+        self.eligible = np.ones(matrix.shape[1], dtype=bool)
+        self.factorization = BasisFactorization(self._basis_matrix(), refactorization_period)
+        self.values = self.factorization.ftran(self.rhs)
+        self._invalidate()
+
+    def _basis_matrix(self):
+        return self.matrix[:, self.basis]
+
+    def _invalidate(self):
+        self._cost_factors = None
+        self._column = (None, None)
+
+    def set_costs(self, costs, eligible):
+        self.costs = np.where(self.complemented, -costs, costs)
+        self.eligible = eligible
+        self._invalidate()
+
+    def _reduced_costs(self):
+        duals = self.factorization.btran(self.costs[self.basis])
+        return self.costs - self.matrix.T @ duals
+
+    def cost_factors(self):
+        if self._cost_factors is None:
+            cost_factors = -self._reduced_costs()
+            cost_factors[~self.eligible] = 0.0
+            cost_factors[self.basis] = 0.0
+            self._cost_factors = cost_factors
+        return self._cost_factors
+
+    def cost(self):
+        # complemented columns (upper - var) contribute also with a constant
+        return self.costs[self.basis] @ self.values - self.costs[self.complemented] @ self.upper[self.complemented]
+
+    def column(self, col):
+        if self._column[0] != col:
+            self._column = (col, self.factorization.ftran(mx.column(self.matrix, col)))
+        return self._column[1]
+
+    def row(self, row):
+        unit = np.zeros(len(self.basis))
+        unit[row - 1] = 1.0
+        return self.project(unit)
+
+    def project(self, vector):
+        return self.matrix.T @ self.factorization.btran(vector)
+
+    def squared_column_norms(self):
+        return (self._transformed_matrix(self.matrix.shape[1]) ** 2).sum(axis=0)
+
+    def _transformed_matrix(self, columns_n):
+        matrix = self.matrix[:, :columns_n]
+        return self.factorization.ftran(matrix.toarray() if sp.issparse(matrix) else matrix)
+
+    def is_unbounded(self, col):
+        return self.upper[col] == np.inf and np.isinf(self.quotients(col)).all()
+
+    def quotients(self, col):
+        column = self.column(col)
+        basic_upper = self.basic_upper()
+        quotients = np.full(len(column), np.inf)
+        decreasing = column > t.eps
+        quotients[decreasing] = self.values[decreasing] / column[decreasing]
+        increasing = (column < -t.eps) & (basic_upper < np.inf)
+        quotients[increasing] = (basic_upper[increasing] - self.values[increasing]) / -column[increasing]
+        return quotients
+
+    def flips_bound(self, col):
+        return self.upper[col] <= self.quotients(col).min(initial=np.inf)
+
+    def flip_bound(self, col):
+        self.values -= self.upper[col] * self.column(col)
+        self._complement_column(col)
+        self._invalidate()
+
+    def choose_leaving_variable(self, col):
+        quotients = self.quotients(col)
+        return len(quotients) - np.argmin(quotients[::-1])
+
+    def leaves_at_upper(self, row, col):
+        return self.column(col)[row - 1] < 0 and self.upper[self.basis[row - 1]] < np.inf
+
+    def basic_values(self):
+        return self.values
+
+    def basic_upper(self):
+        return self.upper[self.basis]
+
+    def complement_basic(self, row):
+        row = row - 1
+        col = self.basis[row]
+        self._complement_column(col)
+        # the basis column got negated, in the current basis it's just -e_row
+        unit = np.zeros(len(self.basis))
+        unit[row] = -1.0
+        self.factorization.update(row, unit)
+        self.values[row] = self.upper[col] - self.values[row]
+        self._invalidate()
+        if self.factorization.needs_refactorization():
+            self.refactorize()
+
+    def _complement_column(self, col):
+        self.rhs = self.rhs - self.upper[col] * mx.column(self.matrix, col)
+        if sp.issparse(self.matrix):
+            self.matrix.data[self.matrix.indptr[col]:self.matrix.indptr[col + 1]] *= -1.0
+        else:
+            self.matrix[:, col] *= -1.0
+        self.costs[col] = -self.costs[col]
+        self.complemented[col] = ~self.complemented[col]
+
+    def pivot(self, row, col):
+        column = self.column(col)
+        row = row - 1
+        step = self.values[row] / column[row]
+        self.values -= step * column
+        self.values[row] = step
+        self.basis[row] = col
+        self.factorization.update(row, column)
+        self._invalidate()
+        if self.factorization.needs_refactorization():
+            self.refactorize()
+
+    def refactorize(self):
+        self.factorization.refactorize(self._basis_matrix())
+        self.values = self.factorization.ftran(self.rhs)
+        self._invalidate()
+
+    def extract_assignment(self):
+        assignment = np.zeros(self.matrix.shape[1])
+        assignment[self.basis] = self.values
+        assignment[self.complemented] = self.upper[self.complemented] - assignment[self.complemented]
+        return assignment.tolist()
+
+    def to_tableaux(self, columns_n):
+        self.refactorize()
+        if (len(self.basis) + 1) * (columns_n + 1) > mx.DENSE_TABLEAUX_LIMIT:
+            return None
+
+        table = np.zeros((len(self.basis) + 1, columns_n + 1))
+        table[0, :-1] = -self._reduced_costs()[:columns_n]
+        table[0, -1] = self.cost()
+        table[1:, :-1] = self._transformed_matrix(columns_n)
+        table[1:, -1] = self.values
+
+        # columns that are not materialized (artificial ones) left in the basis mark redundant rows
+        basis = np.where(self.basis < columns_n, self.basis, -1)
+        for (row, col) in enumerate(basis):
+            if col >= 0:
+                table[:, col] = 0.0
+                table[row + 1, col] = 1.0
+        return t.Tableaux(self.model, table, basis, self.upper[:columns_n], self.complemented[:columns_n])
+
+
+class RevisedSolver(s.Solver):
+    """
+        A class to represent a revised simplex solver.
+        Instead of the whole tableaux it keeps only the constraint matrix and a factorization of the current basis (see RevisedTableaux),
+        columns are priced and transformed only when they are needed.
+        The constraint matrix is stored as a sparse (CSC) matrix when the model density is below matrix.DENSITY_THRESHOLD.
+        The result is the same Solution object as returned by the tableaux solver,
+        tableaux stored in the solution are computed once, after the optimization,
+        unless they would be bigger than matrix.DENSE_TABLEAUX_LIMIT cells (then they are None).
+
+        Attributes
+        ----------
+        refactorization_period : int
+            how many pivots can be performed before the basis gets factorized from scratch
+
+        Methods
+        -------
+        __init__(pricing: PricingRule | str | None = None, algorithm: SimplexAlgorithm | str | None = None, refactorization_period: int = 50, presolve: bool = False, scaling: ScalingMethod | str | None = None, iteration_limit: int | None = None, time_limit: float | None = None, collect_stats: bool = False, keep_tableaux: bool = True) -> RevisedSolver:
+            constructs a solver using the given pricing rule, simplex algorithm and refactorization period (optionally presolving and scaling
+            the models, limiting the number of iterations and the solving time, collecting the statistics and returning lightweight solutions)
+        solve(model: Model, start_basis: Basis | None = None) -> Solution:
+            solves the given model (starting from the given basis, if any) and return the first solution
+    """
+
+    def __init__(self, pricing = None, algorithm = None, refactorization_period = 50, presolve = False, scaling = None, iteration_limit = None, time_limit = None, collect_stats = False, keep_tableaux = True):
+        super().__init__(pricing, algorithm, presolve, scaling, iteration_limit, time_limit, collect_stats, keep_tableaux)
+        self.refactorization_period = refactorization_period
+
+    def _rebuild_solver(self):
+        return RevisedSolver(self.pricing, self.algorithm, self.refactorization_period, self.presolve, self.scaling)
+
+    def _solve(self, model, start_basis = None):
+        self._stage("normalize")
+        standard_model = self._standard_model(model)
+        if start_basis is not None or self._uses_dual_simplex(standard_model):
+            return self._solve_with_dual_simplex(model, standard_model, start_basis)
+
+        normal_model = self._normalize_standard_model(standard_model)
+        tableaux, feasible = self._feasible_tableaux(normal_model)
+        if not feasible:
+            self._stage("extraction")
+            final_tableaux = self._final_tableaux(tableaux)
+            return so.Solution.unfeasible(model, final_tableaux, final_tableaux, normal_model)
+
+        self._stage("phase 2")
+        initial_tableaux = self._tableaux_copy(tableaux)
+        bounded = self._optimize(tableaux)
+        self._stage("extraction")
+        final_tableaux = self._final_tableaux(tableaux)
+
+        if not bounded:
+            return so.Solution.unbounded(model, initial_tableaux, final_tableaux, normal_model)
+
+        return self._create_solution(tableaux, model, initial_tableaux, final_tableaux, normal_model)
+
+    def _feasible_tableaux(self, normal_model):
+        tableaux = self._revised_initial_tableaux(normal_model)
+        eligible = np.ones(tableaux.matrix.shape[1], dtype=bool)
+        if len(self.artificial_columns) > 0:
+            self._stage("phase 1")
+            phase_one_costs = np.zeros(tableaux.matrix.shape[1])
+            phase_one_costs[self.artificial_columns] = -1.0
+            tableaux.set_costs(phase_one_costs, eligible)
+            self._optimize(tableaux)
+            if tableaux.values[np.isin(tableaux.basis, self.artificial_columns)].sum() > t.eps:
+                return (tableaux, False)
+            self._drive_out_artificial_columns(tableaux)
+
+        eligible[self.artificial_columns] = False
+        tableaux.set_costs(self.costs, eligible)
+        return (tableaux, True)
+
+    def _revised_initial_tableaux(self, normal_model):
+        """
+            _revised_initial_tableaux(normal_model: Model) -> RevisedTableaux:
+                builds the constraint matrix extended with artificial columns and the initial (identity) basis
+        """
+        rows_n = len(normal_model.constraints)
+        columns_n = len(normal_model.variables)
+        rows_with_slack = {row: var.index for (var, row) in self.slack_variables.items()}
+        artificial_rows = [row for row in range(rows_n) if row not in rows_with_slack]
+
+        structural_matrix = mx.constraint_matrix(normal_model)
+        if sp.issparse(structural_matrix):
+            artificial_matrix = sp.csc_matrix((np.ones(len(artificial_rows)), (artificial_rows, range(len(artificial_rows)))), shape=(rows_n, len(artificial_rows)))
+            matrix = sp.hstack([structural_matrix, artificial_matrix], format='csc')
+        else:
+            artificial_matrix = np.zeros((rows_n, len(artificial_rows)))
+            artificial_matrix[artificial_rows, range(len(artificial_rows))] = 1.0
+            matrix = np.hstack([structural_matrix, artificial_matrix])
+
+        self.costs = np.zeros(matrix.shape[1])
+        self.costs[:columns_n] = mx.objective_vector(normal_model)
+        self.artificial_columns = np.arange(columns_n, columns_n + len(artificial_rows))
+
+        basis = np.empty(rows_n, dtype=int)
+        for (row, col) in rows_with_slack.items():
+            basis[row] = col
+        basis[artificial_rows] = self.artificial_columns
+        upper = np.concatenate([mx.upper_bound_vector(normal_model), np.full(len(artificial_rows), np.inf)])
+        return RevisedTableaux(normal_model, matrix, mx.rhs_vector(normal_model), basis, upper, self.refactorization_period)
+
+    def _drive_out_artificial_columns(self, tableaux):
+        structural = np.ones(tableaux.matrix.shape[1], dtype=bool)
+        structural[self.artificial_columns] = False
+        for row in np.where(np.isin(tableaux.basis, self.artificial_columns))[0]:
+            candidates = np.where(structural & (np.abs(tableaux.row(row + 1)) > t.eps))[0]
+            candidates = candidates[~np.isin(candidates, tableaux.basis)]
+            # if there is no candidate, the row is redundant and the artificial variable stays (at zero) in the basis
+            if len(candidates) > 0:
+                tableaux.pivot(row + 1, candidates[0])
+
+    def _dual_initial_tableaux(self, normal_model):
+        tableaux = self._revised_initial_tableaux(normal_model)
+        tableaux.set_costs(self.costs, np.ones(tableaux.matrix.shape[1], dtype=bool))
+        return tableaux
+
+    def _relax_costs(self, tableaux, columns):
+        costs = self.costs.copy()
+        costs[columns] = 0.0
+        tableaux.set_costs(costs, tableaux.eligible)
+
+    def _restore_costs(self, tableaux, normal_model):
+        tableaux.set_costs(self.costs, tableaux.eligible)
+        return tableaux
+
+    def _change_costs(self, tableaux, costs):
+        self.costs[:len(costs)] = costs
+        return self._restore_costs(tableaux, tableaux.model)
+
+    def _create_solution(self, tableaux, model, initial_tableaux, final_tableaux, normal_model):
+        solution = super()._create_solution(tableaux, model, initial_tableaux, final_tableaux, normal_model)
+        if not self.presolve:
+            # duals = c_B * B^-1 of the final basis, so they don't depend on the (possibly not materialized) final tableaux
+            normal_duals = tableaux.factorization.btran(tableaux.costs[tableaux.basis])
+            solution.duals = so.Solution.constraint_duals(model, (self.row_constraints, self.row_factors), normal_duals)
+        return solution
+
+    def _tableaux_copy(self, tableaux):
+        return self._final_tableaux(tableaux)
+
+    def _final_tableaux(self, tableaux):
+        if not self.keep_tableaux:
+            # the dense tableaux are not built, but the basis is refactorized all the same, so the assignment is as accurate
+            tableaux.refactorize()
+            return None
+        return tableaux.to_tableaux(len(tableaux.model.variables))
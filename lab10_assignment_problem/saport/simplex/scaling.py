@@ -0,0 +1,97 @@
+import numpy as np
+import scipy.sparse as sp
+from enum import Enum
+
+from . import model as m
+from . import matrix as mx
+
+# number of the geometric scaling passes (each pass scales all the rows and then all the columns)
+GEOMETRIC_PASSES = 4
+
+
+class ScalingMethod(Enum):
+    """
+        An enum to represent a method of scaling the constraint matrix before the simplex starts:
+        - NONE = the model is solved as it is
+        - GEOMETRIC = rows and columns are repeatedly divided by the geometric mean of their biggest and smallest factor
+        - EQUILIBRATION = rows and then columns are divided by their biggest factor, so the biggest factor in each of them is 1
+        Scaling factors are rounded to powers of 2, so scaling doesn't introduce any rounding errors.
+    """
+    NONE = "none"
+    GEOMETRIC = "geometric"
+    EQUILIBRATION = "equilibration"
+
+    @staticmethod
+    def create(method = None):
+        """
+            create(method: ScalingMethod | str | None) -> ScalingMethod:
+                returns the given method, the method with the given name or NONE if the method is None
+        """
+        return ScalingMethod.NONE if method is None else ScalingMethod(method)
+
+
+def scaling_factors(matrix, method):
+    """
+        scaling_factors(matrix: numpy.Array | scipy.sparse.spmatrix, method: ScalingMethod) -> (numpy.Array, numpy.Array):
+            returns factors of the rows and columns, so the scaled matrix is diag(row_factors) * matrix * diag(column_factors)
+    """
+    magnitudes = sp.csr_matrix(abs(matrix)) if sp.issparse(matrix) else sp.csr_matrix(np.abs(matrix))
+    magnitudes.eliminate_zeros()
+    row_factors = np.ones(magnitudes.shape[0])
+    column_factors = np.ones(magnitudes.shape[1])
+    if method == ScalingMethod.NONE or magnitudes.nnz == 0:
+        return row_factors, column_factors
+
+    if method == ScalingMethod.GEOMETRIC:
+        for _ in range(GEOMETRIC_PASSES):
+            scaled = _scaled(magnitudes, row_factors, column_factors)
+            row_factors /= np.sqrt(_max(scaled, 1) * _min(scaled, 1))
+            scaled = _scaled(magnitudes, row_factors, column_factors)
+            column_factors /= np.sqrt(_max(scaled, 0) * _min(scaled, 0))
+    else:
+        row_factors /= _max(magnitudes, 1)
+        column_factors /= _max(_scaled(magnitudes, row_factors, column_factors), 0)
+    return _power_of_two(row_factors), _power_of_two(column_factors)
+
+
+def scale_model(standard_model, row_factors, column_factors):
+    """
+        scale_model(standard_model: Model, row_factors: numpy.Array, column_factors: numpy.Array) -> Model:
+            returns a new model with scaled constraints, objective and upper bounds,
+            variables of the new model are the original ones divided by the column factors
+            (the model should have all the variables bounded from below by 0, so the lower bounds don't change)
+    """
+    (A, b, types, c, sense) = standard_model.to_matrix_form()
+    scaled_model = m.Model(standard_model.name)
+    upper = mx.upper_bound_vector(standard_model) / column_factors
+    for (variable, variable_upper) in zip(standard_model.variables, upper):
+        scaled_model.create_variable(variable.name, variable.lower, variable_upper)
+
+    if sp.issparse(A):
+        scaled_A = sp.diags(row_factors) @ A @ sp.diags(column_factors)
+    else:
+        scaled_A = A * row_factors[:, None] * column_factors[None, :]
+    scaled_model.add_constraints_from_matrix(scaled_A, b * row_factors, types)
+    scaled_model.set_objective_vector(c * column_factors, sense)
+    return scaled_model
+
+
+def _scaled(magnitudes, row_factors, column_factors):
+    return sp.csr_matrix(sp.diags(row_factors) @ magnitudes @ sp.diags(column_factors))
+
+
+def _max(magnitudes, axis):
+    maximum = magnitudes.max(axis=axis).toarray().ravel()
+    # empty rows / columns are left unscaled
+    return np.where(maximum > 0, maximum, 1.0)
+
+
+def _min(magnitudes, axis):
+    # zeros are not stored in the sparse matrix, so the minimum of the nonzero factors is the inverted maximum of their inverses
+    inverted = magnitudes.copy()
+    inverted.data = 1.0 / inverted.data
+    return 1.0 / _max(inverted, axis)
+
+
+def _power_of_two(factors):
+    return np.exp2(np.round(np.log2(factors)))
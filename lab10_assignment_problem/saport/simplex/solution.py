@@ -1,3 +1,26 @@
+from enum import Enum
+import numpy as np
+import scipy.sparse as sp
+
+from . import matrix as mx
+
+
+class SolutionStatus(Enum):
+    """
+        An enum to represent how the solving ended:
+        - OPTIMAL = optimal solution has been found
+        - INFEASIBLE = the model has no feasible solution
+        - UNBOUNDED = the objective is unbounded
+        - ITERATION_LIMIT = the solver stopped after reaching the iteration limit
+        - TIME_LIMIT = the solver stopped after reaching the time limit
+    """
+    OPTIMAL = "optimal"
+    INFEASIBLE = "infeasible"
+    UNBOUNDED = "unbounded"
+    ITERATION_LIMIT = "iteration limit"
+    TIME_LIMIT = "time limit"
+
+
 class Solution:
     """
         A class to represent a solution to linear programming problem.
@@ -16,46 +39,215 @@ class Solution:
             a simplex tableaux corresponding to the solution 
         normal_model: Model
             normal model with slack and surplus variables
+            (the tableaux and the normal model of a lightweight solution, see discard_tableaux, are rebuilt when accessed)
+        normal_rows: (numpy.Array, numpy.Array) | None
+            for every row of the normal model: index of the constraint it comes from and the factor of the constraint bound in the row rhs
+            (None if the model was presolved, rows of the normal model correspond then to the reduced model)
+        normal_columns: (numpy.Array, numpy.Array) | None
+            for every column of the standard model (the first columns of the normal model): index of the variable it comes from
+            and the factor of the variable's cost in the column cost (None if the model was presolved)
+        duals: numpy.Array | None
+            dual values of the constraints computed by the solver (e.g. by the revised solver from its basis factorization,
+            its final tableaux may be not materialized), None if they have to be read from the final tableaux
         is_feasible: bool
             whether the problem is feasible
         is_bounded: bool
             whether the problem is bounded
+        status: SolutionStatus
+            how the solving ended, if the solver reached a limit, the assignment is the last feasible basic solution
+            (the best one found, None if the solver didn't reach a feasible basis) and the basis is the last one
+        basis: Basis | None
+            the optimal basis (if there is an assignment), it can be used to warm start solving a similar model
+            (or to continue solving it, if the solver reached a limit)
+        presolve_report: PresolveReport | None
+            numbers of rows and columns removed by the presolve (None if the model wasn't presolved),
+            tableaux, normal model and basis correspond then to the reduced model
+        stats: SolverStats | None
+            statistics of the solving (pivots, stage times, etc.), None unless the solver was asked to collect them
 
 
         Methods
         -------
-        __init__(model: Model, assignment: list[float] | None, initial_tableaux: Tableaux, tableaux: Tableaux, normal_model: Model,  is_feasible: bool, is_bounded: bool) -> Solution:
+        __init__(model: Model, assignment: list[float] | None, initial_tableaux: Tableaux, tableaux: Tableaux, normal_model: Model,  is_feasible: bool, is_bounded: bool, basis: Basis | None = None, status: SolutionStatus | None = None) -> Solution:
             constructs a new solution for the specified model, assignment, tableaux and normal model
             if the assignment is null, one of the flags should false - either the solution is infeasible or is unbounded
+            (unless the status says the solver reached a limit), by default the status follows the flags
         value(var: Variable) -> float | None:
             returns a value assigned to the specified variable if the model is feasible and bounded, otherwise None
         objective_value() -> float | None:
             returns a value of the objective function if the model is feasible and bounded, otherwise None
         has_assignment() -> bool:
             helper method returning info if the model is feasible and bounded, only then there is an assignment available
+        dual_values() -> numpy.Array | None:
+            returns the dual values (shadow prices) of the constraints, i.e. changes of the objective value per unit increase of their bounds,
+            read from the final tableaux without solving the dual model (None if there is no assignment)
+        reduced_costs() -> numpy.Array | None:
+            returns the reduced costs of the variables, i.e. changes of the objective value per unit increase of every variable
+            (the other nonbasic variables staying at their bounds), zero for the basic ones (None if there is no assignment)
+        has_tableaux() -> bool:
+            whether the tableaux and the normal model are stored in the solution (and don't have to be rebuilt),
+            False also if the solver didn't materialize the final tableaux (see matrix.DENSE_TABLEAUX_LIMIT)
+        discard_tableaux(rebuild: Callable[[], Solution]):
+            turns the solution into a lightweight one, keeping only the assignment, objective value, basis and status,
+            the tableaux and the normal model are dropped and rebuilt (using the given function solving the model again) when needed
     """
 
-    def __init__(self, model, assignment, initial_tableaux, tableaux, normal_model, is_feasible, is_bounded):
+    def __init__(self, model, assignment, initial_tableaux, tableaux, normal_model, is_feasible, is_bounded, basis = None, status = None):
         self.model = model 
+        self.basis = basis
+        if status is None:
+            status = SolutionStatus.INFEASIBLE if not is_feasible else (SolutionStatus.UNBOUNDED if not is_bounded else SolutionStatus.OPTIMAL)
+        self.status = status
+        self.presolve_report = None
+        self.stats = None
         self.normal_model = normal_model
         self.is_feasible = is_feasible
         self.is_bounded = is_bounded
         self.assignment = assignment
         self.tableaux = tableaux
         self.initial_tableaux = initial_tableaux
+        self.normal_rows = None
+        self.normal_columns = None
+        self.duals = None
+        self._objective_value = None
+        self._rebuild = None
+
+    @property
+    def tableaux(self):
+        self._rebuild_tableaux()
+        return self._tableaux
+
+    @tableaux.setter
+    def tableaux(self, tableaux):
+        self._tableaux = tableaux
+
+    @property
+    def initial_tableaux(self):
+        self._rebuild_tableaux()
+        return self._initial_tableaux
+
+    @initial_tableaux.setter
+    def initial_tableaux(self, initial_tableaux):
+        self._initial_tableaux = initial_tableaux
+
+    @property
+    def normal_model(self):
+        self._rebuild_tableaux()
+        return self._normal_model
+
+    @normal_model.setter
+    def normal_model(self, normal_model):
+        self._normal_model = normal_model
+
+    @property
+    def normal_rows(self):
+        self._rebuild_tableaux()
+        return self._normal_rows
+
+    @normal_rows.setter
+    def normal_rows(self, normal_rows):
+        self._normal_rows = normal_rows
+
+    @property
+    def normal_columns(self):
+        self._rebuild_tableaux()
+        return self._normal_columns
+
+    @normal_columns.setter
+    def normal_columns(self, normal_columns):
+        self._normal_columns = normal_columns
 
     def value(self, var):
         return None if self.assignment == None else self.assignment[var.index]
 
     def objective_value(self):
+        if self._objective_value is not None:
+            return self._objective_value
         return None if self.assignment == None else self.model.objective.evaluate(self.assignment) 
 
     def has_assignment(self):
         return self.assignment == None
 
+    def dual_values(self):
+        if self.assignment is None:
+            return None
+        if self.duals is not None:
+            return self.duals
+        if self.normal_rows is None:
+            raise Exception("Dual values of a presolved model can't be computed, its normal model doesn't contain all the constraints")
+        if self.tableaux is None:
+            raise Exception("Dual values can't be read, the final tableaux is too big to be materialized (see matrix.DENSE_TABLEAUX_LIMIT)")
+        return Solution.constraint_duals(self.model, self.normal_rows, self._normal_dual_values())
+
+    def reduced_costs(self):
+        duals = self.dual_values()
+        if duals is None:
+            return None
+        return mx.objective_vector(self.model) - mx.constraint_matrix(self.model).T @ duals + 0.0
+
+    def _normal_dual_values(self):
+        tableaux = self.tableaux
+        matrix = sp.csc_matrix(mx.constraint_matrix(self.normal_model))
+        costs = mx.objective_vector(self.normal_model)
+        signs = np.where(tableaux.complemented, -1.0, 1.0)
+        rows_n = len(tableaux.basis)
+        duals = np.zeros(rows_n)
+
+        # the cost row entry of a column a * e_row is (+/-) (duals[row] * a - cost), e.g. simply duals[row] for a slack variable
+        singletons = np.flatnonzero(np.diff(matrix.indptr) == 1)
+        rows = matrix.indices[matrix.indptr[singletons]]
+        duals[rows] = (costs[singletons] + signs[singletons] * tableaux.table[0, singletons]) / matrix.data[matrix.indptr[singletons]]
+
+        # rows without any singleton column (e.g. equality constraints) are the only ones requiring a solve,
+        # the reduced costs of the basic columns are zero (and the redundant rows get zero duals, like their artificial variables)
+        missing = np.setdiff1d(np.arange(rows_n), rows)
+        if len(missing) > 0:
+            known = np.setdiff1d(np.arange(rows_n), missing)
+            basic_columns = tableaux.basis[tableaux.basis >= 0]
+            basic_matrix = matrix[:, basic_columns]
+            redundant = missing[tableaux.basis[missing] < 0]
+            system = np.vstack([basic_matrix[missing, :].T.toarray(), (missing[None, :] == redundant[:, None]).astype(float)])
+            rhs = np.concatenate([costs[basic_columns] - basic_matrix[known, :].T @ duals[known], np.zeros(len(redundant))])
+            duals[missing] = np.linalg.lstsq(system, rhs, rcond=None)[0]
+        return duals
+
     @staticmethod
-    def with_assignment(model, assignment, initial_tableaux, tableaux, normal_model):
-        return Solution(model, assignment, initial_tableaux, tableaux, normal_model, True, True)  
+    def constraint_duals(model, normal_rows, normal_duals):
+        """
+            constraint_duals(model: Model, normal_rows: (numpy.Array, numpy.Array), normal_duals: numpy.Array) -> numpy.Array:
+                maps the dual values of the normal model rows (of the maximized objective) onto the dual values of the model constraints
+        """
+        (row_constraints, row_factors) = normal_rows
+        # (adding zero turns negative zeros of the minimized objectives into positive ones)
+        duals = np.bincount(row_constraints, weights=row_factors * normal_duals, minlength=len(model.constraints))
+        return duals * model.objective.type.value + 0.0
+
+    def has_tableaux(self):
+        return self._rebuild is None and self._tableaux is not None
+
+    def discard_tableaux(self, rebuild):
+        self._objective_value = self.objective_value()
+        self._initial_tableaux = None
+        self._tableaux = None
+        self._normal_model = None
+        self._normal_rows = None
+        self._normal_columns = None
+        self._rebuild = rebuild
+
+    def _rebuild_tableaux(self):
+        if self._rebuild is None:
+            return
+        rebuilt = self._rebuild()
+        self._rebuild = None
+        self._initial_tableaux = rebuilt.initial_tableaux
+        self._tableaux = rebuilt.tableaux
+        self._normal_model = rebuilt.normal_model
+        self._normal_rows = rebuilt.normal_rows
+        self._normal_columns = rebuilt.normal_columns
+
+    @staticmethod
+    def with_assignment(model, assignment, initial_tableaux, tableaux, normal_model, basis = None):
+        return Solution(model, assignment, initial_tableaux, tableaux, normal_model, True, True, basis)  
 
     @staticmethod
     def unfeasible(model, initial_tableaux, tableaux, normal_model):
@@ -65,8 +257,15 @@ class Solution:
     def unbounded(model, initial_tableaux, tableaux, normal_model):
         return Solution(model, None, initial_tableaux, tableaux, normal_model, True, False)
 
+    @staticmethod
+    def limit_reached(model, assignment, tableaux, normal_model, basis, status):
+        return Solution(model, assignment, None, tableaux, normal_model, True, True, basis, status)
+
     def __str__(self):
 
+        if self.status in [SolutionStatus.ITERATION_LIMIT, SolutionStatus.TIME_LIMIT] and self.assignment is None:
+            return f"There is no solution, the solver reached the {self.status.value} before finding a feasible one"
+
         if not self.is_bounded:
             return "There is no optimal solution, the model is unbounded"
         
@@ -74,7 +273,10 @@ class Solution:
             return "There is no solution, the model is unfeasible"
 
         print(self.model.objective)
-        text = f'- objective value: {self.objective_value()}\n'
+        text = ''
+        if self.status in [SolutionStatus.ITERATION_LIMIT, SolutionStatus.TIME_LIMIT]:
+            text += f'- the solver reached the {self.status.value}, the solution may be not optimal\n'
+        text += f'- objective value: {self.objective_value()}\n'
         text += '- assignment:'
         for (i,val) in enumerate(self.assignment):
             text += f'\n\t- {self.model.variables[i].name} = {"{:.3f}".format(val)}'
@@ -1,50 +1,703 @@
-from copy import deepcopy
 from os import name
 
 from . import model as m 
 from .expressions import objective as o 
 from .expressions import constraint as c
 from .expressions import variable as v
+from .expressions import expression as e
+from .expressions import atom as a
 from . import solution as s 
 from . import tableaux as t
+from . import matrix as mx
+from . import pricing as pr
+from . import basis as b
+from . import presolve as ps
+from . import scaling as sc
+from . import stats as st
 import numpy as np 
+import time
+from enum import Enum
+
+# number of consecutive degenerate pivots after which the solver assumes it stalls and falls back to the Bland's rule
+# (the actual threshold is never smaller than the number of rows)
+STALL_PIVOTS = 100
+
+# the dual model is solved instead of the given one (see SolveStrategy.AUTO) only if its estimated cost is this many times smaller
+DUAL_STRATEGY_ADVANTAGE = 2.0
+
+
+class SolverMethod(Enum):
+    """
+        An enum to represent a variant of the simplex algorithm used to solve a model:
+        - TABLEAUX = simplex operating on the full, dense tableaux
+        - REVISED = revised simplex operating on the constraint matrix and a factorized basis
+        - AUTO = revised simplex for big sparse models (see matrix.DENSITY_THRESHOLD), tableaux simplex otherwise
+        - IPM = interior point method followed by the crossover to an optimal basis with the simplex chosen like in AUTO (see ipm.InteriorPointSolver),
+          it's never chosen automatically
+    """
+    TABLEAUX = "tableaux"
+    REVISED = "revised"
+    AUTO = "auto"
+    IPM = "ipm"
+
+    @staticmethod
+    def choose(model, method = None):
+        """
+            choose(model: Model, method: SolverMethod | str | None) -> SolverMethod:
+                resolves the AUTO method into a concrete one for the given model
+        """
+        method = SolverMethod.AUTO if method is None else SolverMethod(method)
+        if method != SolverMethod.AUTO:
+            return method
+        cells = (len(model.constraints) + 1) * (len(model.variables) + len(model.constraints) + 1)
+        if cells > mx.REVISED_SIMPLEX_CELLS and mx.is_sparse(model):
+            return SolverMethod.REVISED
+        return SolverMethod.TABLEAUX
+
+
+class SimplexAlgorithm(Enum):
+    """
+        An enum to represent an algorithm used to optimize the tableaux:
+        - PRIMAL = primal simplex (with the artificial variables phase, if the slack basis is not feasible)
+        - DUAL = dual simplex starting in the slack basis (if the basis is not dual feasible,
+          dual simplex works with relaxed costs and the primal simplex finishes the optimization)
+        - AUTO = dual simplex if the slack basis is dual feasible, but not primal feasible (and there are no equality constraints),
+          primal simplex otherwise
+    """
+    PRIMAL = "primal"
+    DUAL = "dual"
+    AUTO = "auto"
+
+
+class SolveStrategy(Enum):
+    """
+        An enum to represent which model is solved by the simplex:
+        - PRIMAL = the given model
+        - DUAL = the dual model (see Model.dual), the assignment of the given model is given by the dual values of its constraints
+        - AUTO = the dual model if it's estimated to be much cheaper to solve (see DUAL_STRATEGY_ADVANTAGE), e.g. for models
+          with many more constraints than variables, the given model otherwise
+        The cost of solving a model is estimated as the number of rows of its tableaux (roughly the number of pivots) times its size.
+    """
+    PRIMAL = "primal"
+    DUAL = "dual"
+    AUTO = "auto"
+
+    @staticmethod
+    def choose(model, strategy = None):
+        """
+            choose(model: Model, strategy: SolveStrategy | str | None) -> SolveStrategy:
+                resolves the AUTO strategy into a concrete one for the given model
+        """
+        strategy = SolveStrategy.PRIMAL if strategy is None else SolveStrategy(strategy)
+        if strategy != SolveStrategy.AUTO:
+            return strategy
+        rows_n = len(model.constraints)
+        columns_n = len(model.variables)
+        # rows of the dual are the variables, its columns are the constraints and the bounds other than x >= 0 (and the surplus variables)
+        bounds_n = sum((v.upper < float('inf')) + (v.lower not in [0.0, float('-inf')]) for v in model.variables)
+        primal_cost = rows_n ** 2 * (columns_n + rows_n)
+        dual_cost = columns_n ** 2 * (rows_n + bounds_n + columns_n)
+        return SolveStrategy.DUAL if dual_cost * DUAL_STRATEGY_ADVANTAGE < primal_cost else SolveStrategy.PRIMAL
+
+
+class _LimitReached(Exception):
+    def __init__(self, tableaux, status):
+        super().__init__(status.value)
+        self.tableaux = tableaux
+        self.status = status
+
+
+class CycleDetector:
+    """
+        A class to detect cycling and stalling of the simplex.
+        As long as pivots don't change the objective, visited bases (basic columns and columns at their upper bounds) are hashed,
+        returning to an already visited basis means the simplex cycles,
+        too many degenerate pivots in a row mean it stalls (it might be cycling through more bases, than it is worth remembering).
+
+        Attributes
+        ----------
+        best : float
+            the objective value of the last non degenerate pivot
+        visited : set[int]
+            hashes of the bases visited since the last non degenerate pivot
+        degenerate_pivots : int
+            number of the degenerate pivots since the last non degenerate pivot
+
+        Methods
+        -------
+        __init__(tableaux: Tableaux) -> CycleDetector:
+            constructs a detector starting in the current basis of the given tableaux
+        is_cycling(tableaux: Tableaux) -> bool:
+            registers the current basis of the tableaux, returns True if the simplex cycles or stalls
+    """
+
+    def __init__(self, tableaux):
+        self._reset(tableaux)
+
+    def _reset(self, tableaux):
+        self.best = tableaux.cost()
+        self.visited = {self._hash(tableaux)}
+        self.degenerate_pivots = 0
+
+    def _hash(self, tableaux):
+        return hash((tableaux.basis.tobytes(), tableaux.complemented.tobytes()))
+
+    def is_cycling(self, tableaux):
+        if abs(tableaux.cost() - self.best) > t.eps * (1.0 + abs(self.best)):
+            self._reset(tableaux)
+            return False
+        self.degenerate_pivots += 1
+        basis_hash = self._hash(tableaux)
+        if basis_hash in self.visited:
+            return True
+        self.visited.add(basis_hash)
+        return self.degenerate_pivots > max(STALL_PIVOTS, len(tableaux.basis))
 
 
 class Solver:
     """
         A class to represent a simplex solver.
 
+        Attributes
+        ----------
+        pricing : PricingRule
+            rule choosing the variable entering the basis in the primal simplex (Dantzig rule by default)
+        algorithm : SimplexAlgorithm
+            whether the primal or the dual simplex is used
+        presolve : bool
+            whether the model is reduced by the presolve (see presolve.Presolver) before the simplex starts
+        scaling : ScalingMethod
+            how the constraint matrix is scaled before the simplex starts (not scaled by default),
+            the solution assignment is unscaled, but its tableaux and normal model correspond to the scaled model
+        iteration_limit : int | None
+            maximal number of iterations, after reaching it the solver returns the last basis with the ITERATION_LIMIT status
+        time_limit : float | None
+            maximal solving time in seconds, after reaching it the solver returns the last basis with the TIME_LIMIT status
+        iterations : int
+            number of iterations (pivots and bound flips) performed during the last solve (both phases)
+        cycling_detected : bool
+            whether the last solve cycled or stalled, so the simplex fell back to the Bland's rule (see CycleDetector)
+        collect_stats : bool
+            whether the solver collects statistics of the solving (returned as solution.stats)
+        stats : SolverStats | None
+            statistics of the last solve (None if they are not collected)
+        keep_tableaux : bool
+            whether solutions keep their tableaux and normal models, otherwise lightweight solutions are returned
+            (see Solution.discard_tableaux), their tableaux are rebuilt by solving the model again, so it shouldn't be modified
+
         Methods
         -------
-        solve(model: Model) -> Solution:
+        __init__(pricing: PricingRule | str | None = None, algorithm: SimplexAlgorithm | str | None = None, presolve: bool = False, scaling: ScalingMethod | str | None = None, iteration_limit: int | None = None, time_limit: float | None = None, collect_stats: bool = False, keep_tableaux: bool = True) -> Solver:
+            constructs a solver using the given pricing rule (or the rule with the given name, e.g. "bland")
+            and the given simplex algorithm (AUTO by default), optionally presolving and scaling the models,
+            limiting the number of iterations and the solving time, collecting the statistics and returning lightweight solutions
+        solve(model: Model, start_basis: Basis | None = None) -> Solution:
             solves the given model and return the first solution
+            if the start basis is given, the solver starts from it (dropping variables it can't make basic)
+            and repairs its primal infeasibility with the dual simplex and the dual infeasibility with the primal one
+        solve_objectives(model: Model, objectives: numpy.Array, sense: ObjectiveType | str = "max") -> List[Solution]:
+            solves the model (its objective is ignored) for every objective vector (row of the objectives matrix),
+            the first phase is performed only once and each objective is optimized starting from the optimal basis of the previous one
+            with the primal simplex (regardless of the chosen algorithm), returned solutions are lightweight (see Solution.discard_tableaux)
+        standard_model(model: Model) -> Model:
+            returns the model translated to the standard form the solver works on (with the bounded variables substituted and scaled,
+            if the scaling is on), the state of the solver doesn't change
     """
 
-    def solve(self, model):
-        normal_model = self._normalize_model(model)
-        if len(self.slack_variables) < len(normal_model.constraints):
-            tableaux, success = self._presolve(normal_model)
-            if not success:
-                return s.Solution.unfeasible(model, tableaux, tableaux, normal_model)
+    def __init__(self, pricing = None, algorithm = None, presolve = False, scaling = None, iteration_limit = None, time_limit = None, collect_stats = False, keep_tableaux = True):
+        self.pricing = pr.PricingRule.create(pricing)
+        self.algorithm = SimplexAlgorithm.AUTO if algorithm is None else SimplexAlgorithm(algorithm)
+        self.presolve = presolve
+        self.scaling = sc.ScalingMethod.create(scaling)
+        self.iteration_limit = iteration_limit
+        self.time_limit = time_limit
+        self.iterations = 0
+        self.cycling_detected = False
+        self.collect_stats = collect_stats
+        self.stats = None
+        self.keep_tableaux = keep_tableaux
+
+    def solve(self, model, start_basis = None):
+        self.iterations = 0
+        self.cycling_detected = False
+        self.start_time = time.perf_counter()
+        self.stats = st.SolverStats() if self.collect_stats else None
+        if not self.presolve:
+            solution = self._solve_within_limits(model, start_basis)
+            solution.normal_rows = (self.row_constraints, self.row_factors)
+            solution.normal_columns = self._normal_columns(model)
         else:
-            tableaux = self._basic_initial_tableaux(normal_model)
-
-        initial_tableaux = deepcopy(tableaux)
-        if self._optimize(tableaux) == False:
+            self._stage("presolve")
+            presolved = ps.Presolver().presolve(model)
+            if not presolved.is_feasible or len(presolved.reduced_model.variables) == 0:
+                solution = presolved.postsolve(None)
+            else:
+                solution = presolved.postsolve(self._solve_within_limits(presolved.reduced_model, start_basis))
+
+        if not self.keep_tableaux:
+            # the solve is repeated with the number of iterations limited to the one of the original solve instead of its time limit,
+            # so the solver stops in the same basis
+            solution.discard_tableaux(self._rebuild_function(model, start_basis, self.iterations))
+        if self.stats is not None:
+            self.stats.start_stage(None)
+            solution.stats = self.stats
+        return solution
+
+    def solve_objectives(self, model, objectives, sense = o.ObjectiveType.MAX):
+        self.iterations = 0
+        self.cycling_detected = False
+        self.start_time = time.perf_counter()
+        self.stats = None
+        models = []
+        for objective in np.atleast_2d(objectives):
+            objective_model = model.snapshot()
+            objective_model.set_objective_vector(objective, sense)
+            models.append(objective_model)
+
+        solutions = []
+        try:
+            self._solve_objectives(models, solutions)
+        except _LimitReached as limit:
+            # the objective being optimized gets the last basis, the following ones are not solved at all
+            solutions.append(self._limit_solution(models[len(solutions)], limit.tableaux, limit.status))
+            solutions += [s.Solution.limit_reached(objective_model, None, None, self.normal_model, None, limit.status) for objective_model in models[len(solutions):]]
+
+        for (objective_model, solution) in zip(models, solutions):
+            # solutions with a basis are rebuilt in it, the other ones are solved from scratch
+            iteration_limit = None if solution.basis is None else 0
+            solution.discard_tableaux(self._rebuild_function(objective_model, solution.basis, iteration_limit))
+        return solutions
+
+    def _solve_objectives(self, models, solutions):
+        normal_model = self._normalize_standard_model(self._standard_model(models[0]))
+        tableaux, feasible = self._feasible_tableaux(normal_model)
+        if not feasible:
+            solutions += [s.Solution.unfeasible(objective_model, None, None, normal_model) for objective_model in models]
+            return
+
+        for (k, objective_model) in enumerate(models):
+            if k > 0:
+                tableaux = self._change_costs(tableaux, self._normal_costs(objective_model, normal_model))
+            if self._optimize(tableaux):
+                solutions.append(self._create_solution(tableaux, objective_model, None, None, normal_model))
+            else:
+                # the simplex stops before leaving the feasible basis, so the next objective can start from it
+                solutions.append(s.Solution.unbounded(objective_model, None, None, normal_model))
+
+    def _normal_costs(self, objective_model, normal_model):
+        """
+            _normal_costs(objective_model: Model, normal_model: Model) -> numpy.Array:
+                returns the objective of the given model translated to the variables of the normal model
+                (maximized, with substituted bounded variables and scaled like the constraints of the normal model)
+        """
+        objective = mx.objective_vector(objective_model) * objective_model.objective.type.value
+        costs = np.zeros(len(normal_model.variables))
+        costs[:len(objective)] = objective
+        for (index, (_, sign, negative)) in self.bound_substitutions.items():
+            costs[index] *= sign
+            if negative is not None:
+                costs[negative] = -objective[index]
+        costs[:len(self.column_factors)] *= self.column_factors
+        return costs
+
+    def _normal_columns(self, model):
+        """
+            _normal_columns(model: Model) -> (numpy.Array, numpy.Array):
+                returns for every column of the standard model the index of the variable it comes from
+                and the factor of the variable's cost in the (scaled) cost of the column (see _normal_costs)
+        """
+        columns_n = len(self.column_factors)
+        column_variables = np.arange(columns_n)
+        column_factors = np.full(columns_n, float(model.objective.type.value))
+        for (index, (_, sign, negative)) in self.bound_substitutions.items():
+            column_factors[index] *= sign
+            if negative is not None:
+                column_variables[negative] = index
+                column_factors[negative] = -column_factors[index]
+        return (column_variables, column_factors * self.column_factors)
+
+    def _rebuild_function(self, model, start_basis, iteration_limit):
+        solver = self._rebuild_solver()
+        solver.iteration_limit = iteration_limit
+        return lambda: solver.solve(model, start_basis)
+
+    def _rebuild_solver(self):
+        return Solver(self.pricing, self.algorithm, self.presolve, self.scaling)
+
+    def _stage(self, stage):
+        if self.stats is not None:
+            self.stats.start_stage(stage)
+
+    def _now(self):
+        # the clock is read only if the statistics are collected
+        return time.perf_counter() if self.stats is not None else 0.0
+
+    def _solve_within_limits(self, model, start_basis = None):
+        try:
+            return self._solve(model, start_basis)
+        except _LimitReached as limit:
+            return self._limit_solution(model, limit.tableaux, limit.status)
+
+    def _check_limits(self, tableaux):
+        if self.iteration_limit is not None and self.iterations >= self.iteration_limit:
+            raise _LimitReached(tableaux, s.SolutionStatus.ITERATION_LIMIT)
+        if self.time_limit is not None and time.perf_counter() - self.start_time >= self.time_limit:
+            raise _LimitReached(tableaux, s.SolutionStatus.TIME_LIMIT)
+
+    def _limit_solution(self, model, tableaux, status):
+        """
+            _limit_solution(model: Model, tableaux: Tableaux, status: SolutionStatus) -> Solution:
+                returns the solution for the tableaux the solver stopped at,
+                the assignment is available only if the basis is primal feasible and there are no artificial variables left above zero
+        """
+        self._stage("extraction")
+        values = tableaux.extract_assignment()
+        assignment = None
+        artificial_values = np.array(values[len(self.normal_model.variables):])
+        if self._is_primal_feasible(tableaux) and np.all(artificial_values <= t.eps):
+            assignment = [self._original_value(values, var.index) for var in model.variables]
+        basis = b.Basis.from_tableaux(tableaux)
+        return s.Solution.limit_reached(model, assignment, self._final_tableaux(tableaux), self.normal_model, basis, status)
+
+    def _solve(self, model, start_basis = None):
+        self._stage("normalize")
+        standard_model = self._standard_model(model)
+        if start_basis is not None or self._uses_dual_simplex(standard_model):
+            return self._solve_with_dual_simplex(model, standard_model, start_basis)
+
+        normal_model = self._normalize_standard_model(standard_model)
+        tableaux, feasible = self._feasible_tableaux(normal_model)
+        if not feasible:
+            self._stage("extraction")
+            return s.Solution.unfeasible(model, tableaux, tableaux, normal_model)
+
+        self._stage("phase 2")
+        initial_tableaux = self._tableaux_copy(tableaux)
+        bounded = self._optimize(tableaux)
+        self._stage("extraction")
+        if not bounded:
             return s.Solution.unbounded(model, initial_tableaux, tableaux, normal_model)
 
-        assignment = tableaux.extract_assignment()
-        return self._create_solution(assignment, model, initial_tableaux, tableaux, normal_model)
+        return self._create_solution(tableaux, model, initial_tableaux, tableaux, normal_model)
+
+    def _feasible_tableaux(self, normal_model):
+        """
+            _feasible_tableaux(normal_model: Model) -> (Tableaux, bool):
+                returns the initial tableaux for the second phase of the simplex (using the first phase if it's needed)
+                and whether the model is feasible (if not, the tableaux is the final one of the first phase)
+        """
+        if len(self.slack_variables) == len(normal_model.constraints):
+            return (self._basic_initial_tableaux(normal_model), True)
+        self._stage("phase 1")
+        return self._presolve(normal_model)
 
     def _optimize(self, tableaux):
-        while not tableaux.is_optimal():
-            pivot_col = tableaux.choose_entering_variable()
+        """
+            _optimize(tableaux: Tableaux) -> bool:
+                optimizes the primal feasible tableaux with the primal simplex, returns False if the problem is unbounded
+                if the simplex cycles or stalls (see CycleDetector), the rest of the optimization uses the Bland's rule
+        """
+        pricing = self.pricing
+        pricing.reset(tableaux)
+        detector = None if isinstance(pricing, pr.BlandRule) else CycleDetector(tableaux)
+        stats = self.stats
+        if stats is not None:
+            stats.record_tableaux(tableaux)
+        while True:
+            start = self._now()
+            pivot_col = pricing.choose_entering_variable(tableaux)
+            if stats is not None:
+                start = stats.lap("pricing", start)
+            if pivot_col is None:
+                return True
             if tableaux.is_unbounded(pivot_col):
                 return False
-            pivot_row = tableaux.choose_leaving_variable(pivot_col)
+            self._check_limits(tableaux)
+            if tableaux.flips_bound(pivot_col):
+                if stats is not None:
+                    start = stats.lap("ratio test", start)
+                tableaux.flip_bound(pivot_col)
+                if stats is not None:
+                    stats.lap("pivoting", start)
+                    stats.bound_flips += 1
+            else:
+                pivot_row = pricing.choose_leaving_variable(tableaux, pivot_col)
+                leaving = tableaux.basis[pivot_row - 1]
+                leaves_at_upper = tableaux.leaves_at_upper(pivot_row, pivot_col)
+                if stats is not None:
+                    start = stats.lap("ratio test", start)
+                    cost = tableaux.cost()
+
+                pricing.update(tableaux, pivot_row, pivot_col)
+                tableaux.pivot(pivot_row, pivot_col)
+                if leaves_at_upper:
+                    tableaux.flip_bound(leaving)
+                if stats is not None:
+                    stats.lap("pivoting", start)
+                    stats.record_pivot(cost, tableaux.cost())
+            self.iterations += 1
+
+            if detector is not None and detector.is_cycling(tableaux):
+                pricing = pr.BlandRule()
+                pricing.reset(tableaux)
+                detector = None
+                self.cycling_detected = True
+
+    def _optimize_dual(self, tableaux):
+        """
+            _optimize_dual(tableaux: Tableaux) -> bool:
+                optimizes the dual feasible tableaux with the dual simplex, returns False if the problem is infeasible
+                the leaving row is the one with the biggest bound violation,
+                the entering column is chosen by the dual ratio test with bound flipping (long step):
+                bounded candidates with smaller ratios are moved to their upper bounds as long as the row stays infeasible
+                if the dual simplex cycles or stalls (see CycleDetector), it falls back to the Bland's rule:
+                the leaving row is the infeasible one with the smallest basic variable and ties in the ratio test go to smaller columns
+        """
+        stats = self.stats
+        if stats is not None:
+            stats.record_tableaux(tableaux)
+        # (e.g. the presolve removed all the constraints) there is nothing to be infeasible
+        if len(tableaux.basis) == 0:
+            return True
+        detector = CycleDetector(tableaux)
+        bland = False
+        while True:
+            start = self._now()
+            values = tableaux.basic_values()
+            upper = tableaux.basic_upper()
+            violations = np.maximum(-values, values - upper)
+            row = violations.argmax() + 1
+            if violations[row - 1] <= t.eps:
+                return True
+            self._check_limits(tableaux)
+            if bland:
+                infeasible = np.flatnonzero(violations > t.eps)
+                row = infeasible[np.argmin(tableaux.basis[infeasible])] + 1
+            if values[row - 1] > upper[row - 1]:
+                tableaux.complement_basic(row)
+            if stats is not None:
+                start = stats.lap("pricing", start)
+
+            pivot_row = tableaux.row(row)
+            candidates = np.flatnonzero(pivot_row < -t.eps)
+            if len(candidates) == 0:
+                return False
+            factors = -pivot_row[candidates]
+            ratios = np.maximum(tableaux.cost_factors()[candidates], 0.0) / factors
+            # ties are broken in favour of bigger pivot factors (or smaller columns, if the simplex cycles)
+            order = np.lexsort((candidates if bland else -factors, ratios))
+
+            infeasibility = -tableaux.basic_values()[row - 1]
+            pivot_col = None
+            for k in order:
+                col = candidates[k]
+                infeasibility -= tableaux.upper[col] * factors[k]
+                if infeasibility <= t.eps:
+                    pivot_col = col
+                    break
+                tableaux.flip_bound(col)
+                if stats is not None:
+                    stats.bound_flips += 1
+
+            # even with all the candidates at their upper bounds the row stays infeasible
+            if pivot_col is None:
+                return False
+            if stats is not None:
+                start = stats.lap("ratio test", start)
+                cost = tableaux.cost()
+            tableaux.pivot(row, pivot_col)
+            if stats is not None:
+                stats.lap("pivoting", start)
+                stats.record_pivot(cost, tableaux.cost())
+            self.iterations += 1
+
+            if not bland and detector.is_cycling(tableaux):
+                bland = True
+                self.cycling_detected = True
+
+    def _uses_dual_simplex(self, standard_model):
+        if self.algorithm != SimplexAlgorithm.AUTO:
+            return self.algorithm == SimplexAlgorithm.DUAL
+        # equality constraints would be split into two rows, so models containing them are left to the two-phase primal simplex
+        if any(constraint.type == c.ConstraintType.EQ for constraint in standard_model.constraints):
+            return False
+        primal_feasible = all(constraint.bound >= 0 for constraint in standard_model.constraints)
+        costs = mx.objective_vector(standard_model)
+        dual_feasible = np.all((costs <= t.eps) | (mx.upper_bound_vector(standard_model) < np.inf))
+        return dual_feasible and not primal_feasible
+
+    def _solve_with_dual_simplex(self, model, standard_model, start_basis = None):
+        """
+            _solve_with_dual_simplex(model: Model, standard_model: Model, start_basis: Basis | None) -> Solution:
+                solves the model starting from the slack basis (or the given one) with the dual simplex,
+                if the basis is not dual feasible, costs of the offending variables are relaxed to zero
+                and the primal simplex restores optimality after the dual one reaches a feasible basis
+                a primal feasible start basis goes straight to the primal simplex
+        """
+        normal_model = self._dual_normalize_model(standard_model)
+        tableaux = self._dual_initial_tableaux(normal_model)
+        if start_basis is not None:
+            self._install_basis(tableaux, start_basis)
+
+        relaxed_columns = []
+        if not self._is_primal_feasible(tableaux):
+            cost_factors = tableaux.cost_factors()
+            for col in np.flatnonzero((cost_factors < -t.eps) & (tableaux.upper < np.inf)):
+                tableaux.flip_bound(col)
+            relaxed_columns = np.flatnonzero(tableaux.cost_factors() < -t.eps)
+            if len(relaxed_columns) > 0:
+                self._relax_costs(tableaux, relaxed_columns)
+
+        initial_tableaux = self._tableaux_copy(tableaux)
+        self._stage("phase 1")
+        if not self._optimize_dual(tableaux):
+            self._stage("extraction")
+            return s.Solution.unfeasible(model, initial_tableaux, self._final_tableaux(tableaux), normal_model)
+
+        self._stage("phase 2")
+        if len(relaxed_columns) > 0:
+            tableaux = self._restore_costs(tableaux, normal_model)
+        bounded = self._optimize(tableaux)
+        self._stage("extraction")
+        if not bounded:
+            return s.Solution.unbounded(model, initial_tableaux, self._final_tableaux(tableaux), normal_model)
+
+        return self._create_solution(tableaux, model, initial_tableaux, self._final_tableaux(tableaux), normal_model)
+
+    def _is_primal_feasible(self, tableaux):
+        values = tableaux.basic_values()
+        return np.all(values >= -t.eps) and np.all(values <= tableaux.basic_upper() + t.eps)
+
+    def _install_basis(self, tableaux, basis):
+        """
+            _install_basis(tableaux: Tableaux, basis: Basis):
+                moves the slack tableaux to the given basis: nonbasic variables are moved to their upper bounds
+                and the basic ones are pivoted in (each one replacing the slack with the biggest factor in its column),
+                variables that can't be made basic (unknown or dependent on the already chosen ones) are skipped,
+                nonbasic variables with the values between their bounds (e.g. from the interior point method) are pushed to the bounds afterwards
+        """
+        indexes = {var.name: var.index for var in tableaux.model.variables}
+        for name in basis.at_upper:
+            col = indexes.get(name)
+            if col is not None and tableaux.upper[col] < np.inf and not tableaux.complemented[col]:
+                tableaux.flip_bound(col)
+
+        basic = [indexes[name] for name in basis.basic if name in indexes]
+        replaceable = ~np.isin(tableaux.basis, basic)
+        for col in basic:
+            if not replaceable.any():
+                break
+            if col in tableaux.basis:
+                continue
+            factors = np.where(replaceable, np.abs(tableaux.column(col)), 0.0)
+            row = factors.argmax()
+            if factors[row] <= t.eps:
+                continue
+            tableaux.pivot(row + 1, col)
+            replaceable[row] = False
+
+        if len(basis.values) > 0:
+            self._push_to_bounds(tableaux, {indexes[name]: value for (name, value) in basis.values.items() if name in indexes})
 
-            tableaux.pivot(pivot_row, pivot_col)
-        return True
+    def _push_to_bounds(self, tableaux, values):
+        """
+            _push_to_bounds(tableaux: Tableaux, values: Dict[int, float]):
+                moves the nonbasic columns having the given values (between their bounds) to the bounds one by one,
+                the values of the basic variables follow them (the point stays in the constraints) and the one reaching its bound first
+                is replaced in the basis by the pushed column, so the tableaux ends in a vertex next to the given point
+                (each column moves towards the bound not worsening the objective, or the closer one if its cost factor is zero)
+        """
+        # values in the tableaux representation: complemented columns measure the distance from the upper bound
+        nonbasic = np.ones(len(tableaux.upper), dtype=bool)
+        nonbasic[tableaux.basis[tableaux.basis >= 0]] = False
+        pushed = [col for col in values if nonbasic[col]]
+        point = {col: min(max(values[col], 0.0), tableaux.upper[col]) for col in pushed}
+        point = {col: tableaux.upper[col] - value if tableaux.complemented[col] else value for (col, value) in point.items()}
+        current = tableaux.basic_values().copy()
+        for col in pushed:
+            current -= point[col] * tableaux.column(col)
+        # short moves are less likely to be blocked by the basic variables, so the columns closest to their bounds go first
+        pushed.sort(key=lambda col: min(point[col], tableaux.upper[col] - point[col]))
+
+        # (cost factors of the installed basis are good enough to choose the directions, the point is close to the optimum anyway)
+        cost_factors = tableaux.cost_factors().copy()
+        for col in pushed:
+            column = tableaux.column(col).copy()
+            up = tableaux.upper[col] < np.inf and (cost_factors[col] < -t.eps or (cost_factors[col] <= t.eps and 2.0 * point[col] > tableaux.upper[col]))
+            (step, direction) = (tableaux.upper[col] - point[col], -column) if up else (point[col], column)
+
+            basic_upper = tableaux.basic_upper()
+            quotients = np.full(len(current), np.inf)
+            decreasing = direction < -t.eps
+            quotients[decreasing] = np.maximum(current[decreasing], 0.0) / -direction[decreasing]
+            increasing = (direction > t.eps) & (basic_upper < np.inf)
+            quotients[increasing] = np.maximum(basic_upper[increasing] - current[increasing], 0.0) / direction[increasing]
+            if quotients.min(initial=np.inf) >= step:
+                current += step * direction
+                if up:
+                    tableaux.flip_bound(col)
+                continue
+
+            row = quotients.argmin()
+            current += quotients[row] * direction
+            leaving = tableaux.basis[row]
+            tableaux.pivot(row + 1, col)
+            current[row] = point[col] + quotients[row] if up else point[col] - quotients[row]
+            if direction[row] > 0:
+                tableaux.flip_bound(leaving)
+
+    def _dual_normalize_model(self, standard_model):
+        """
+            _dual_normalize_model(standard_model: Model) -> Model:
+                returns a normalized model with a slack variable in every row (the slack basis may be primal infeasible),
+                equality constraints are split into two inequalities
+        """
+        # slacks are named after the original rows (like in the primal normal model), so bases can be shared,
+        # the second row of a split equality gets its slack named with the "-" suffix
+        constraints = []
+        row_constraints = []
+        row_factors = []
+        self.slack_variables = dict()
+        self.surplus_variables = dict()
+        for (i, constraint) in enumerate(standard_model.constraints):
+            rows = [(constraint, f"s{i}", self.row_factors[i])]
+            if constraint.type == c.ConstraintType.EQ:
+                inverted = c.Constraint(constraint.expression, constraint.bound, c.ConstraintType.GE)
+                inverted.invert()
+                rows.append((inverted, f"s{i}-", -self.row_factors[i]))
+            for (row, name, factor) in rows:
+                slack_var = standard_model.create_variable(name)
+                self.slack_variables[slack_var] = len(constraints)
+                row.expression = row.expression + slack_var
+                row.type = c.ConstraintType.EQ
+                constraints.append(row)
+                row_constraints.append(i)
+                row_factors.append(factor)
+        standard_model.constraints = constraints
+        self.row_constraints = np.array(row_constraints, dtype=int)
+        self.row_factors = np.array(row_factors)
+        self.normal_model = standard_model
+        return standard_model
+
+    def _dual_initial_tableaux(self, normal_model):
+        return self._basic_initial_tableaux(normal_model)
+
+    def _relax_costs(self, tableaux, columns):
+        tableaux.table[0, columns] = 0.0
+
+    def _restore_costs(self, tableaux, normal_model):
+        tableaux = self._restore_original_objective_row(tableaux, normal_model)
+        return self._fix_objective_row_to_the_basis(tableaux)
+
+    def _change_costs(self, tableaux, costs):
+        tableaux = self._tableaux_with_costs(tableaux, tableaux.model, costs)
+        return self._fix_objective_row_to_the_basis(tableaux)
+
+    def _tableaux_copy(self, tableaux):
+        return tableaux.copy() if self.keep_tableaux else None
+
+    def _final_tableaux(self, tableaux):
+        return tableaux
 
     def _presolve(self, model):
         """
@@ -59,11 +712,10 @@ class Solver:
         if self._artifical_variables_are_positive(tableaux):
             return (tableaux, False)
 
-        basis = tableaux.extract_basis()
-
+        self._drive_out_artificial_variables(tableaux)
         tableaux = self._remove_artificial_variables(tableaux)
         tableaux = self._restore_original_objective_row(tableaux, model)
-        tableaux = self._fix_objective_row_to_the_basis(tableaux, basis)
+        tableaux = self._fix_objective_row_to_the_basis(tableaux)
         return (tableaux, True)
 
     def _normalize_model(self, original_model):
@@ -71,22 +723,109 @@ class Solver:
             _normalize_model(model: Model) -> Model:
                 returns a normalized version of the given model 
         """
+        return self._normalize_standard_model(self._standard_model(original_model))
 
+    def standard_model(self, original_model):
+        """
+            standard_model(model: Model) -> Model:
+                returns the model in the standard form with all variables bounded from below by 0 (scaled, if the scaling is on),
+                i.e. the model the solver would normalize, without changing the state of the solver
+        """
+        (model, _, _, _) = self._standard_form(original_model)
+        return model
+
+    def _standard_model(self, original_model):
+        """
+            _standard_model(model: Model) -> Model:
+                returns the standard model (see standard_model) and keeps the substitutions and scaling factors used to build it
+        """
+        (model, self.bound_substitutions, self.row_factors, self.column_factors) = self._standard_form(original_model)
+        # rows of the normal model are tracked back to the constraints, along with factors of their bounds in the rows rhs
+        self.row_constraints = np.arange(len(model.constraints))
+        return model
+
+    def _standard_form(self, original_model):
+        """
+            _standard_form(model: Model) -> (Model, dict[int, (float, float, int | None)], numpy.Array, numpy.Array):
+                returns the standard model with the substitutions of the bounded variables and the row and column factors
+                (factors of the constraint bounds in the rows rhs and the scaling factors of the columns)
+        """
         model = original_model.translate_to_standard_form()
+        bound_substitutions = self._substitute_bounded_variables(model)
+        column_factors = np.ones(len(model.variables))
+        row_factors = np.array([-1.0 if constraint.type == c.ConstraintType.GE else 1.0 for constraint in original_model.constraints])
+        if self.scaling != sc.ScalingMethod.NONE:
+            scaling_row_factors, column_factors = sc.scaling_factors(mx.constraint_matrix(model), self.scaling)
+            model = sc.scale_model(model, scaling_row_factors, column_factors)
+            row_factors *= scaling_row_factors
+        return (model, bound_substitutions, row_factors, column_factors)
+
+    def _normalize_standard_model(self, model):
         self._change_constraints_bounds_to_nonnegative(model)
         self.slack_variables = self._add_slack_variables(model)
         self.surplus_variables = self._add_surplus_variables(model)   
+        self.normal_model = model
         return model
 
+    def _substitute_bounded_variables(self, model):
+        """
+            _substitute_bounded_variables(model: Model) -> dict[int, (float, float, int | None)]:
+                replaces variables with nonzero lower bounds, so every variable in the model is bounded from below by 0:
+                - var = lower + new_var, if the lower bound is finite
+                - var = upper - new_var, if only the upper bound is finite
+                - var = new_var - negative_var, if the variable is free
+                upper bounds (if any) stay on the variables and are handled by the bounded ratio test,
+                substituted variables are replaced with copies (the original ones may be shared with the user's model)
+                returns dict mapping index of the substituted variable to (shift, sign, index of the negative part | None)
+        """
+        substitutions = dict()
+        for var in model.variables.copy():
+            if var.lower == 0.0:
+                continue
+            if var.lower > float('-inf'):
+                substitutions[var.index] = (var.lower, 1.0, None)
+                model.set_variable_bounds(var, 0.0, var.upper - var.lower)
+            elif var.upper < float('inf'):
+                substitutions[var.index] = (var.upper, -1.0, None)
+                model.set_variable_bounds(var, 0.0, float('inf'))
+            else:
+                substitutions[var.index] = (0.0, 1.0, model.create_variable(f"{var.name}-").index)
+                model.set_variable_bounds(var, 0.0, float('inf'))
+
+        if len(substitutions) == 0:
+            return substitutions
+
+        def substitute(expression):
+            atoms = []
+            shift = 0.0
+            for atom in expression.atoms:
+                if atom.var.index not in substitutions:
+                    atoms.append(atom)
+                    continue
+                (var_shift, sign, negative) = substitutions[atom.var.index]
+                shift += atom.factor * var_shift
+                atoms.append(a.Atom(model.variables[atom.var.index], sign * atom.factor))
+                if negative is not None:
+                    atoms.append(a.Atom(model.variables[negative], -atom.factor))
+            return (e.Expression(*atoms), shift)
+
+        for constraint in model.constraints:
+            constraint.expression, shift = substitute(constraint.expression)
+            constraint.bound -= shift
+        # the constant shift of the objective is skipped, objective value is always evaluated with the original model
+        model.objective.expression, _ = substitute(model.objective.expression)
+        return substitutions
+
     def _create_presolve_model(self, normalized_model):
-        presolve_model = deepcopy(normalized_model)
+        presolve_model = normalized_model.snapshot()
         self.artificial_variables = self._add_artificial_variables(presolve_model)
         return presolve_model    
 
     def _change_constraints_bounds_to_nonnegative(self, model):
-        for constraint in model.constraints:
+        for (i, constraint) in enumerate(model.constraints):
             if constraint.bound < 0:
                 constraint.invert()
+                self.row_factors[i] *= -1.0
     
     def _add_slack_variables(self, model):
         slack_variables = dict()
@@ -119,51 +858,79 @@ class Solver:
         return artificial_variables
 
     def _presolve_initial_tableaux(self, model):
-        objective_row = np.array([0.0 for _ in model.variables] + [0.0])
+        table = np.zeros((len(model.constraints) + 1, len(model.variables) + 1))
+        mx.constraint_matrix_into(model, table[1:, :-1])
+        table[1:, -1] = mx.rhs_vector(model)
 
+        artificial_rows = list(self.artificial_variables.values())
+        table[0] = -table[1:][artificial_rows].sum(axis=0)
         for var in self.artificial_variables.keys():
-            objective_row[var.index] = 1.0
-
-        table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-
-        for constraint_index in self.artificial_variables.values():
-            constraint = model.constraints[constraint_index]
-            factors_row = np.array(constraint.expression.factors(model) + [constraint.bound])
-            objective_row = objective_row - factors_row
-
-        table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-        return t.Tableaux(model, table)
+            table[0, var.index] += 1.0
+        return t.Tableaux(model, table, self._initial_basis(model, self.artificial_variables), mx.upper_bound_vector(model))
 
     def _basic_initial_tableaux(self, model):
-        objective_row = np.array((-1 * model.objective.expression).factors(model) + [0.0])
-        table = np.array([objective_row] + [c.expression.factors(model) + [c.bound] for c in model.constraints])
-        return t.Tableaux(model, table)
+        table = np.zeros((len(model.constraints) + 1, len(model.variables) + 1))
+        table[0, :-1] = -mx.objective_vector(model)
+        mx.constraint_matrix_into(model, table[1:, :-1])
+        table[1:, -1] = mx.rhs_vector(model)
+        return t.Tableaux(model, table, self._initial_basis(model), mx.upper_bound_vector(model))
+
+    def _initial_basis(self, model, artificial_variables = {}):
+        basis = np.full(len(model.constraints), -1, dtype=int)
+        for (var, row) in list(self.slack_variables.items()) + list(artificial_variables.items()):
+            basis[row] = var.index
+        return basis
 
     def _artifical_variables_are_positive(self, tableaux):
         assignment = tableaux.extract_assignment()
         for artificial_var in self.artificial_variables:
-            if assignment[artificial_var.index] > 0:
+            if assignment[artificial_var.index] > t.eps:
                 return True 
         return False
 
+    def _drive_out_artificial_variables(self, tableaux):
+        """
+            _drive_out_artificial_variables(tableaux: Tableaux):
+                replaces artificial variables left (at zero) in the basis with the original ones using degenerate pivots
+                if the row doesn't contain any original variable, it is redundant and stays without a basic variable
+        """
+        artificial_columns = [var.index for var in self.artificial_variables.keys()]
+        is_original = np.ones(tableaux.table.shape[1] - 1, dtype=bool)
+        is_original[artificial_columns] = False
+        for row in np.where(np.isin(tableaux.basis, artificial_columns))[0]:
+            candidates = np.where(is_original & (np.abs(tableaux.table[row + 1, :-1]) > t.eps))[0]
+            if len(candidates) > 0:
+                tableaux.pivot(row + 1, candidates[0])
+
     def _remove_artificial_variables(self, tableaux):
         columns_to_remove = [var.index for var in self.artificial_variables.keys()]
         table = np.delete(tableaux.table, columns_to_remove, 1)
-        return t.Tableaux(tableaux.model, table)
+
+        # indexes of the remaining columns shift left by the number of removed columns preceding them
+        removed = np.zeros(tableaux.table.shape[1] - 1, dtype=bool)
+        removed[columns_to_remove] = True
+        new_indexes = np.where(removed, -1, np.arange(len(removed)) - np.cumsum(removed))
+        basis = np.where(tableaux.basis >= 0, new_indexes[tableaux.basis], -1)
+        return t.Tableaux(tableaux.model, table, basis, tableaux.upper[~removed], tableaux.complemented[~removed])
 
     def _restore_original_objective_row(self, tableaux, model):
-        objective_row = np.array((-1 * model.objective.expression).factors(model) + [0.0])
+        return self._tableaux_with_costs(tableaux, model, mx.objective_vector(model))
+
+    def _tableaux_with_costs(self, tableaux, model, objective):
         new_table = np.array(tableaux.table)
-        new_table[0] = objective_row
-        return t.Tableaux(model, new_table)
+        # complemented variables (upper - var) contribute with negated factors and a constant
+        complemented = tableaux.complemented
+        new_table[0, :-1] = np.where(complemented, objective, -objective)
+        new_table[0, -1] = objective[complemented] @ tableaux.upper[complemented]
+        return t.Tableaux(model, new_table, tableaux.basis, tableaux.upper, complemented)
 
-    def _fix_objective_row_to_the_basis(self, tableaux, basis):
+    def _fix_objective_row_to_the_basis(self, tableaux):
         objective_row = tableaux.table[0].copy()
 
-        for (constr_index, col) in enumerate(basis):
-            if col >= len(objective_row) - 1:
+        for (constr_index, col) in enumerate(tableaux.basis):
+            if col < 0:
                 continue
-            
+
             row = constr_index + 1
             objective_factor = objective_row[col]
             if objective_factor == 0:
@@ -172,8 +939,17 @@ class Solver:
 
         new_table = np.array(tableaux.table)
         new_table[0] = objective_row
-        return t.Tableaux(tableaux.model, new_table)
+        return t.Tableaux(tableaux.model, new_table, tableaux.basis, tableaux.upper, tableaux.complemented)
 
-    def _create_solution(self, assignment, model, initial_tableaux, tableaux, normal_model):
-        assignment = [assignment[var.index] for var in model.variables]
-        return s.Solution.with_assignment(model, assignment, initial_tableaux, tableaux, normal_model)
+    def _create_solution(self, tableaux, model, initial_tableaux, final_tableaux, normal_model):
+        assignment = tableaux.extract_assignment()
+        assignment = [self._original_value(assignment, var.index) for var in model.variables]
+        return s.Solution.with_assignment(model, assignment, initial_tableaux, final_tableaux, normal_model, b.Basis.from_tableaux(tableaux))
+
+    def _original_value(self, assignment, index):
+        value = assignment[index] * self.column_factors[index]
+        if index not in self.bound_substitutions:
+            return value
+        (shift, sign, negative) = self.bound_substitutions[index]
+        value = shift + sign * value
+        return value if negative is None else value - assignment[negative] * self.column_factors[negative]
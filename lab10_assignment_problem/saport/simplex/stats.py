@@ -0,0 +1,92 @@
+import json
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List
+
+from . import tableaux as t
+
+# stages of the solving, in the order they are performed
+STAGES = ["presolve", "interior point", "normalize", "phase 1", "phase 2", "extraction"]
+
+# operations performed in every simplex iteration
+OPERATIONS = ["pricing", "ratio test", "pivoting"]
+
+
+@dataclass
+class SolverStats:
+    """
+        A class to represent statistics of a single solve collected by the solver (see Solver.collect_stats).
+        Phase 1 lasts until a primal feasible basis is found (the artificial variables phase or the dual simplex),
+        phase 2 is the primal simplex optimizing the feasible basis.
+        The interior point stage is timed only for the interior point method (the simplex stages are then its crossover).
+
+        Attributes
+        ----------
+        pivots : Dict[str, int]
+            number of pivots performed in each phase
+        bound_flips : int
+            number of the bound flips (nonbasic variables moved between their bounds without pivoting)
+        degenerate_pivots : int
+            number of pivots that didn't change the objective value
+        stage_times : Dict[str, float]
+            wall time (in seconds) of every stage (see STAGES)
+        operation_times : Dict[str, float]
+            wall time (in seconds) spent in every operation of the simplex iterations (see OPERATIONS)
+        peak_tableaux_shape : List[int]
+            the biggest number of rows and columns of the tableaux (including the cost row, the rhs and artificial columns)
+        interior_point_iterations : int
+            number of the iterations of the interior point method (if it was used)
+
+        Methods
+        -------
+        start_stage(stage: str | None):
+            finishes timing the current stage and starts timing the given one (None just finishes the current one)
+        lap(operation: str, start: float) -> float:
+            adds time passed since the start to the given operation, returns the current time
+        record_pivot(cost_before: float, cost_after: float):
+            counts a pivot of the current phase, detecting degenerate ones
+        record_tableaux(tableaux: Tableaux | RevisedTableaux):
+            updates the peak tableaux shape
+        to_dict() -> dict:
+            returns the statistics as a dictionary
+        to_json() -> str:
+            returns the statistics serialized to JSON
+    """
+    pivots: Dict[str, int] = field(default_factory=lambda: {"phase 1": 0, "phase 2": 0})
+    bound_flips: int = 0
+    degenerate_pivots: int = 0
+    stage_times: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(STAGES, 0.0))
+    operation_times: Dict[str, float] = field(default_factory=lambda: dict.fromkeys(OPERATIONS, 0.0))
+    peak_tableaux_shape: List[int] = field(default_factory=lambda: [0, 0])
+    interior_point_iterations: int = 0
+
+    def __post_init__(self):
+        self._stage = None
+        self._stage_start = 0.0
+
+    def start_stage(self, stage):
+        now = time.perf_counter()
+        if self._stage is not None:
+            self.stage_times[self._stage] += now - self._stage_start
+        self._stage = stage
+        self._stage_start = now
+
+    def lap(self, operation, start):
+        now = time.perf_counter()
+        self.operation_times[operation] += now - start
+        return now
+
+    def record_pivot(self, cost_before, cost_after):
+        self.pivots[self._stage] += 1
+        if abs(cost_after - cost_before) <= t.eps * (1.0 + abs(cost_before)):
+            self.degenerate_pivots += 1
+
+    def record_tableaux(self, tableaux):
+        shape = (len(tableaux.basis) + 1, len(tableaux.upper) + 1)
+        self.peak_tableaux_shape = [max(peak, size) for (peak, size) in zip(self.peak_tableaux_shape, shape)]
+
+    def to_dict(self):
+        return asdict(self)
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
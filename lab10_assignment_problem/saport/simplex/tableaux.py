@@ -14,11 +14,23 @@ class Tableaux:
             model corresponding to the tableaux
         table : numpy.Array
             2d-array with the tableaux
+        basis : numpy.Array
+            indexes of the basic variables, basis[i] is the variable corresponding to the row i + 1 of the table
+            (-1 marks a redundant row without any basic variable), it's updated by every pivot
+        upper : numpy.Array
+            upper bounds of the variables (inf if the variable is bounded only from below by 0)
+        complemented : numpy.Array
+            mask of the variables replaced by their complements (upper - var), i.e. the nonbasic ones being at the upper bound,
+            columns of such variables are negated and the right-hand side is shifted accordingly
 
         Methods
         -------
-        __init__(model: Model, table: array) -> Tableaux:
-            constructs a new tableaux for the specified model and initial table
+        __init__(model: Model, table: array, basis: array | None = None, upper: array | None = None, complemented: array | None = None) -> Tableaux:
+            constructs a new tableaux for the specified model, initial table and basis
+            if the basis is not given, it's found by scanning the table for unit columns
+            if the upper bounds are not given, all variables are bounded only from below
+        copy() -> Tableaux:
+            returns a copy of the tableaux (arrays are copied, the model is shared)
         cost_factors() -> numpy.Array:
             returns a vector containing factors in the cost row
         cost() -> float:
@@ -29,19 +41,56 @@ class Tableaux:
             finds index of the variable, that should enter the basis next
         is_unbounded(col: int) -> bool:
             checks whether the problem is unbounded
+        quotients(col: int) -> numpy.Array:
+            returns ratios of the bounded ratio test for the given column (inf for the rows not limiting the entering variable),
+            i.e. right-hand sides divided by the positive factors or distances to the upper bounds divided by the negated negative factors
+        flips_bound(col: int) -> bool:
+            checks whether the entering variable reaches its own upper bound before any basic variable reaches its bound
+        flip_bound(col: int):
+            moves the nonbasic variable to the opposite bound by complementing it
         choose_leaving_variable(col: int) -> int:
             finds index of the variable, that should leave the basis next
         pivot(col: int, row: int):
             updates tableaux using pivot operation with given entering and leaving variables
+        leaves_at_upper(row: int, col: int) -> bool:
+            checks whether the basic variable of the row leaves at its upper bound when the given column enters (primal simplex)
+        basic_values() -> numpy.Array:
+            returns values of the basic variables (the right-hand side without the cost row)
+        basic_upper() -> numpy.Array:
+            returns upper bounds of the basic variables (inf for the rows without any basic variable)
+        complement_basic(row: int):
+            replaces the basic variable of the given row with its complement (upper - var)
         extract_assignment() -> list[float]:
             returns assignment corresponding to the tableaux
         extract_basis() -> list[int]
             returns list of indexes corresponding to the variables belonging to the basis
+        column(col: int) -> numpy.Array:
+            returns the column of the given variable (without the cost row)
+        row(row: int) -> numpy.Array:
+            returns the given row of the table (without the right-hand side), rows are indexed like in pivot
+        project(vector: numpy.Array) -> numpy.Array:
+            returns dot products of the given vector with every column (without the cost row)
+        squared_column_norms() -> numpy.Array:
+            returns squared norms of all the columns (without the cost row)
     """
 
-    def __init__(self, model, table):
+    def __init__(self, model, table, basis = None, upper = None, complemented = None):
         self.model = model
-        self.table = table
+        self.table = np.asarray(table, dtype=float)
+        self.basis = self._find_basis() if basis is None else np.array(basis, dtype=int)
+        columns_n = self.table.shape[1] - 1
+        self.upper = np.full(columns_n, np.inf) if upper is None else np.array(upper, dtype=float)
+        self.complemented = np.zeros(columns_n, dtype=bool) if complemented is None else np.array(complemented, dtype=bool)
+        self._buffer = None
+
+    def __getstate__(self):
+        # the pivot buffer is scratch space, there is no point in copying it along with the tableaux
+        state = self.__dict__.copy()
+        state['_buffer'] = None
+        return state
+
+    def copy(self):
+        return Tableaux(self.model, self.table.copy(), self.basis, self.upper, self.complemented)
 
     def cost_factors(self):
         return self.table[0,:-1] 
@@ -56,57 +105,101 @@ class Tableaux:
         return self.cost_factors().argmin()
 
     def is_unbounded(self, col):
-        return self.table[1:, col].max() <= 0 
+        return self.upper[col] == np.inf and np.isinf(self.quotients(col)).all()
+
+    def quotients(self, col):
+        column = self.table[1:, col]
+        rhs = self.table[1:, -1]
+        basic_upper = self.basic_upper()
+        quotients = np.full(len(column), np.inf)
+        decreasing = column > eps
+        quotients[decreasing] = rhs[decreasing] / column[decreasing]
+        increasing = (column < -eps) & (basic_upper < np.inf)
+        quotients[increasing] = (basic_upper[increasing] - rhs[increasing]) / -column[increasing]
+        return quotients
+
+    def flips_bound(self, col):
+        return self.upper[col] <= self.quotients(col).min(initial=np.inf)
+
+    def flip_bound(self, col):
+        self.table[:, -1] -= self.upper[col] * self.table[:, col]
+        self.table[:, col] *= -1.0
+        self.complemented[col] = ~self.complemented[col]
 
     def choose_leaving_variable(self, col):
-        column = np.copy(self.table[1:, col])
-        column = np.where(column > 0, column, -1)
-        indicators = self.table[1:, -1] / column
-        quotients = np.where(column > 0, indicators, np.inf)
+        quotients = self.quotients(col)
         index = len(quotients) - np.argmin(quotients[::-1])
 
         return index
 
+    def leaves_at_upper(self, row, col):
+        leaving = self.basis[row - 1]
+        return self.table[row, col] < 0 and leaving >= 0 and self.upper[leaving] < np.inf
+
+    def basic_values(self):
+        return self.table[1:, -1]
+
+    def basic_upper(self):
+        return np.where(self.basis >= 0, self.upper[self.basis], np.inf)
+
+    def complement_basic(self, row):
+        col = self.basis[row - 1]
+        # var + a * x = b becomes (upper - var) - a * x = upper - b
+        self.table[row, -1] -= self.upper[col]
+        self.table[row] *= -1.0
+        self.table[row, col] = 1.0
+        self.complemented[col] = ~self.complemented[col]
+
+    def column(self, col):
+        return self.table[1:, col]
+
+    def row(self, row):
+        return self.table[row, :-1]
+
+    def project(self, vector):
+        return self.table[1:, :-1].T @ vector
+
+    def squared_column_norms(self):
+        return (self.table[1:, :-1] ** 2).sum(axis=0)
+
     def pivot(self, row, col):
-        rows_n, cols_n = self.table.shape
-        pivot_factor = self.table[row, col]
+        # the elimination is a single rank-1 update done in place: table -= column x pivot_row,
+        # the outer product is written into a buffer allocated once per tableaux shape
+        pivot_row = self.table[row]
+        pivot_row /= pivot_row[col]
 
-        new_table = self.table.copy()
-        new_table[row] = self.table[row] / pivot_factor
+        column = self.table[:, col].copy()
+        column[row] = 0.0
 
-        new_table[:, col] = 0.0
-        new_table[row, col] = 1.0
-        
-        for r in range(rows_n):
-            if r == row:
-                continue
-            for c in range(cols_n):
-                if c == col:
-                    continue 
-                new_table[r,c] = (-self.table[r, col]) * new_table[row, c] + self.table[r,c]
+        if self._buffer is None or self._buffer.shape != self.table.shape:
+            self._buffer = np.empty_like(self.table)
+        np.multiply.outer(column, pivot_row, out=self._buffer)
+        self.table -= self._buffer
 
-        self.table = new_table
+        self.table[:, col] = 0.0
+        self.table[row, col] = 1.0
+        self.basis[row - 1] = col
 
     def extract_assignment(self):
-        rows_n, cols_n = self.table.shape
-        assignment = [0.0 for _ in range(cols_n - 1)]
-        basis = self.extract_basis()
-        for r in range(1, rows_n):
-            var_index = basis[r - 1]
-            assignment[var_index] = self.table[r, -1]
-        
-        return assignment
-    
+        assignment = np.zeros(self.table.shape[1] - 1)
+        rows_with_basis = self.basis >= 0
+        assignment[self.basis[rows_with_basis]] = self.table[1:, -1][rows_with_basis]
+        assignment[self.complemented] = self.upper[self.complemented] - assignment[self.complemented]
+        return assignment.tolist()
+
     def extract_basis(self):
-        rows_n, cols_n = self.table.shape
-        basis = [-1 for _ in range(rows_n -1)]
-        for c in range(cols_n - 1):
-            column = self.table[:,c]
-            belongs_to_basis = column.min() == 0.0 and column.max() == 1.0 and column.sum() == 1.0
-            if belongs_to_basis:
-                row = np.where(column == 1.0)[0][0]
-                # [row-1] because we ignore the cost variable in the basis
-                basis[row-1] = c
+        return self.basis.tolist()
+
+    def _find_basis(self):
+        basis = np.full(self.table.shape[0] - 1, -1, dtype=int)
+        body = self.table[:, :-1]
+        is_unit = (np.abs(body) <= eps).sum(axis=0) == body.shape[0] - 1
+        is_unit &= (np.abs(body - 1.0) <= eps).sum(axis=0) == 1
+        for c in np.where(is_unit)[0]:
+            row = np.argmax(body[:, c])
+            # [row-1] because we ignore the cost variable in the basis
+            if row > 0:
+                basis[row - 1] = c
         return basis
 
     def __str__(self):
@@ -114,11 +207,10 @@ class Tableaux:
             return '{0: >{1}}'.format(x, w)
 
         cost_name = self.model.objective.name()
-        basis = self.extract_basis()
         header = ["basis", cost_name] + [var.name for var in self.model.variables] + ["b"]
         longest_col = max([len(h) for h in header])
 
-        rows = [[cost_name]] + [[self.model.variables[i].name] for i in basis]
+        rows = [[cost_name]] + [[self.model.variables[i].name if i >= 0 else "-"] for i in self.basis]
 
         for (i,r) in enumerate(rows):
             cost_factor = 0.0 if i > 0 else 1.0
@@ -0,0 +1,45 @@
+import time
+import tracemalloc
+from saport.knapsack.model import Problem
+from saport.knapsack.solvers.integer import IntegerSolver
+from saport.simplex.expressions.expression import Expression
+from saport.simplex.expressions.constraint import Constraint
+
+# counts objects of the expression graph (expressions, atoms, variables and constraints) created
+# while solving knapsack problems with the integer programming solver (branch and bound over simplex relaxations),
+# objects cloned by copy.deepcopy are counted as well, since deepcopy creates them with cls.__new__
+
+problems = ["ks_lecture_dp_1", "ks_lecture_dp_2", "ks_4_0", "ks_19_0"]
+timelimit = 60
+
+
+class AllocationCounter:
+
+    def __init__(self, classes):
+        self.classes = classes
+        self.count = 0
+
+    def __enter__(self):
+        def counting_new(cls, *args, **kwargs):
+            self.count += 1
+            return object.__new__(cls)
+        for cls in self.classes:
+            cls.__new__ = counting_new
+        return self
+
+    def __exit__(self, *args):
+        for cls in self.classes:
+            del cls.__new__
+
+
+for p in problems:
+    problem = Problem.from_path(f"tests/knapsack/knapsack_problems/{p}")
+    solver = IntegerSolver(problem, timelimit)
+    tracemalloc.start()
+    with AllocationCounter([Expression, Constraint]) as counter:
+        start = time.perf_counter()
+        solution = solver.solve()
+        elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"* {p}: value {solution.value}, {counter.count} expression graph objects created, peak memory {peak / 1024:.0f} KiB, {elapsed:.2f}s")
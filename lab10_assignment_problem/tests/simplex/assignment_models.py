@@ -0,0 +1,19 @@
+import numpy as np
+import scipy.sparse as sp
+from saport.simplex.model import Model
+
+# assignment linear programs shared by the examples and the benchmarks:
+# n*n variables bounded by 1 and 2n equality rows (every worker does one task, every task is done by one worker)
+
+
+def create_assignment_model(n, seed = 0):
+    rng = np.random.default_rng(seed)
+    costs = rng.integers(1, 100, (n, n))
+    model = Model(f"assignment_{n}x{n}")
+    model.create_variables("x", n * n, upper=1.0)
+    (workers, tasks) = np.divmod(np.arange(n * n), n)
+    ones = np.ones(n * n)
+    A = sp.vstack([sp.csr_matrix((ones, (workers, np.arange(n * n)))), sp.csr_matrix((ones, (tasks, np.arange(n * n))))], format='csr')
+    model.add_constraints_from_matrix(A, np.ones(2 * n), "=")
+    model.set_objective_vector(costs.flatten().astype(float), "min")
+    return model
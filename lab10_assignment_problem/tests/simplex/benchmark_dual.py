@@ -0,0 +1,54 @@
+import time
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.revised import RevisedSolver
+from saport.simplex.expressions.expression import Expression
+from saport.minimax.model import Game
+from saport.minimax.solvers.mixed import MixedSolver
+
+# compares the two-phase primal simplex with the dual simplex on the lab examples (mixed strategies of the minimax games)
+# and on generated covering problems (min c*x, A*x >= b, with nonnegative A and c)
+
+GAMES = ["tests/minimax/games/3_3_mixed_neg.txt", "tests/minimax/games/3_3_mixed_nonneg.txt", "tests/minimax/games/4_5_pure.txt"]
+COVERING_SIZES = [(20, 40), (60, 120), (150, 300)]
+
+
+def create_covering_model(rows_n, columns_n, seed = 0):
+    rng = np.random.default_rng(seed)
+    model = Model(f"covering_{rows_n}x{columns_n}")
+    xs = [model.create_variable(f"x{i}") for i in range(columns_n)]
+    for _ in range(rows_n):
+        factors = rng.integers(0, 10, columns_n) * (rng.random(columns_n) < 0.3)
+        model.add_constraint(Expression.from_vectors(xs, factors) >= float(rng.integers(10, 50)))
+    model.minimize(Expression.from_vectors(xs, rng.integers(1, 20, columns_n)))
+    return model
+
+
+def lab_models():
+    models = []
+    for path in GAMES:
+        solver = MixedSolver(Game.from_file(path))
+        shifted_game, _ = solver.shift_game_rewards()
+        models += [solver.create_max_model(shifted_game), solver.create_min_model(shifted_game)]
+    return models
+
+
+def run():
+    models = lab_models() + [create_covering_model(rows_n, columns_n) for (rows_n, columns_n) in COVERING_SIZES]
+    for model in models:
+        print(f"- {model.name} ({len(model.constraints)}x{len(model.variables)}):")
+        for (method, solver_class) in [("tableaux", Solver), ("revised", RevisedSolver)]:
+            objectives = []
+            for algorithm in ["primal", "dual"]:
+                solver = solver_class(algorithm=algorithm)
+                start = time.perf_counter()
+                solution = solver.solve(model)
+                elapsed = time.perf_counter() - start
+                objectives.append(solution.objective_value())
+                print(f"* {method}, {algorithm}: {solver.iterations} iterations, {elapsed:.3f}s")
+            assert abs(objectives[0] - objectives[1]) <= 1e-6 * max(1.0, abs(objectives[0])), "dual simplex found a different optimum"
+
+
+if __name__ == '__main__':
+    run()
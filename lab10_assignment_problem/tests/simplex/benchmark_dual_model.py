@@ -0,0 +1,36 @@
+import time
+import numpy as np
+import scipy.sparse as sp
+from saport.simplex.model import Model
+
+# measures building the dual of big sparse models with mixed constraints and bounded variables
+# (the constraint matrix is transposed as a whole, atoms of the dual expressions are never created)
+
+SIZES = [1000, 3000, 10000]
+DENSITY = 0.001
+
+
+def create_model(size, seed = 0):
+    rng = np.random.default_rng(seed)
+    model = Model(f"random_{size}x{size}")
+    model.create_variables("x", size, upper=10.0)
+    A = sp.random(size, size, density=DENSITY, random_state=rng, format='csr')
+    model.add_constraints_from_matrix(A, rng.integers(1, 100, size).astype(float), rng.choice(["<=", ">=", "="], size, p=[0.6, 0.2, 0.2]))
+    model.set_objective_vector(rng.integers(1, 20, size).astype(float), "max")
+    return model
+
+
+def run():
+    for size in SIZES:
+        start = time.perf_counter()
+        model = create_model(size)
+        built = time.perf_counter()
+        dual = model.dual()
+        dualized = time.perf_counter()
+        double_dual = dual.dual()
+        end = time.perf_counter()
+        print(f"- {model.name}: model built in {built - start:.3f}s, dual ({len(dual.constraints)}x{len(dual.variables)}) in {dualized - built:.3f}s, double dual in {end - dualized:.3f}s")
+
+
+if __name__ == '__main__':
+    run()
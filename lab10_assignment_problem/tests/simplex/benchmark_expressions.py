@@ -0,0 +1,43 @@
+import time
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.expressions.expression import Expression
+from saport.simplex.expressions.builder import LinearExpressionBuilder
+
+# compares building an objective term by term with the repeated `expression += term`
+# (copying all the atoms collected so far, quadratic) and with the LinearExpressionBuilder (linear)
+
+BUILDER_SIZES = [1000, 10000, 100000]
+NAIVE_SIZES = [1000, 5000, 10000]
+
+
+def build_naively(xs, costs):
+    expression = Expression()
+    for (x, cost) in zip(xs, costs):
+        expression += x * cost
+    return expression
+
+
+def build_with_builder(xs, costs):
+    builder = LinearExpressionBuilder()
+    for (x, cost) in zip(xs, costs):
+        builder.add(x, cost)
+    return builder.build()
+
+
+def run():
+    rng = np.random.default_rng(0)
+    for (name, build, sizes) in [("naive +=", build_naively, NAIVE_SIZES), ("builder", build_with_builder, BUILDER_SIZES)]:
+        for size in sizes:
+            model = Model(f"objective_{size}")
+            xs = [model.create_variable(f"x{i}") for i in range(size)]
+            costs = rng.integers(1, 100, size).tolist()
+            start = time.perf_counter()
+            expression = build(xs, costs)
+            elapsed = time.perf_counter() - start
+            assert len(expression.atoms) == size, "expression has an incorrect number of atoms"
+            print(f"* {name}, {size} terms: {elapsed:.3f}s")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,49 @@
+import time
+import numpy as np
+import scipy.sparse as sp
+from saport.simplex.model import Model
+from tests.simplex.assignment_models import create_assignment_model
+
+# compares the simplex with the interior point method (and its crossover) on the models built like by the maxflow and assignment solvers:
+# the interior point method needs a few tens of iterations regardless of the size, but the crossover of the maxflow models is expensive,
+# most of their flows are strictly between the bounds in the middle of the (huge) optimal face and have to be pushed to the bounds one by one
+
+MAXFLOW_NODES = [500, 2000]
+ASSIGNMENT_SIZES = [40, 70]
+EDGES_PER_NODE = 4
+
+
+def create_maxflow_model(nodes_n, seed = 0):
+    rng = np.random.default_rng(seed)
+    # node 0 is the source, the last one is the sink
+    edges = set(zip(rng.integers(0, nodes_n - 1, EDGES_PER_NODE * nodes_n).tolist(), rng.integers(1, nodes_n, EDGES_PER_NODE * nodes_n).tolist()))
+    edges = sorted((u, v) for (u, v) in edges if u != v)
+    (starts, ends) = (np.array([u for (u, _) in edges]), np.array([v for (_, v) in edges]))
+    model = Model(f"maxflow_{nodes_n}")
+    for (i, capacity) in enumerate(rng.integers(1, 50, len(edges))):
+        model.create_variable(f"f{i}", upper=float(capacity))
+    # flow conservation for the inner nodes: inflows - outflows == 0
+    inner = (np.concatenate([ends, starts]) > 0) & (np.concatenate([ends, starts]) < nodes_n - 1)
+    rows = np.concatenate([ends, starts])[inner] - 1
+    cols = np.tile(np.arange(len(edges)), 2)[inner]
+    factors = np.concatenate([np.ones(len(edges)), -np.ones(len(edges))])[inner]
+    model.add_constraints_from_matrix(sp.csr_matrix((factors, (rows, cols)), shape=(nodes_n - 2, len(edges))), np.zeros(nodes_n - 2), "=")
+    model.set_objective_vector((starts == 0).astype(float), "max")
+    return model
+
+
+def run():
+    models = [create_maxflow_model(nodes_n) for nodes_n in MAXFLOW_NODES] + [create_assignment_model(size) for size in ASSIGNMENT_SIZES]
+    for model in models:
+        print(f"- {model.name} ({len(model.constraints)}x{len(model.variables)}):")
+        for method in ["auto", "ipm"]:
+            start = time.perf_counter()
+            solution = model.solve(method, collect_stats=True)
+            stats = solution.stats
+            print(f"\t* {method}: {time.perf_counter() - start:.3f}s, objective {solution.objective_value():.1f}, "
+                  f"{stats.interior_point_iterations} interior point iterations ({stats.stage_times['interior point']:.3f}s), "
+                  f"{sum(stats.pivots.values())} pivots, {stats.bound_flips} bound flips")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,38 @@
+import time
+import tracemalloc
+import numpy as np
+from saport.simplex.model import Model
+
+# compares memory held by a batch of solutions (e.g. relaxations kept by a search) with and without their tableaux
+
+BATCH_SIZE = 200
+ROWS = 40
+COLUMNS = 60
+
+
+def create_model(seed):
+    rng = np.random.default_rng(seed)
+    model = Model(f"random_{seed}")
+    model.create_variables("x", COLUMNS, upper=10.0)
+    model.add_constraints_from_matrix(rng.integers(0, 10, (ROWS, COLUMNS)).astype(float), rng.integers(50, 500, ROWS).astype(float), "<=")
+    model.set_objective_vector(rng.integers(1, 20, COLUMNS).astype(float), "max")
+    return model
+
+
+def run():
+    models = [create_model(seed) for seed in range(BATCH_SIZE)]
+    print(f"- {BATCH_SIZE} models ({ROWS}x{COLUMNS}):")
+    for method in ["tableaux", "revised"]:
+        for keep_tableaux in [True, False]:
+            tracemalloc.start()
+            start = time.perf_counter()
+            solutions = [model.solve(method, keep_tableaux=keep_tableaux) for model in models]
+            elapsed = time.perf_counter() - start
+            held, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"* {method}, keep_tableaux={keep_tableaux}: {held / 2**20:.1f} MiB held, {elapsed:.2f}s")
+            del solutions
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,49 @@
+import time
+import numpy as np
+import scipy.sparse as sp
+from saport.simplex.model import Model
+
+# compares solving a transportation problem for many cost matrices one by one and in a batch (see Model.solve_objectives),
+# equality rows make every independent solve go through the first phase
+
+SIZES = [(10, 15), (15, 20), (20, 30)]
+OBJECTIVES = 30
+
+
+def create_transportation_model(suppliers_n, customers_n, seed = 0):
+    rng = np.random.default_rng(seed)
+    supply = rng.integers(10, 50, suppliers_n).astype(float)
+    demand = rng.multinomial(int(supply.sum()), np.ones(customers_n) / customers_n).astype(float)
+    model = Model(f"transportation_{suppliers_n}x{customers_n}")
+    model.create_variables("x", suppliers_n * customers_n)
+    supply_rows = sp.kron(sp.identity(suppliers_n), np.ones((1, customers_n)), format='csr')
+    demand_rows = sp.kron(np.ones((1, suppliers_n)), sp.identity(customers_n), format='csr')
+    model.add_constraints_from_matrix(supply_rows, supply, "=")
+    model.add_constraints_from_matrix(demand_rows, demand, "=")
+    costs = rng.integers(1, 30, (OBJECTIVES, suppliers_n * customers_n)).astype(float)
+    return model, costs
+
+
+def run():
+    for (suppliers_n, customers_n) in SIZES:
+        model, costs = create_transportation_model(suppliers_n, customers_n)
+        print(f"- {model.name} ({len(model.constraints)}x{len(model.variables)}), {len(costs)} objectives:")
+
+        start = time.perf_counter()
+        independent = []
+        for objective in costs:
+            objective_model = model.snapshot()
+            objective_model.set_objective_vector(objective, "min")
+            independent.append(objective_model.solve(keep_tableaux=False).objective_value())
+        independent_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = [solution.objective_value() for solution in model.solve_objectives(costs, "min")]
+        batch_time = time.perf_counter() - start
+
+        print(f"* independent solves: {independent_time:.3f}s, batch: {batch_time:.3f}s ({independent_time / batch_time:.1f}x faster)")
+        assert np.allclose(independent, batch), "batch solve returned different optima"
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,58 @@
+import time
+import numpy as np
+from saport.simplex.tableaux import Tableaux
+
+# compares the in-place rank-1 pivot with the former cell-by-cell implementation
+# on randomly generated 500x1000 tableaux, checking that both produce the same iterates
+
+ROWS, COLS = 500, 1000
+PIVOTS = 3
+
+
+def legacy_pivot(table, row, col):
+    rows_n, cols_n = table.shape
+    pivot_factor = table[row, col]
+
+    new_table = table.copy()
+    new_table[row] = table[row] / pivot_factor
+
+    new_table[:, col] = 0.0
+    new_table[row, col] = 1.0
+
+    for r in range(rows_n):
+        if r == row:
+            continue
+        for c in range(cols_n):
+            if c == col:
+                continue
+            new_table[r, c] = (-table[r, col]) * new_table[row, c] + table[r, c]
+    return new_table
+
+
+def run():
+    rng = np.random.default_rng(0)
+    table = rng.uniform(0.1, 10.0, (ROWS + 1, COLS + 1))
+    pivots = [(int(rng.integers(1, ROWS + 1)), int(rng.integers(0, COLS))) for _ in range(PIVOTS)]
+
+    legacy_table = table.copy()
+    start = time.perf_counter()
+    for (row, col) in pivots:
+        legacy_table = legacy_pivot(legacy_table, row, col)
+    legacy_time = (time.perf_counter() - start) / PIVOTS
+
+    tableaux = Tableaux(None, table.copy())
+    start = time.perf_counter()
+    for (row, col) in pivots:
+        tableaux.pivot(row, col)
+    new_time = (time.perf_counter() - start) / PIVOTS
+
+    assert np.array_equal(legacy_table, tableaux.table), "in-place pivot produced different iterates"
+
+    print(f"- tableaux size: {ROWS + 1}x{COLS + 1}, pivots: {PIVOTS}")
+    print(f"* cell-by-cell pivot: {legacy_time * 1000:.3f}ms per pivot")
+    print(f"* in-place rank-1 pivot: {new_time * 1000:.3f}ms per pivot")
+    print(f"* speedup: {legacy_time / new_time:.1f}x")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,50 @@
+import time
+import numpy as np
+import scipy.sparse as sp
+from saport.simplex.model import Model
+
+# compares solving with and without the presolve on maximum flow LPs over random layered networks,
+# written the way they are usually generated: capacities as singleton rows (f <= capacity)
+# and flow conservation as equality rows (nodes with a single edge make some of them singletons too)
+
+SIZES = [(4, 5), (6, 10), (8, 15)]
+
+
+def create_maxflow_model(layers_n, width, seed = 0):
+    rng = np.random.default_rng(seed)
+    layers = [[0]] + [list(range(1 + i * width, 1 + (i + 1) * width)) for i in range(layers_n)] + [[1 + layers_n * width]]
+    edges = [(u, v) for (layer, next_layer) in zip(layers, layers[1:]) for u in layer for v in next_layer if rng.random() < 0.5 or len(layer) == 1 or len(next_layer) == 1]
+    model = Model(f"maxflow_{layers_n}x{width}")
+    model.create_variables("f", len(edges))
+    capacities = rng.integers(1, 20, len(edges)).astype(float)
+    model.add_constraints_from_matrix(sp.identity(len(edges), format='csr'), capacities, "<=")
+
+    inner_nodes = [u for layer in layers[1:-1] for u in layer]
+    node_rows = {u: row for (row, u) in enumerate(inner_nodes)}
+    entries = [(node_rows[v], col, 1.0) for (col, (_, v)) in enumerate(edges) if v in node_rows]
+    entries += [(node_rows[u], col, -1.0) for (col, (u, _)) in enumerate(edges) if u in node_rows]
+    (rows, cols, factors) = zip(*entries)
+    conservation = sp.csr_matrix((factors, (rows, cols)), shape=(len(inner_nodes), len(edges)))
+    model.add_constraints_from_matrix(conservation, np.zeros(len(inner_nodes)), "=")
+    model.set_objective_vector([1.0 if u == 0 else 0.0 for (u, _) in edges], "max")
+    return model
+
+
+def run():
+    for (layers_n, width) in SIZES:
+        model = create_maxflow_model(layers_n, width)
+        print(f"- {model.name} ({len(model.constraints)}x{len(model.variables)}):")
+        objectives = []
+        for presolve in [False, True]:
+            start = time.perf_counter()
+            solution = model.solve(presolve=presolve)
+            elapsed = time.perf_counter() - start
+            objectives.append(solution.objective_value())
+            reduced = solution.normal_model
+            report = "" if solution.presolve_report is None else f", removed {solution.presolve_report.rows_removed} rows and {solution.presolve_report.columns_removed} columns"
+            print(f"* presolve {'on' if presolve else 'off'}: normal model {len(reduced.constraints)}x{len(reduced.variables)}{report}, {elapsed:.3f}s")
+        assert abs(objectives[0] - objectives[1]) <= 1e-6 * max(1.0, abs(objectives[0])), "presolved model has a different optimum"
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,53 @@
+import time
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.revised import RevisedSolver
+from saport.simplex.pricing import PricingRule
+from saport.simplex.expressions.expression import Expression
+
+# compares number of pivots and time of the pricing rules on degenerate (assignment) and wide (random) models
+
+RULES = ["dantzig", "bland", "partial", "devex", "steepest_edge"]
+
+
+def create_assignment_model(n, seed = 0):
+    rng = np.random.default_rng(seed)
+    costs = rng.integers(1, 100, (n, n))
+    model = Model(f"assignment_{n}x{n}")
+    xs = [[model.create_variable(f"x{i}_{j}") for j in range(n)] for i in range(n)]
+    for i in range(n):
+        model.add_constraint(Expression.from_vectors(xs[i], np.ones(n)) == 1)
+        model.add_constraint(Expression.from_vectors([row[i] for row in xs], np.ones(n)) == 1)
+    model.minimize(Expression.from_vectors([x for row in xs for x in row], costs.flatten()))
+    return model
+
+
+def create_wide_model(rows_n, columns_n, seed = 0):
+    rng = np.random.default_rng(seed)
+    model = Model(f"wide_{rows_n}x{columns_n}")
+    xs = [model.create_variable(f"x{i}") for i in range(columns_n)]
+    for _ in range(rows_n):
+        model.add_constraint(Expression.from_vectors(xs, rng.uniform(1.0, 10.0, columns_n)) <= float(rng.uniform(100.0, 1000.0)))
+    model.maximize(Expression.from_vectors(xs, rng.uniform(1.0, 10.0, columns_n)))
+    return model
+
+
+def run():
+    models = [create_assignment_model(10), create_assignment_model(20), create_wide_model(50, 1000), create_wide_model(100, 3000)]
+    for model in models:
+        print(f"- {model.name}:")
+        for (method, solver_class) in [("tableaux", Solver), ("revised", RevisedSolver)]:
+            objectives = []
+            for rule in RULES:
+                solver = solver_class(PricingRule.create(rule))
+                start = time.perf_counter()
+                solution = solver.solve(model)
+                elapsed = time.perf_counter() - start
+                objectives.append(solution.objective_value())
+                print(f"* {method}, {rule}: {solver.iterations} pivots, {elapsed:.3f}s")
+            assert max(objectives) - min(objectives) <= 1e-6 * max(1.0, abs(objectives[0])), "pricing rules found different optima"
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,37 @@
+import time
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.expressions.expression import Expression
+
+# compares the tableaux and the revised simplex on wide models (many more columns than rows)
+
+SIZES = [(20, 500), (50, 2000), (100, 4000)]
+
+
+def create_model(rows_n, columns_n, seed = 0):
+    rng = np.random.default_rng(seed)
+    model = Model(f"wide_{rows_n}x{columns_n}")
+    xs = [model.create_variable(f"x{i}") for i in range(columns_n)]
+    for _ in range(rows_n):
+        model.add_constraint(Expression.from_vectors(xs, rng.uniform(1.0, 10.0, columns_n)) <= float(rng.uniform(100.0, 1000.0)))
+    model.maximize(Expression.from_vectors(xs, rng.uniform(1.0, 10.0, columns_n)))
+    return model
+
+
+def run():
+    for (rows_n, columns_n) in SIZES:
+        model = create_model(rows_n, columns_n)
+        results = []
+        for method in ["tableaux", "revised"]:
+            start = time.perf_counter()
+            solution = model.solve(method)
+            results.append((solution.objective_value(), time.perf_counter() - start))
+
+        assert abs(results[0][0] - results[1][0]) <= 1e-6 * abs(results[0][0]), "revised simplex found a different optimum"
+        print(f"- {rows_n}x{columns_n}: objective {results[0][0]:.3f}")
+        print(f"* tableaux: {results[0][1]:.3f}s")
+        print(f"* revised: {results[1][1]:.3f}s")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,57 @@
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.revised import RevisedSolver
+from saport.knapsack.model import Problem
+
+# compares pivot counts of the solvers with and without scaling on badly scaled models:
+# multidimensional knapsack relaxations (weights of the knapsack problems in tens of thousands, with the item bounds x <= 1 as rows)
+# and random LPs with rows and columns multiplied by factors spanning several orders of magnitude
+
+KNAPSACK_PROBLEMS = ["ks_40_0", "ks_100_0", "ks_200_0"]
+RANDOM_SIZES = [(20, 30), (50, 80), (100, 150)]
+SCALINGS = ["none", "geometric", "equilibration"]
+
+
+def create_knapsack_model(name, dimensions = 5, seed = 0):
+    rng = np.random.default_rng(seed)
+    problem = Problem.from_path(f"tests/knapsack/knapsack_problems/{name}")
+    weights = np.array([item.weight for item in problem.items], dtype=float)
+    model = Model(f"{name}_relaxation")
+    model.create_variables("x", len(weights))
+    # other dimensions perturb the weights, the capacities keep the same proportions
+    A = np.vstack([weights * rng.uniform(0.5, 1.5, len(weights)) for _ in range(dimensions)] + [np.identity(len(weights))])
+    b = np.concatenate([np.full(dimensions, float(problem.capacity)), np.ones(len(weights))])
+    model.add_constraints_from_matrix(A, b, "<=")
+    model.set_objective_vector([item.value for item in problem.items], "max")
+    return model
+
+
+def create_random_model(rows_n, columns_n, seed = 0):
+    rng = np.random.default_rng(seed)
+    A = rng.uniform(0.1, 10.0, (rows_n, columns_n)) * (rng.random((rows_n, columns_n)) < 0.4)
+    row_magnitudes = 10.0 ** rng.integers(-3, 4, rows_n)
+    column_magnitudes = 10.0 ** rng.integers(-3, 4, columns_n)
+    model = Model(f"random_{rows_n}x{columns_n}")
+    model.create_variables("x", columns_n)
+    model.add_constraints_from_matrix(A * row_magnitudes[:, None] * column_magnitudes[None, :], rng.uniform(1.0, 100.0, rows_n) * row_magnitudes, "<=")
+    model.set_objective_vector(rng.uniform(1.0, 10.0, columns_n) * column_magnitudes, "max")
+    return model
+
+
+def run():
+    models = [create_knapsack_model(name) for name in KNAPSACK_PROBLEMS] + [create_random_model(rows_n, columns_n) for (rows_n, columns_n) in RANDOM_SIZES]
+    for model in models:
+        print(f"- {model.name} ({len(model.constraints)}x{len(model.variables)}):")
+        for (method, solver_class) in [("tableaux", Solver), ("revised", RevisedSolver)]:
+            objectives = []
+            for scaling in SCALINGS:
+                solver = solver_class(scaling=scaling)
+                solution = solver.solve(model)
+                objectives.append(solution.objective_value())
+                print(f"* {method}, {scaling} scaling: {solver.iterations} pivots, objective {objectives[-1]:.6g}")
+            assert all(abs(o - objectives[0]) <= 1e-6 * max(1.0, abs(objectives[0])) for o in objectives), "scaled models have different optima"
+
+
+if __name__ == '__main__':
+    run()
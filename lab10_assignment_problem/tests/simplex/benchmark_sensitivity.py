@@ -0,0 +1,71 @@
+import time
+import numpy as np
+import scipy.sparse as sp
+from saport.simplex.model import Model
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from saport.simplex.analysis_tools.rhs_sensitivity import RhsSensitivityAnalyser
+
+# measures the sensitivity analysis of a big sparse model,
+# compared with the time of solving the model once (what every perturbed model would take without the analysis)
+# and, for the cost coefficients, with the analysis looping over the coefficients one by one
+
+ROWS = 1000
+COLUMNS = 2000
+DENSITY = 0.005
+
+
+def create_model(seed = 0):
+    rng = np.random.default_rng(seed)
+    model = Model(f"random_{ROWS}x{COLUMNS}")
+    model.create_variables("x", COLUMNS, upper=10.0)
+    A = sp.random(ROWS, COLUMNS, density=DENSITY, random_state=seed, format='csr')
+    A.data = np.ceil(A.data * 9)
+    model.add_constraints_from_matrix(A, rng.integers(20, 100, ROWS).astype(float), "<=")
+    model.set_objective_vector(rng.integers(1, 20, COLUMNS).astype(float), "max")
+    return model
+
+
+def looped_objective_ranges(solution):
+    tableaux = solution.tableaux
+    (column_variables, column_factors) = solution.normal_columns
+    obj_coeffs = solution.model.objective.expression.factors(solution.model)
+    cost_factors = np.maximum(tableaux.table[0, :-1], 0.0)
+    basis_rows = {col: row for (row, col) in enumerate(tableaux.basis) if col >= 0}
+    fixed = tableaux.upper == 0
+    ranges = []
+    for (i, obj_coeff) in enumerate(obj_coeffs):
+        # cost factors of the tableaux change by the rows of the basic columns of the variable and by its nonbasic columns
+        changes = np.zeros(len(cost_factors))
+        for col in np.flatnonzero(column_variables == i):
+            factor = -column_factors[col] if tableaux.complemented[col] else column_factors[col]
+            if col in basis_rows:
+                changes += factor * tableaux.table[basis_rows[col] + 1, :-1]
+            changes[col] -= factor
+        left_side_bounds = [-cost_factors[j] / a for (j, a) in enumerate(changes) if a > 1e-7 and j not in basis_rows and not fixed[j]]
+        right_side_bounds = [-cost_factors[j] / a for (j, a) in enumerate(changes) if a < -1e-7 and j not in basis_rows and not fixed[j]]
+        ranges.append((float('-inf') if len(left_side_bounds) == 0 else obj_coeff + max(left_side_bounds),
+                       float('inf') if len(right_side_bounds) == 0 else obj_coeff + min(right_side_bounds)))
+    return np.array(ranges)
+
+
+def run():
+    model = create_model()
+    start = time.perf_counter()
+    solution = model.solve("revised")
+    print(f"- {model.name}: solved in {time.perf_counter() - start:.3f}s")
+
+    start = time.perf_counter()
+    (ranges, _) = RhsSensitivityAnalyser().analyse(solution)
+    print(f"* right hand sides analysis: {time.perf_counter() - start:.3f}s, {np.isfinite(ranges).all(axis=1).sum()} bounded ranges")
+
+    start = time.perf_counter()
+    ranges = ObjectiveSensitivityAnalyser().analyse(solution)
+    print(f"* cost coefficients analysis: {time.perf_counter() - start:.3f}s, {np.isfinite(ranges).all(axis=1).sum()} bounded ranges")
+
+    start = time.perf_counter()
+    looped_ranges = looped_objective_ranges(solution)
+    print(f"* cost coefficients analysis (coefficient by coefficient): {time.perf_counter() - start:.3f}s, same ranges: {np.allclose(ranges, looped_ranges)}")
+
+
+if __name__ == '__main__':
+    run()
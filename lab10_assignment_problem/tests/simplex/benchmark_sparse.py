@@ -0,0 +1,56 @@
+import time
+import tracemalloc
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.expressions.expression import Expression
+from saport.simplex import matrix as mx
+from tests.simplex.assignment_models import create_assignment_model
+
+# solves assignment-like linear programs (n*n variables, 2n equality rows and n*n "x <= 1" rows)
+# comparing the size of the dense and the sparse constraint matrix and the peak memory of the whole solve,
+# the dense tableaux path is kept up to 40x40 (60x60 took ~8 minutes under tracemalloc),
+# the 200x200 assignment can't be solved like that (its dense tableaux would have 40400x40000 cells, ~13GB),
+# so the bigger models have the "x <= 1" rows as the upper bounds of the variables and are solved with the revised simplex,
+# keeping the constraint matrix sparse and skipping the dense final tableaux (bigger than matrix.DENSE_TABLEAUX_LIMIT)
+
+SIZES = [10, 30, 40]
+BOUNDED_SIZES = [100, 200]
+
+
+def create_model(n, seed = 0):
+    rng = np.random.default_rng(seed)
+    costs = rng.integers(1, 100, (n, n))
+    model = Model(f"assignment_{n}x{n}")
+    xs = [[model.create_variable(f"x{i}_{j}") for j in range(n)] for i in range(n)]
+    for i in range(n):
+        model.add_constraint(Expression.from_vectors(xs[i], [1.0] * n) == 1)
+    for j in range(n):
+        model.add_constraint(Expression.from_vectors([xs[i][j] for i in range(n)], [1.0] * n) == 1)
+    for i in range(n):
+        for j in range(n):
+            model.add_constraint(xs[i][j] <= 1)
+    model.minimize(Expression.from_vectors([x for row in xs for x in row], costs.flatten()))
+    return model
+
+
+def run():
+    for (n, method) in [(n, "tableaux") for n in SIZES] + [(n, "revised") for n in BOUNDED_SIZES]:
+        model = create_model(n) if method == "tableaux" else create_assignment_model(n)
+        dense_bytes = len(model.constraints) * len(model.variables) * 8
+        sparse_matrix = mx.constraint_matrix(model, sparse=True)
+        sparse_bytes = sparse_matrix.data.nbytes + sparse_matrix.indices.nbytes + sparse_matrix.indptr.nbytes
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        solution = model.solve(method)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"- {n}x{n} assignment ({method}): {len(model.variables)} variables, {len(model.constraints)} constraints, density {mx.density(model):.5f}")
+        print(f"* constraint matrix: dense {dense_bytes / 2**20:.2f}MB, sparse {sparse_bytes / 2**20:.2f}MB")
+        print(f"* solved in {elapsed:.3f}s, objective {solution.objective_value():.1f}, peak memory {peak / 2**20:.1f}MB")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,26 @@
+import time
+import numpy as np
+from saport.minimax.model import Game
+from saport.minimax.solvers.mixed import MixedSolver
+
+# compares solving the tall models of the mixed strategies (Alice's model has a constraint for every action of Bob)
+# with solving their duals chosen by the "auto" strategy
+
+GAME_SIZES = [(10, 100), (20, 600), (30, 2000)]
+
+
+def run():
+    rng = np.random.default_rng(0)
+    for (a_actions, b_actions) in GAME_SIZES:
+        solver = MixedSolver(Game(rng.integers(-10, 10, (a_actions, b_actions)).astype(float)))
+        shifted_game, _ = solver.shift_game_rewards()
+        model = solver.create_max_model(shifted_game)
+        print(f"- game {a_actions}x{b_actions} (model {len(model.constraints)}x{len(model.variables)}):")
+        for strategy in ["primal", "auto"]:
+            start = time.perf_counter()
+            solution = model.solve(strategy=strategy)
+            print(f"\t* {strategy}: {time.perf_counter() - start:.3f}s, game value {solution.objective_value():.4f}")
+
+
+if __name__ == '__main__':
+    run()
@@ -1,9 +1,22 @@
 import logging
+import numpy as np
+import scipy.sparse as sp
 from saport.simplex.model import Model 
+from saport.simplex import matrix as mx
 from saport.simplex.analyser import Analyser
 from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
 import math 
 
+def create_random_model(costs):
+    # every variable is bounded, at the optimum some of them are basic, some at zero and some at their upper bounds
+    model = Model("example_07_cost_sensitivity_random")
+    model.create_variables("x", len(costs), upper=10.0)
+    A = sp.random(8, len(costs), density=0.3, random_state=0, format='csr')
+    A.data = np.ceil(A.data * 9)
+    model.add_constraints_from_matrix(A, np.random.default_rng(0).integers(20, 100, 8).astype(float), "<=")
+    model.set_objective_vector(costs, "max")
+    return model
+
 def run():
     model = Model("example_07_cost_sensitivity")
 
@@ -30,6 +43,66 @@ def run():
         assert math.isclose(bounds_pair[0], expected_bounds[i][0], abs_tol=tolerance), f"left bound of the coefficient range seems to be incorrect, expected {expected_bounds[i][0]}, got {bounds_pair[0]}"
         assert math.isclose(bounds_pair[1], expected_bounds[i][1], abs_tol=tolerance), f"right bound of the coefficient range seems to be incorrect, expected {expected_bounds[i][1]}, got {bounds_pair[1]}"
 
+    # variables at their upper bounds (complemented in the tableaux), with shifted lower bounds or split into two columns
+    model = Model("example_07_cost_sensitivity_bounded")
+    x = model.create_variable("x", upper=2)
+    y = model.create_variable("y")
+    model.add_constraint(x + y <= 10)
+    model.maximize(3*x + y)
+    bounded_models = [(model, [(1.0, float("inf")), (0.0, 3.0)])]
+
+    model = Model("example_07_cost_sensitivity_upper_only")
+    x = model.create_variable("x")
+    y = model.create_variable("y", lower=float("-inf"), upper=4)
+    model.add_constraint(x + y <= 10)
+    model.maximize(3*x + 4*y)
+    bounded_models.append((model, [(0.0, 4.0), (3.0, float("inf"))]))
+
+    model = Model("example_07_cost_sensitivity_free")
+    x = model.create_variable("x", lower=1, upper=5)
+    y = model.create_variable("y", lower=float("-inf"))
+    model.add_constraint(x - y <= 2)
+    model.add_constraint(x + y <= 6)
+    model.minimize(2*y - 1*x)
+    bounded_models.append((model, [(-2.0, float("inf")), (1.0, float("inf"))]))
+
+    for (model, expected_bounds) in bounded_models:
+        for options in [{}, {"method": "revised"}, {"algorithm": "dual"}]:
+            bounds = ObjectiveSensitivityAnalyser().analyse(model.solve(**options))
+            for (bounds_pair, expected_pair) in zip(bounds, expected_bounds):
+                assert all(math.isclose(b, e, abs_tol=tolerance) for (b, e) in zip(bounds_pair, expected_pair)), \
+                    f"coefficient range of the {model.name} model seems to be incorrect ({options}), expected {expected_pair}, got {list(bounds_pair)}"
+
+    # the ranges should agree with the perturbed models solved from scratch: the current assignment stays optimal
+    # just inside every finite bound (or far away from the infinite ones) and stops being optimal just outside
+    costs = np.random.default_rng(0).integers(1, 20, 16).astype(float)
+    for options in [{}, {"scaling": "geometric"}, {"method": "revised", "algorithm": "dual"}]:
+        solution = create_random_model(costs).solve(**options)
+        assignment = np.array(solution.assignment)
+        bounds = ObjectiveSensitivityAnalyser().analyse(solution)
+        for (i, bounds_pair) in enumerate(bounds):
+            for (bound, direction) in zip(bounds_pair, [-1.0, 1.0]):
+                perturbations = [(bound - direction * 1e-3, True), (bound + direction * 1e-3, False)] if math.isfinite(bound) else [(costs[i] + direction * 100.0, True)]
+                for (cost, is_inside) in perturbations:
+                    perturbed_costs = costs.copy()
+                    perturbed_costs[i] = cost
+                    perturbed_solution = create_random_model(perturbed_costs).solve()
+                    is_optimal = perturbed_solution.objective_value() <= perturbed_costs @ assignment + 1e-6
+                    assert is_optimal == is_inside, f"assignment should {'' if is_inside else 'not '}stay optimal with c{i} = {cost} ({options}), the range is {list(bounds_pair)}"
+
+    # the revised solver doesn't materialize tableaux bigger than the limit, there is nothing to analyse then
+    dense_tableaux_limit = mx.DENSE_TABLEAUX_LIMIT
+    mx.DENSE_TABLEAUX_LIMIT = 10
+    try:
+        solution = create_random_model(costs).solve("revised")
+    finally:
+        mx.DENSE_TABLEAUX_LIMIT = dense_tableaux_limit
+    try:
+        ObjectiveSensitivityAnalyser().analyse(solution)
+        assert False, "cost coefficients analysis should reject the solution without the tableaux"
+    except Exception as exception:
+        assert "too big to be materialized" in str(exception), "unexpected exception"
+
     logging.info("Congratulations! This cost coefficients analysis look alright :)")
 
 if __name__ == '__main__':
@@ -0,0 +1,37 @@
+import logging
+import math
+from saport.simplex.model import Model
+from saport.simplex.solver import SolverMethod
+
+def run():
+    model = Model("example_08_revised_simplex")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= 60)
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= 150)
+    model.add_constraint(x1 + x2 + x3 >= 2)
+    model.add_constraint(x1 - x3 == 1)
+
+    model.maximize(5*x1 + 4.5*x2 + 6*x3)
+
+    tableaux_solution = model.solve(SolverMethod.TABLEAUX)
+    revised_solution = model.solve(SolverMethod.REVISED)
+
+    logging.info(revised_solution)
+
+    for (expected, found) in zip(tableaux_solution.assignment, revised_solution.assignment):
+        assert math.isclose(expected, found, abs_tol=1e-6), "revised simplex found a different solution than the tableaux one"
+    for (expected, found) in zip(tableaux_solution.tableaux.table.flat, revised_solution.tableaux.table.flat):
+        assert math.isclose(expected, found, abs_tol=1e-6), "revised simplex returned a different final tableaux"
+
+    model.add_constraint(x1 + x2 >= 100)
+    assert model.solve(SolverMethod.REVISED).is_feasible == False, "revised simplex found a solution to an unfeasible problem"
+
+    logging.info("Congratulations! The revised simplex seems to work correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
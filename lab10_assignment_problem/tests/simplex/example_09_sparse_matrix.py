@@ -0,0 +1,40 @@
+import logging
+import math
+import scipy.sparse as sp
+from saport.simplex.model import Model
+from saport.simplex.expressions.expression import Expression
+from saport.simplex import matrix as mx
+
+def run():
+    model = Model("example_09_sparse_matrix")
+
+    costs = [[9, 2, 7, 8, 3], [6, 4, 3, 7, 9], [5, 8, 1, 8, 4], [7, 6, 9, 4, 2], [3, 5, 6, 2, 8]]
+    n = len(costs)
+    xs = [[model.create_variable(f"x{i}{j}") for j in range(n)] for i in range(n)]
+
+    for i in range(n):
+        model.add_constraint(Expression.from_vectors(xs[i], [1] * n) == 1)
+        model.add_constraint(Expression.from_vectors([xs[j][i] for j in range(n)], [1] * n) == 1)
+    for row in xs:
+        for x in row:
+            model.add_constraint(x <= 1)
+
+    model.minimize(Expression.from_vectors([x for row in xs for x in row], [c for row in costs for c in row]))
+
+    assert mx.is_sparse(model), "assignment model should be treated as a sparse one"
+    assert sp.issparse(mx.constraint_matrix(model)), "sparse model should be stored in a sparse matrix"
+    assert (mx.constraint_matrix(model).toarray() == mx.constraint_matrix(model, sparse=False)).all(), "sparse and dense matrices differ"
+
+    tableaux_solution = model.solve("tableaux")
+    revised_solution = model.solve("revised")
+
+    logging.info(revised_solution)
+
+    assert math.isclose(revised_solution.objective_value(), 13.0, abs_tol=1e-6), "revised simplex with a sparse matrix found an incorrect solution"
+    assert math.isclose(tableaux_solution.objective_value(), 13.0, abs_tol=1e-6), "tableaux simplex found an incorrect solution"
+
+    logging.info("Congratulations! Sparse models are solved correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,37 @@
+import logging
+from saport.simplex.model import Model
+
+def run():
+    model = Model("example_10_basis_tracking")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+
+    model.add_constraint(x1 + x2 == 4)
+    model.add_constraint(2*x1 + 2*x2 == 8)
+    model.add_constraint(-3*x1 == 0)
+    model.add_constraint(x2 <= 6)
+
+    model.maximize(6*x1 + x2)
+
+    solution = model.solve("tableaux")
+
+    logging.info(solution)
+    logging.info(solution.tableaux)
+
+    assert solution.assignment == [0.0, 4.0], "Your algorithm found an incorrect solution!"
+
+    tableaux = solution.tableaux
+    basis = tableaux.extract_basis()
+    assert basis == list(tableaux.basis), "extracted basis differs from the tracked one"
+    for (row, col) in enumerate(basis):
+        if col < 0:
+            continue
+        column = tableaux.table[:, col]
+        assert column[row + 1] == 1.0 and abs(column).sum() == 1.0, f"variable {col} is tracked in the basis, but its column isn't a unit one"
+
+    logging.info("Congratulations! The basis is tracked correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
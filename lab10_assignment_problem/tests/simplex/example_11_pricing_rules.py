@@ -0,0 +1,30 @@
+import logging
+from saport.simplex.model import Model
+
+# a degenerate model (a variant of Beale's example), the textbook Dantzig rule without any tie-breaking may cycle on such models
+
+def run():
+    model = Model("example_11_pricing_rules")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    x4 = model.create_variable("x4")
+
+    model.add_constraint(0.25*x1 - 8*x2 - x3 + 9*x4 <= 0)
+    model.add_constraint(0.5*x1 - 12*x2 - 0.5*x3 + 3*x4 <= 0)
+    model.add_constraint(x3 <= 1)
+
+    model.maximize(0.75*x1 - 20*x2 + 0.5*x3 - 6*x4)
+
+    for method in ["tableaux", "revised"]:
+        for pricing in ["dantzig", "bland", "partial", "devex", "steepest_edge"]:
+            solution = model.solve(method, pricing)
+            logging.info(f"{method} ({pricing}): {solution}")
+            assert abs(solution.objective_value() - 1.25) <= 1e-9, f"{method} simplex with the {pricing} rule found an incorrect solution!"
+
+    logging.info("Congratulations! All the pricing rules work correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
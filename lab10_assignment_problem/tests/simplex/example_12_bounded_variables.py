@@ -0,0 +1,31 @@
+import logging
+from saport.simplex.model import Model
+
+def run():
+    model = Model("example_12_bounded_variables")
+
+    x1 = model.create_variable("x1", upper=4)
+    x2 = model.create_variable("x2", lower=1, upper=3)
+    x3 = model.create_variable("x3", lower=float('-inf'))
+    x4 = model.create_variable("x4", lower=float('-inf'), upper=2)
+
+    model.add_constraint(x1 + x2 + x3 <= 6)
+    model.add_constraint(x3 - x4 >= -4)
+    model.add_constraint(x1 + x4 <= 5)
+
+    model.maximize(3*x1 + 2*x2 + x3 + x4)
+
+    expected_assignment = [4.0, 3.0, -1.0, 1.0]
+    for method in ["tableaux", "revised"]:
+        solution = model.solve(method)
+        logging.info(solution)
+
+        assert len(solution.normal_model.constraints) == len(model.constraints), "bounds shouldn't be added to the model as constraints"
+        assert all(abs(v - e) <= 1e-9 for (v, e) in zip(solution.assignment, expected_assignment)), f"{method} simplex found an incorrect solution!"
+        assert abs(solution.objective_value() - 18.0) <= 1e-9, f"{method} simplex found an incorrect objective value!"
+
+    logging.info("Congratulations! The variable bounds are handled correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,33 @@
+import logging
+from saport.simplex.model import Model
+
+def run():
+    # a covering problem, the slack basis is dual feasible, but not primal feasible
+    model = Model("example_13_dual_simplex")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2", upper=2)
+    x3 = model.create_variable("x3")
+
+    model.add_constraint(2*x1 + x2 + x3 >= 8)
+    model.add_constraint(x1 + 3*x2 + 2*x3 >= 12)
+    model.add_constraint(x1 + x2 >= 3)
+
+    model.minimize(4*x1 + x2 + 3*x3)
+
+    for method in ["tableaux", "revised"]:
+        for algorithm in ["auto", "primal", "dual"]:
+            solution = model.solve(method, algorithm=algorithm)
+            logging.info(f"{method} ({algorithm}): {solution}")
+            assert abs(solution.objective_value() - 16.0) <= 1e-9, f"{method} simplex ({algorithm}) found an incorrect solution!"
+
+    model.add_constraint(x1 + x2 + x3 <= 3)
+    for method in ["tableaux", "revised"]:
+        solution = model.solve(method, algorithm="dual")
+        assert not solution.is_feasible, f"dual {method} simplex didn't notice the model is unfeasible"
+
+    logging.info("Congratulations! The dual simplex works correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
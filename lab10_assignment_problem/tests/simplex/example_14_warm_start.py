@@ -0,0 +1,39 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+
+def run():
+    model = Model("example_14_warm_start")
+
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3", upper=4)
+
+    model.add_constraint(x1 + x2 + x3 <= 10)
+    model.add_constraint(2*x1 + x2 >= 4)
+    model.add_constraint(x1 - x2 + 2*x3 <= 8)
+
+    model.maximize(2*x1 + 3*x2 + x3)
+
+    solution = model.solve()
+    logging.info(solution)
+    assert solution.basis is not None, "solution should contain the optimal basis"
+
+    solver = Solver()
+    warm_solution = solver.solve(model, solution.basis)
+    assert solver.iterations == 0, "solving the same model from its optimal basis shouldn't need any iterations"
+    assert abs(warm_solution.objective_value() - solution.objective_value()) <= 1e-9, "warm start changed the optimum"
+
+    # the old basis becomes primal infeasible, a few dual simplex pivots should fix it
+    model.add_constraint(x2 <= 5)
+    cold_solution = model.solve()
+    for method in ["tableaux", "revised"]:
+        warm_solution = model.solve(method, start_basis=solution.basis)
+        logging.info(warm_solution)
+        assert abs(warm_solution.objective_value() - cold_solution.objective_value()) <= 1e-9, f"warm started {method} simplex found an incorrect solution!"
+
+    logging.info("Congratulations! Warm starts work correctly :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
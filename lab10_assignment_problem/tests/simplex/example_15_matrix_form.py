@@ -0,0 +1,45 @@
+import logging
+import numpy as np
+import scipy.sparse as sp
+from saport.simplex.model import Model
+from saport.simplex.expressions.constraint import ConstraintType
+from saport.simplex.expressions.objective import ObjectiveType
+
+def run():
+    A = np.array([[1.0, 1.0, 0.0],
+                  [2.0, 0.0, 1.0],
+                  [0.0, 1.0, 3.0]])
+    b = np.array([4.0, 10.0, 6.0])
+    c = np.array([3.0, 2.0, 4.0])
+
+    expression_model = Model("example_15_expressions")
+    x1 = expression_model.create_variable("x1")
+    x2 = expression_model.create_variable("x2")
+    x3 = expression_model.create_variable("x3")
+    expression_model.add_constraint(x1 + x2 <= 4)
+    expression_model.add_constraint(2*x1 + x3 == 10)
+    expression_model.add_constraint(x2 + 3*x3 >= 6)
+    expression_model.maximize(3*x1 + 2*x2 + 4*x3)
+    expected_solution = expression_model.solve()
+
+    for matrix in [A, sp.csr_matrix(A)]:
+        model = Model("example_15_matrix_form")
+        for name in ["x1", "x2", "x3"]:
+            model.create_variable(name)
+        model.add_constraints_from_matrix(matrix, b, ["<=", "=", ConstraintType.GE])
+        model.set_objective_vector(c, "max")
+
+        solution = model.solve()
+        logging.info(solution)
+        assert solution.assignment == expected_solution.assignment, "model created from matrices differs from the one created from expressions"
+
+        (A2, b2, types, c2, sense) = model.to_matrix_form()
+        A2 = A2.toarray() if sp.issparse(A2) else A2
+        assert np.array_equal(A2, A) and np.array_equal(b2, b) and np.array_equal(c2, c), "matrix form differs from the matrices the model was created from"
+        assert types == [ConstraintType.LE, ConstraintType.EQ, ConstraintType.GE] and sense == ObjectiveType.MAX, "matrix form has incorrect types"
+
+    logging.info("Congratulations! Models can be created from matrices :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,32 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.expressions.builder import LinearExpressionBuilder
+
+def run():
+    model = Model("example_16_expression_builder")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    builder = LinearExpressionBuilder(2*x1)
+    builder += x2 + 3*x3
+    builder -= x1
+    builder.add(x2 - x3, 2)
+    expression = builder.build()
+    assert [(atom.var.name, atom.factor) for atom in expression.atoms] == [("x1", 1), ("x2", 3), ("x3", 1)], "builder accumulated incorrect factors"
+
+    constraint = LinearExpressionBuilder()
+    for x in [x1, x2, x3]:
+        constraint += x
+    model.add_constraint(constraint.build() <= 10)
+    model.add_constraint(x1 - x3 <= 2)
+    model.maximize(expression)
+
+    solution = model.solve()
+    logging.info(solution)
+    assert abs(solution.objective_value() - 30) < 1e-6, "model built with the builder has an incorrect optimum"
+    logging.info("Congratulations! Expressions can be built in place :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,30 @@
+import logging
+from saport.simplex.model import Model
+
+def run():
+    model = Model("example_17_compiled_expressions")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+
+    expression = 4*x3 + x1 - 2*x3 + 3*x1
+    (indices, factors) = expression.compiled()
+    assert indices.tolist() == [0, 2] and factors.tolist() == [4.0, 2.0], "expression compiled to incorrect arrays"
+    assert expression.compiled()[0] is indices, "compiled representation should be cached"
+    assert expression.factors(model) == [4.0, 0.0, 2.0], "expression has incorrect factors"
+    assert (expression.factor(x1), expression.factor(x2), expression.factor(x3)) == (4.0, 0.0, 2.0), "expression has an incorrect factor"
+
+    expression.atoms = expression.atoms + (x2 * 5,)
+    assert expression.factors(model) == [4.0, 5.0, 2.0], "compiled representation wasn't invalidated after changing the atoms"
+
+    model.add_constraint(expression <= 20)
+    model.maximize(x1 + x2 + x3)
+    assert model.objective.depends_on_variable(model, x2), "objective should depend on x2"
+    solution = model.solve()
+    logging.info(solution)
+    assert abs(solution.objective_value() - 10) < 1e-6, "model built from compiled expressions has an incorrect optimum"
+    logging.info("Congratulations! Expressions are compiled and cached :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,32 @@
+import logging
+from saport.simplex.model import Model
+
+def run():
+    model = Model("example_18_variable_lookup")
+    x = model.create_variable("x")
+    ys = model.create_variables("y", 3, upper=2)
+    assert [y.name for y in ys] == ["y0", "y1", "y2"] and [y.index for y in ys] == [1, 2, 3], "variables were created with incorrect names or indices"
+    assert model.variable("x") is x and model.variable("y2") is ys[2], "variable lookup returned an incorrect variable"
+
+    for name in ["x", "y1"]:
+        try:
+            model.create_variable(name)
+            assert False, f"model should reject a duplicated name {name}"
+        except Exception as exception:
+            assert "already a variable" in str(exception), "unexpected exception"
+    try:
+        model.create_variables("y", 2)
+        assert False, "model should reject duplicated names"
+    except Exception as exception:
+        assert len(model.variables) == 4, "variables shouldn't be added when any of the names is duplicated"
+
+    model.add_constraint(x + model.variable("y0") + model.variable("y1") <= 3)
+    model.maximize(x + 2 * ys[0] + ys[1] + ys[2])
+    solution = model.solve()
+    logging.info(solution)
+    assert abs(solution.objective_value() - 7) < 1e-6, "model has an incorrect optimum"
+    logging.info("Congratulations! Variables can be looked up by their names :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,33 @@
+import logging
+from saport.simplex.model import Model
+
+def run():
+    model = Model("example_19_model_snapshots")
+    x1 = model.create_variable("x1", lower=1, upper=4)
+    x2 = model.create_variable("x2", lower=float('-inf'))
+    x3 = model.create_variable("x3", upper=3)
+    model.add_constraint(x1 + x2 + x3 <= 6)
+    model.add_constraint(x2 - x3 >= -2)
+    model.add_constraint(x1 + x2 == 3)
+    model.minimize(-2*x1 - x3 + x2)
+    text = str(model)
+    expressions = [c.expression for c in model.constraints]
+
+    for method in ["tableaux", "revised"]:
+        solution = model.solve(method)
+        logging.info(solution)
+        assert abs(solution.objective_value() + 10) < 1e-6, f"{method} solver found an incorrect optimum"
+        assert str(model) == text, "solving shouldn't modify the model"
+        assert all(c.expression is e for (c, e) in zip(model.constraints, expressions)), "solving shouldn't copy nor modify the expressions"
+        assert model.variables == [x1, x2, x3] and (x1.lower, x1.upper, x2.lower) == (1, 4, float('-inf')), "solving shouldn't modify the variables"
+
+    snapshot = model.snapshot()
+    snapshot.set_variable_bounds(x3, 0, 1)
+    snapshot.add_constraint(x1 <= 2)
+    assert len(model.constraints) == 3 and model.variables[2].upper == 3, "changing a snapshot shouldn't modify the model"
+    assert abs(snapshot.solve().objective_value() + 4) < 1e-6, "snapshot has an incorrect optimum"
+    logging.info("Congratulations! Models are solved without copying and modifying them :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,60 @@
+import logging
+from saport.simplex.model import Model
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from saport.simplex.analysis_tools.rhs_sensitivity import RhsSensitivityAnalyser
+
+def run():
+    model = Model("example_20_presolve")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3", lower=2, upper=2)
+    x4 = model.create_variable("x4", upper=10)
+
+    model.add_constraint(x1 + x2 + x3 <= 12)
+    model.add_constraint(2*x1 + 2*x2 + 2*x3 <= 20)
+    model.add_constraint(x2 >= 1)
+    model.add_constraint(3*x4 <= 12)
+    model.add_constraint(x1 - x4 <= 3)
+    model.add_constraint(x1 + x4 <= 100)
+    model.maximize(2*x1 + x2 + x3 + x4)
+
+    expected_solution = model.solve()
+    for method in ["tableaux", "revised"]:
+        solution = model.solve(method, presolve=True)
+        logging.info(solution)
+        assert abs(solution.objective_value() - expected_solution.objective_value()) < 1e-6, f"presolved model solved with the {method} solver has an incorrect optimum"
+        assert solution.assignment == expected_solution.assignment, "solution of the presolved model wasn't mapped back correctly"
+
+        report = solution.presolve_report
+        logging.info(report)
+        # the duplicated row, two singleton rows and the redundant x1 + x4 <= 100 are removed, so is the fixed x3
+        assert report.rows_removed == 4 and report.columns_removed == 1, "presolve removed incorrect number of rows or columns"
+        assert len(solution.normal_model.constraints) == 2, "solution should contain the reduced normal model"
+
+        # columns and rows of the reduced normal model don't match the variables and constraints anymore
+        for (analyser, message) in [(ObjectiveSensitivityAnalyser(), "Cost coefficients of a presolved"), (RhsSensitivityAnalyser(), "Right hand sides of a presolved")]:
+            try:
+                analyser.analyse(solution)
+                assert False, f"{analyser.name} shouldn't analyse the presolved solution"
+            except Exception as exception:
+                assert message in str(exception), "unexpected exception"
+
+    # all the rows are singletons turned into bounds, the dual simplex gets a tableaux without any rows
+    bounds_model = Model("example_20_presolve_bounds")
+    x = bounds_model.create_variable("x")
+    y = bounds_model.create_variable("y", upper=3)
+    bounds_model.add_constraint(x <= 4)
+    bounds_model.add_constraint(y >= 1)
+    bounds_model.maximize(x + y)
+    for options in [{"algorithm": "dual"}, {"method": "revised", "algorithm": "dual"}, {"start_basis": expected_solution.basis}]:
+        solution = bounds_model.solve(presolve=True, **options)
+        assert solution.assignment == [4.0, 3.0], f"model presolved to bounds only should be solved ({options}), got {solution.assignment}"
+
+    model.add_constraint(x1 + x3 <= 1)
+    solution = model.solve(presolve=True)
+    assert not solution.is_feasible, "presolve should detect the infeasible model"
+    logging.info("Congratulations! Models can be presolved :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
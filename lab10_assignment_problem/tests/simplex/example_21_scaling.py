@@ -0,0 +1,40 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.scaling import ScalingMethod, scaling_factors
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+
+def run():
+    A = np.array([[20000.0, 3.0, 0.0],
+                  [0.001, 1.0, -1.0],
+                  [1.0, 0.0, 500.0]])
+    for method in [ScalingMethod.GEOMETRIC, ScalingMethod.EQUILIBRATION]:
+        row_factors, column_factors = scaling_factors(A, method)
+        scaled = np.abs(A * row_factors[:, None] * column_factors[None, :])
+        nonzeros = scaled[scaled > 0]
+        assert nonzeros.max() / nonzeros.min() < (np.abs(A[A != 0]).max() / np.abs(A[A != 0]).min()) / 100, f"{method} scaling didn't reduce the factors range"
+        assert np.all(np.log2(row_factors) == np.round(np.log2(row_factors))), "scaling factors should be powers of 2"
+
+    model = Model("example_21_scaling")
+    x1 = model.create_variable("x1", upper=300)
+    x2 = model.create_variable("x2", lower=-2, upper=5000)
+    x3 = model.create_variable("x3", lower=float('-inf'))
+    model.add_constraint(20000*x1 + 3*x2 <= 1e6)
+    model.add_constraint(0.001*x1 + x2 - x3 >= 1)
+    model.add_constraint(x1 + 500*x3 <= 2000)
+    model.maximize(2*x1 - x2 + 0.5*x3)
+
+    expected_solution = model.solve()
+    expected_ranges = ObjectiveSensitivityAnalyser().analyse(expected_solution)
+    for scaling in ["geometric", "equilibration"]:
+        for method in ["tableaux", "revised"]:
+            solution = model.solve(method, scaling=scaling)
+            logging.info(solution)
+            assert np.allclose(solution.assignment, expected_solution.assignment), f"{scaling} scaling changed the solution"
+            ranges = ObjectiveSensitivityAnalyser().analyse(solution)
+            assert np.allclose(ranges, expected_ranges), f"cost ranges of the {scaling} scaled model should be unscaled, expected {expected_ranges.tolist()}, got {ranges.tolist()}"
+    logging.info("Congratulations! Models can be scaled :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,57 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solution import SolutionStatus
+from saport.simplex.solver import Solver
+from saport.simplex.revised import RevisedSolver
+
+def run():
+    # Beale's example (with swapped rows, so it cycles with the Dantzig rule breaking ties in favour of the last row)
+    model = Model("example_22_cycling")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    x4 = model.create_variable("x4")
+    model.add_constraint(0.5*x1 - 12*x2 - 0.5*x3 + 3*x4 <= 0)
+    model.add_constraint(0.25*x1 - 8*x2 - x3 + 9*x4 <= 0)
+    model.add_constraint(x3 <= 1)
+    model.minimize(-0.75*x1 + 20*x2 - 0.5*x3 + 6*x4)
+
+    for solver in [Solver(), RevisedSolver()]:
+        solution = solver.solve(model.snapshot())
+        logging.info(solution)
+        assert solver.cycling_detected, "solver should detect cycling"
+        assert solution.status == SolutionStatus.OPTIMAL, "cycling model should be solved to optimality"
+        assert abs(solution.objective_value() + 1.25) < 1e-6, "cycling model has a wrong optimum"
+
+    model = Model("example_22_iteration_limits")
+    xs = model.create_variables("x", 6)
+    model.add_constraint(xs[0] + xs[1] + xs[2] <= 10)
+    model.add_constraint(xs[3] + xs[4] + xs[5] <= 12)
+    model.add_constraint(xs[0] + xs[3] <= 8)
+    model.add_constraint(xs[1] + xs[4] <= 9)
+    model.add_constraint(xs[2] + xs[5] <= 7)
+    model.maximize(3*xs[0] + 2*xs[1] + 4*xs[2] + 5*xs[3] + xs[4] + 2*xs[5])
+    expected_solution = model.solve()
+
+    for method in ["tableaux", "revised"]:
+        solution = model.solve(method, iteration_limit=2)
+        logging.info(solution)
+        assert solution.status == SolutionStatus.ITERATION_LIMIT, "solver should stop after reaching the iteration limit"
+        assert solution.assignment is not None, "slack basis is feasible, so the stopped solver should return the last feasible assignment"
+        assert solution.objective_value() < expected_solution.objective_value(), "two iterations shouldn't be enough to reach the optimum"
+        assert all(constraint.expression.evaluate(solution.assignment) <= constraint.bound + 1e-9 for constraint in model.constraints), "returned assignment should be feasible"
+
+        continued_solution = model.solve(method, start_basis=solution.basis)
+        assert continued_solution.status == SolutionStatus.OPTIMAL, "solver should continue from the returned basis"
+        assert np.isclose(continued_solution.objective_value(), expected_solution.objective_value()), "continued solver returned a wrong optimum"
+
+    solver = Solver(time_limit=0.0)
+    solution = solver.solve(model.snapshot())
+    assert solution.status == SolutionStatus.TIME_LIMIT, "solver should stop after reaching the time limit"
+    assert solver.iterations == 0, "solver shouldn't pivot after reaching the time limit"
+    logging.info("Congratulations! Solver respects the limits :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
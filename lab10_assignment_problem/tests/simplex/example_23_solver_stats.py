@@ -0,0 +1,41 @@
+import json
+import logging
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.revised import RevisedSolver
+from saport.simplex.stats import STAGES
+
+def run():
+    model = Model("example_23_solver_stats")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3", upper=4)
+    model.add_constraint(x1 + x2 + x3 >= 3)
+    model.add_constraint(2*x1 - x2 + x3 == 2)
+    model.add_constraint(x1 + 3*x2 + 2*x3 <= 12)
+    model.maximize(x1 + 2*x2 + x3)
+
+    assert model.solve().stats is None, "statistics shouldn't be collected by default"
+
+    for solver in [Solver(collect_stats=True), RevisedSolver(collect_stats=True)]:
+        solution = solver.solve(model.snapshot())
+        stats = solution.stats
+        logging.info(stats.to_json())
+        assert stats is solver.stats, "solution should hold the statistics of the solver"
+        assert stats.pivots["phase 1"] > 0, "model with equality and >= constraints needs the first phase"
+        assert stats.pivots["phase 2"] > 0, "model should be optimized in the second phase"
+        assert sum(stats.pivots.values()) + stats.bound_flips == solver.iterations, "all the iterations should be counted"
+        assert stats.degenerate_pivots <= sum(stats.pivots.values()), "degenerate pivots are a part of all the pivots"
+        # 3 rows + cost row, 3 variables + 2 slacks + 2 artificial variables + rhs
+        assert stats.peak_tableaux_shape == [4, 8], "peak tableaux should include the artificial columns"
+        assert all(stats.stage_times[stage] >= 0.0 for stage in STAGES), "all the stages should be timed"
+        assert stats.stage_times["presolve"] == 0.0, "model wasn't presolved"
+        assert json.loads(stats.to_json()) == stats.to_dict(), "statistics should be exported to JSON"
+
+    solution = model.solve(presolve=True, collect_stats=True)
+    assert solution.stats.stage_times["presolve"] > 0.0, "presolve should be timed"
+    logging.info("Congratulations! Solver collects the statistics :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
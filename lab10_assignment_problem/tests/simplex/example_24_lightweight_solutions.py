@@ -0,0 +1,59 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex import matrix as mx
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from saport.simplex.analysis_tools.rhs_sensitivity import RhsSensitivityAnalyser
+
+def run():
+    model = Model("example_24_lightweight_solutions")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2", upper=6)
+    x3 = model.create_variable("x3")
+    model.add_constraint(x1 + x2 + x3 <= 10)
+    model.add_constraint(2*x1 + x2 >= 4)
+    model.add_constraint(x1 - x3 == 1)
+    model.maximize(3*x1 + 2*x2 + x3)
+    # x3 = x1 - b2, so x1 stays in the optimum as long as (c0 + c2) / 2 >= c1 and the optimum moves along 2*x1 + x2 = b0 + b2
+    expected_results = {
+        ObjectiveSensitivityAnalyser.name(): [[3.0, np.inf], [-np.inf, 2.0], [1.0, np.inf]],
+        RhsSensitivityAnalyser.name(): ([[3.0, np.inf], [-np.inf, 11.0], [-6.0, 10.0]], [2.0, 0.0, 1.0])
+    }
+
+    for (method, presolve) in [("tableaux", False), ("revised", False), ("tableaux", True)]:
+        solution = model.solve(method, presolve=presolve)
+        lightweight_solution = model.solve(method, presolve=presolve, keep_tableaux=False)
+        assert solution.has_tableaux(), "solutions should keep the tableaux by default"
+        assert not lightweight_solution.has_tableaux(), "lightweight solution shouldn't keep the tableaux"
+        assert lightweight_solution.assignment == solution.assignment, "lightweight solution should have the same assignment"
+        assert lightweight_solution.objective_value() == solution.objective_value(), "lightweight solution should have the same objective value"
+        assert lightweight_solution.basis == solution.basis, "lightweight solution should have the same basis"
+
+        # presolved models can't be analysed (rows and columns of their normal models don't match the original model)
+        if presolve:
+            assert lightweight_solution.normal_rows is None, "rebuilt presolved solution shouldn't map the normal rows"
+        else:
+            for analyser in [ObjectiveSensitivityAnalyser(), RhsSensitivityAnalyser()]:
+                results = analyser.analyse(lightweight_solution)
+                assert all(np.array_equal(r, e) for (r, e) in zip(results, analyser.analyse(solution))), "analysis of the rebuilt tableaux should be the same"
+                expected = expected_results[analyser.name]
+                assert all(np.allclose(r, e) for (r, e) in zip(results, expected)), f"{analyser.name} of the rebuilt tableaux is incorrect, expected {expected}, got {results}"
+        assert lightweight_solution.has_tableaux(), "tableaux should be rebuilt for the analysis"
+        assert np.array_equal(lightweight_solution.tableaux.table, solution.tableaux.table), "rebuilt tableaux should be the same"
+        assert np.array_equal(lightweight_solution.initial_tableaux.table, solution.initial_tableaux.table), "rebuilt initial tableaux should be the same"
+
+    limited_solution = model.solve(keep_tableaux=False, iteration_limit=1)
+    assert np.array_equal(limited_solution.tableaux.table, model.solve(iteration_limit=1).tableaux.table), "tableaux should be rebuilt in the same basis"
+    # the revised solver doesn't materialize tableaux bigger than the limit, so the solution has no tableaux to analyse
+    dense_tableaux_limit = mx.DENSE_TABLEAUX_LIMIT
+    mx.DENSE_TABLEAUX_LIMIT = 10
+    try:
+        solution = model.solve("revised")
+    finally:
+        mx.DENSE_TABLEAUX_LIMIT = dense_tableaux_limit
+    assert not solution.has_tableaux(), "solution without the materialized tableaux shouldn't claim to have them"
+    logging.info("Congratulations! Solutions can be lightweight :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
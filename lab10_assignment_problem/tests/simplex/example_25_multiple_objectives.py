@@ -0,0 +1,44 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solution import SolutionStatus
+
+def run():
+    model = Model("example_25_multiple_objectives")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2", upper=5)
+    x3 = model.create_variable("x3", lower=-2)
+    x4 = model.create_variable("x4")
+    model.add_constraint(x1 + x2 + x3 == 8)
+    model.add_constraint(x1 - x2 + x4 >= -3)
+    model.add_constraint(2*x1 + x3 <= 14)
+
+    objectives = np.array([[1.0, 2.0, 1.0, 0.0],
+                           [3.0, -1.0, 0.0, -1.0],
+                           [0.0, 0.0, -1.0, 1.0],
+                           [-1.0, 1.0, 2.0, -2.0]])
+    for method in ["tableaux", "revised"]:
+        for sense in ["max", "min"]:
+            solutions = model.solve_objectives(objectives, sense, method)
+            assert len(solutions) == len(objectives), "there should be a solution for every objective"
+            for (objective, solution) in zip(objectives, solutions):
+                objective_model = model.snapshot()
+                objective_model.set_objective_vector(objective, sense)
+                expected_solution = objective_model.solve(method)
+                assert solution.status == expected_solution.status, f"objective {objective} should end with {expected_solution.status}"
+                assert not solution.has_tableaux(), "batch solutions should be lightweight"
+                if expected_solution.status == SolutionStatus.OPTIMAL:
+                    logging.info(solution)
+                    assert np.isclose(solution.objective_value(), expected_solution.objective_value()), f"objective {objective} has a wrong optimum"
+
+    # x4 is not bounded from above, so the third objective is unbounded, the next one starts from the last feasible basis
+    assert model.solve_objectives(objectives)[2].status == SolutionStatus.UNBOUNDED, "third objective should be unbounded"
+
+    model.add_constraint(x1 + x2 >= 20)
+    solutions = model.solve_objectives(objectives)
+    assert all(solution.status == SolutionStatus.INFEASIBLE for solution in solutions), "infeasible model should be infeasible for every objective"
+    logging.info("Congratulations! Models can be solved for many objectives :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
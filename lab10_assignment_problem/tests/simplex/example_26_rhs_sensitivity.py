@@ -0,0 +1,59 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex import matrix as mx
+from saport.simplex.analyser import Analyser
+from saport.simplex.analysis_tools.rhs_sensitivity import RhsSensitivityAnalyser
+
+def run():
+    model = Model("example_26_rhs_sensitivity")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= 60)
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= 150)
+    model.add_constraint(x1 <= 8)
+    model.maximize(5*x1 + 4.5*x2 + 6*x3)
+
+    expected_ranges = [(37.5, 65.5), (128.0, 240.0), (6.429, float("inf"))]
+    expected_prices = [0.786, 0.029, 0.0]
+    for method in ["tableaux", "revised"]:
+        for algorithm in ["primal", "dual"]:
+            solution = model.solve(method, algorithm=algorithm)
+            analyser = Analyser()
+            analysis_results = analyser.analyse(solution)
+            analyser.interpret_results(solution, analysis_results, logging.info)
+            (ranges, shadow_prices) = analysis_results[RhsSensitivityAnalyser.name()]
+            assert np.allclose(ranges, expected_ranges, atol=0.001), f"right hand side ranges seem to be incorrect, expected {expected_ranges}, got {ranges.tolist()}"
+            assert np.allclose(shadow_prices, expected_prices, atol=0.001), f"shadow prices seem to be incorrect, expected {expected_prices}, got {shadow_prices.tolist()}"
+
+    # z = 3 * y1 + 2 * y2 = 2.5 * b1 + 0.5 * b2, as long as y1 = (b1 + b2) / 2 <= 6 and y2 = (b1 - b2) / 2 >= 0
+    model = Model("example_26_rhs_sensitivity_min")
+    y1 = model.create_variable("y1")
+    y2 = model.create_variable("y2")
+    model.add_constraint(y1 + y2 >= 4)
+    model.add_constraint(y1 - y2 == 1)
+    model.add_constraint(y1 <= 6)
+    model.minimize(3*y1 + 2*y2)
+    for scaling in [None, "geometric"]:
+        (ranges, shadow_prices) = RhsSensitivityAnalyser().analyse(model.solve(scaling=scaling))
+        assert np.allclose(ranges, [(1.0, 11.0), (-4.0, 4.0), (2.5, float("inf"))]), "right hand side ranges of the min model seem to be incorrect"
+        assert np.allclose(shadow_prices, [2.5, 0.5, 0.0]), "shadow prices of the min model seem to be incorrect"
+
+    # the revised solver doesn't materialize tableaux bigger than the limit, there is nothing to analyse then
+    dense_tableaux_limit = mx.DENSE_TABLEAUX_LIMIT
+    mx.DENSE_TABLEAUX_LIMIT = 10
+    try:
+        solution = model.solve("revised")
+    finally:
+        mx.DENSE_TABLEAUX_LIMIT = dense_tableaux_limit
+    try:
+        RhsSensitivityAnalyser().analyse(solution)
+        assert False, "right hand sides analysis should reject the solution without the tableaux"
+    except Exception as exception:
+        assert "too big to be materialized" in str(exception), "unexpected exception"
+    logging.info("Congratulations! This right hand sides analysis look alright :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,69 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex import matrix as mx
+from tests.simplex.assignment_models import create_assignment_model
+
+def run():
+    model = Model("example_27_dual_values")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= 60)
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= 150)
+    model.add_constraint(x1 <= 8)
+    model.maximize(5*x1 + 4.5*x2 + 6*x3)
+
+    for method in ["tableaux", "revised"]:
+        for algorithm in ["primal", "dual"]:
+            solution = model.solve(method, algorithm=algorithm)
+            duals = solution.dual_values()
+            assert np.allclose(duals, [11/14, 1/35, 0.0]), f"dual values seem to be incorrect, got {duals.tolist()}"
+            assert np.allclose(solution.reduced_costs(), [0.0, 0.0, -4/7]), f"reduced costs seem to be incorrect, got {solution.reduced_costs().tolist()}"
+            # strong duality: the dual values are the optimal solution of the dual model
+            assert np.isclose(duals @ [c.bound for c in model.constraints], solution.objective_value()), "dual objective should equal the primal one"
+
+    # y and z are basic, so 2 = d1 + d2 and 1 = d1 - d2, x stays at its upper bound as long as its reduced cost 3 - d1 is positive
+    model = Model("example_27_dual_values_bounded")
+    x = model.create_variable("x", upper=3)
+    y = model.create_variable("y")
+    z = model.create_variable("z")
+    model.add_constraint(x + y + z <= 6)
+    model.add_constraint(y - z == 1)
+    model.add_constraint(x - y >= -10)
+    model.maximize(3*x + 2*y + z)
+    for options in [{}, {"method": "revised", "algorithm": "dual"}, {"scaling": "geometric"}, {"keep_tableaux": False}]:
+        solution = model.solve(**options)
+        assert np.allclose(solution.dual_values(), [1.5, 0.5, 0.0]), f"dual values of the bounded model seem to be incorrect ({options})"
+        assert np.allclose(solution.reduced_costs(), [1.5, 0.0, 0.0]), f"reduced costs of the bounded model seem to be incorrect ({options})"
+
+    # minimizing the negated objective negates the dual values and reduced costs
+    model.minimize(-3*x - 2*y - z)
+    solution = model.solve()
+    assert np.allclose(solution.dual_values(), [-1.5, -0.5, 0.0]), "dual values of the min model seem to be incorrect"
+    assert np.allclose(solution.reduced_costs(), [-1.5, 0.0, 0.0]), "reduced costs of the min model seem to be incorrect"
+
+    model.add_constraint(x + y >= 20)
+    assert model.solve().dual_values() is None, "infeasible model shouldn't have dual values"
+
+    # the revised solver doesn't materialize tableaux bigger than the limit, the dual values come then from its basis factorization
+    model = create_assignment_model(12)
+    expected_solution = model.solve("revised")
+    dense_tableaux_limit = mx.DENSE_TABLEAUX_LIMIT
+    mx.DENSE_TABLEAUX_LIMIT = 1000
+    try:
+        solution = model.solve("revised")
+    finally:
+        mx.DENSE_TABLEAUX_LIMIT = dense_tableaux_limit
+    assert solution.tableaux is None, "tableaux bigger than the limit shouldn't be materialized"
+    assert np.allclose(solution.dual_values(), expected_solution.dual_values()), "dual values shouldn't depend on the final tableaux"
+    reduced_costs = solution.reduced_costs()
+    assert np.allclose(reduced_costs, expected_solution.reduced_costs()), "reduced costs shouldn't depend on the final tableaux"
+    # the assignment is minimized, assigned pairs (at the upper bound) have nonpositive reduced costs and the other ones nonnegative
+    assignment = np.array(solution.assignment)
+    assert np.all(reduced_costs[assignment > 0.5] <= 1e-9) and np.all(reduced_costs[assignment < 0.5] >= -1e-9), "reduced costs of the optimal assignment have wrong signs"
+    logging.info("Congratulations! The dual values and reduced costs look alright :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
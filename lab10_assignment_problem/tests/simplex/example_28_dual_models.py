@@ -0,0 +1,55 @@
+import logging
+import numpy as np
+import scipy.sparse as sp
+from saport.simplex.model import Model
+
+def run():
+    primal = Model("example_28_dual_models")
+    x0 = primal.create_variable("x0", lower=float("-inf"))
+    x1 = primal.create_variable("x1")
+    primal.add_constraint(x0 + x1 <= 4)
+    primal.add_constraint(x0 - x1 == 1)
+    primal.add_constraint(x0 + 3*x1 >= 2)
+    primal.maximize(2*x0 + 3*x1)
+
+    expected_dual = Model("example_28_dual_models (expected dual)")
+    y0 = expected_dual.create_variable("y0")
+    y1 = expected_dual.create_variable("y1", lower=float("-inf"))
+    y2 = expected_dual.create_variable("y2")
+    expected_dual.add_constraint(y0 + y1 - y2 == 2)
+    expected_dual.add_constraint(y0 - y1 - 3*y2 >= 3)
+    expected_dual.minimize(4*y0 + y1 - 2*y2)
+
+    dual = primal.dual()
+    assert dual.is_equivalent(expected_dual), "dual of the model with an equality and a free variable wasn't calculated as expected"
+    assert [(v.lower, v.upper) for v in dual.variables] == [(v.lower, v.upper) for v in expected_dual.variables], "only the dual variable of the equality should be free"
+    assert np.isclose(dual.solve().objective_value(), primal.solve().objective_value()), "dual and primal should have the same value at optimum"
+
+    # bounds become additional rows: x0 <= 3 and -x0 <= -1
+    primal.set_variable_bounds(x0, 1.0, 3.0)
+    dual = primal.dual()
+    assert len(dual.variables) == 5 and len(dual.constraints) == 2, "bounds of the primal variables should get their own dual variables"
+    assert np.isclose(dual.solve().objective_value(), primal.solve().objective_value()), "dual of the bounded model should have the same optimum"
+
+    # sparse models are transposed without leaving the sparse storage, the dual of a minimized model gives the negated optimum
+    rng = np.random.default_rng(0)
+    A = sp.random(60, 90, density=0.05, random_state=0, format='csr')
+    A.data = np.ceil(A.data * 9)
+    primal = Model("example_28_dual_models_sparse")
+    primal.create_variables("x", 90, upper=5.0)
+    # right hand sides around A * x for some x within the bounds keep the model feasible
+    types = rng.choice(["<=", ">=", "="], 60, p=[0.6, 0.2, 0.2])
+    slacks = rng.integers(1, 10, 60) * np.select([types == "<=", types == ">="], [1.0, -1.0], 0.0)
+    primal.add_constraints_from_matrix(A, A @ rng.integers(0, 6, 90) + slacks, types)
+    primal.set_objective_vector(rng.integers(-10, 1, 90).astype(float), "min")
+    (primal_solution, dual_solution) = (primal.solve(), primal.dual().solve())
+    assert primal_solution.assignment is not None and dual_solution.assignment is not None, "the sparse model and its dual should be solvable"
+    assert np.isclose(dual_solution.objective_value(), -primal_solution.objective_value()), "dual of the sparse min model should give the negated optimum"
+    # (bounds of the primal variables turn into rows, so the double dual is equivalent to the model only by its optimum)
+    assert np.isclose(primal.dual().dual().solve().objective_value(), primal_solution.objective_value()), "double dual should have the same optimum as the initial model"
+
+    logging.info("Congratulations! The duals of the mixed and bounded models look alright :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
@@ -0,0 +1,85 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import SolveStrategy
+from saport.simplex.solution import SolutionStatus
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+
+def run():
+    # a tall model: 2 variables and 40 constraints cutting the corner of the feasible region
+    model = Model("example_29_solve_strategy")
+    x = model.create_variable("x")
+    y = model.create_variable("y", upper=8)
+    for i in range(1, 41):
+        model.add_constraint(i * x + (41 - i) * y <= 41 * 10)
+    model.add_constraint(x - y >= -5)
+    model.maximize(3*x + 2*y)
+
+    assert SolveStrategy.choose(model, "auto") == SolveStrategy.DUAL, "the dual of a tall model should be cheaper to solve"
+    assert SolveStrategy.choose(model) == SolveStrategy.PRIMAL, "the model itself should be solved by default"
+
+    primal_solution = model.solve()
+    for strategy in ["auto", "dual"]:
+        for method in ["tableaux", "revised"]:
+            solution = model.solve(method, strategy=strategy)
+            assert solution.status == SolutionStatus.OPTIMAL, f"solving through the dual should find the optimum ({strategy}, {method})"
+            assert np.allclose(solution.assignment, primal_solution.assignment), f"assignment should be recovered from the dual ({strategy}, {method}), got {solution.assignment}"
+            assert np.isclose(solution.objective_value(), primal_solution.objective_value()), "objective value should be the same as the primal one"
+            assert not solution.has_tableaux(), "solution found through the dual shouldn't have the tableaux of the model"
+            assert set(solution.basis.basic) == set(primal_solution.basis.basic) and solution.basis.at_upper == primal_solution.basis.at_upper, \
+                f"basis complementary to the dual one should be the optimal basis of the model, got {solution.basis}"
+            assert np.allclose(solution.dual_values(), primal_solution.dual_values()), "dual values should be the assignment of the dual"
+            assert np.allclose(solution.reduced_costs(), primal_solution.reduced_costs()), "reduced costs should follow the dual values"
+            assert not solution.has_tableaux(), "dual values of the solution found through the dual shouldn't rebuild the tableaux"
+            lightweight_solution = model.solve(method, strategy=strategy, keep_tableaux=False)
+            assert np.allclose(lightweight_solution.assignment, solution.assignment) and not lightweight_solution.has_tableaux(), "keep_tableaux shouldn't change the solution found through the dual"
+            # the tableaux are rebuilt by solving the model, so the analysis works as usual
+            assert np.allclose(ObjectiveSensitivityAnalyser().analyse(solution), ObjectiveSensitivityAnalyser().analyse(primal_solution)), "analysis of the rebuilt tableaux should be the same"
+
+    # x0 can be anywhere between 6.5 and 7.17 (x1 following it along the equality), the tableaux rebuilt for the solution
+    # found through the dual (from the complementary basis) should describe its assignment, not the vertex found by the primal simplex
+    alternative = Model("example_29_solve_strategy_alternative_optima")
+    x0 = alternative.create_variable("x0")
+    x1 = alternative.create_variable("x1", lower=float("-inf"), upper=-3)
+    x2 = alternative.create_variable("x2", lower=-3, upper=7)
+    alternative.add_constraint(x0 + x1 + x2 <= 34)
+    alternative.add_constraint(6*x0 + 4*x1 + x2 == 34)
+    alternative.add_constraint(-2*x1 <= 8)
+    alternative.add_constraint(6*x0 + 7*x1 + 2*x2 >= 25)
+    alternative.maximize(1*x2)
+    for method in ["tableaux", "revised"]:
+        solution = alternative.solve(method, strategy="dual")
+        assert np.allclose(solution.assignment, [6.5, -3.0, 7.0]), f"the dual should give the vertex x0 = 6.5 ({method}), got {solution.assignment}"
+        assert set(solution.basis.basic) == {"s0", "s2", "s3", "x0"} and solution.basis.at_upper == ["x2"], f"basis complementary to the dual one is incorrect, got {solution.basis}"
+        tableaux = solution.tableaux
+        row = list(tableaux.basis).index(tableaux.model.variables_by_name["x0"].index)
+        assert np.isclose(tableaux.table[row + 1, -1], 6.5), "rebuilt tableaux should correspond to the assignment of the solution"
+
+    # infeasible dual means the model is infeasible or unbounded, unbounded dual means it's infeasible
+    unbounded = Model("example_29_solve_strategy_unbounded")
+    x = unbounded.create_variable("x")
+    y = unbounded.create_variable("y")
+    unbounded.add_constraint(x - y <= 1)
+    unbounded.maximize(x + y)
+    assert unbounded.solve(strategy="dual").status == SolutionStatus.UNBOUNDED, "unbounded model should be recognized through its dual"
+    # the model is solved right away when its dual is infeasible, so the tableaux are kept as requested
+    for keep_tableaux in [True, False]:
+        solution = unbounded.solve(strategy="dual", keep_tableaux=keep_tableaux)
+        assert solution.has_tableaux() == keep_tableaux, f"solution should {'' if keep_tableaux else 'not '}keep the tableaux"
+        assert solution.status == SolutionStatus.UNBOUNDED, "unbounded lightweight solution should keep its status"
+    unbounded.add_constraint(x + y <= -1)
+    assert unbounded.solve(strategy="dual").status == SolutionStatus.INFEASIBLE, "infeasible model should be recognized through its dual"
+    unbounded.add_constraint(x >= 2)
+    unbounded.add_constraint(x + y >= 0)
+    assert unbounded.solve(strategy="dual").status == SolutionStatus.INFEASIBLE, "infeasible model should be recognized through its dual"
+
+    try:
+        model.solve(presolve=True, strategy="dual")
+        assert False, "solving through the dual should reject the presolve"
+    except Exception as exception:
+        assert "can't be presolved" in str(exception), "unexpected exception"
+    logging.info("Congratulations! Solving the models through their duals works :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
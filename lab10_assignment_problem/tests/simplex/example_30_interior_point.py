@@ -0,0 +1,86 @@
+import logging
+import numpy as np
+from saport.simplex.model import Model
+from saport.simplex.solver import Solver
+from saport.simplex.revised import RevisedSolver
+from saport.simplex.ipm import InteriorPointSolver
+from saport.simplex.analyser import Analyser
+from saport.simplex.analysis_tools.objective_sensitivity import ObjectiveSensitivityAnalyser
+from tests.simplex.assignment_models import create_assignment_model
+
+def run():
+    model = Model("example_30_interior_point")
+    x1 = model.create_variable("x1")
+    x2 = model.create_variable("x2")
+    x3 = model.create_variable("x3")
+    model.add_constraint(6*x1 + 5*x2 + 8*x3 <= 60)
+    model.add_constraint(10*x1 + 20*x2 + 10*x3 <= 150)
+    model.add_constraint(x1 <= 8)
+    model.maximize(5*x1 + 4.5*x2 + 6*x3)
+
+    expected = model.solve()
+    for solver in [InteriorPointSolver(Solver(collect_stats=True)), InteriorPointSolver(RevisedSolver(collect_stats=True))]:
+        solution = solver.solve(model.snapshot())
+        assert np.isclose(solution.objective_value(), expected.objective_value()), f"interior point method found a different optimum, got {solution.objective_value()}"
+        assert np.allclose(solution.assignment, expected.assignment), "the optimal vertex is unique, so the crossover should find it"
+        assert np.allclose(solution.dual_values(), expected.dual_values()), "dual values should be read off the crossover tableaux"
+        assert solution.stats.interior_point_iterations > 0, "interior point iterations should be counted"
+        assert solution.stats.stage_times["interior point"] > 0.0, "interior point method should be timed"
+        # the crossover starts next to the optimum, the simplex has only a few pivots left (if any)
+        assert sum(solution.stats.pivots.values()) <= 3, f"crossover took too many pivots: {solution.stats.pivots}"
+
+    # the crossover gives a basic solution, so the sensitivity analysis works like for the simplex
+    ranges = Analyser().analyse(model.solve("ipm"))[ObjectiveSensitivityAnalyser.name()]
+    assert np.allclose(ranges, Analyser().analyse(expected)[ObjectiveSensitivityAnalyser.name()]), "cost ranges of the crossover solution should match the simplex ones"
+
+    # every point of the edge x + y = 4 is optimal, the interior point method stops in its middle and the crossover moves to a vertex
+    model = Model("example_30_interior_point_edge")
+    x = model.create_variable("x")
+    y = model.create_variable("y", upper=3)
+    z = model.create_variable("z", lower=float("-inf"), upper=1)
+    model.add_constraint(x + y <= 4)
+    model.add_constraint(x - z >= 0)
+    model.maximize(x + y + 2*z)
+    # the standard model for the interior point method is built without touching the state of the crossover solver
+    crossover_solver = Solver()
+    crossover_solver.solve(model.snapshot())
+    (substitutions, column_factors) = (crossover_solver.bound_substitutions, crossover_solver.column_factors)
+    standard_model = crossover_solver.standard_model(expected.model)
+    assert len(standard_model.variables) == 3 and crossover_solver.bound_substitutions is substitutions and crossover_solver.column_factors is column_factors, \
+        "building the standard model shouldn't change the state of the solver"
+
+    solver = InteriorPointSolver(Solver())
+    solution = solver.solve(model.snapshot())
+    assert solver.converged, "interior point method should converge on the bounded model with a free variable"
+    assert np.isclose(solution.objective_value(), 6.0), f"optimum of the edge model should be 6, got {solution.objective_value()}"
+    assert np.isclose(solution.value(z), 1.0) and (np.isclose(solution.value(x), 4.0) or np.isclose(solution.value(y), 3.0)), \
+        f"crossover should end in a vertex, got {solution.assignment}"
+
+    # statuses are always decided by the simplex
+    model.add_constraint(x + y >= 5)
+    assert model.solve("ipm").is_feasible == False, "interior point method shouldn't find a solution of an unfeasible model"
+    model = Model("example_30_interior_point_unbounded")
+    x = model.create_variable("x")
+    y = model.create_variable("y")
+    model.add_constraint(x - y <= 1)
+    model.maximize(x + y)
+    assert model.solve("ipm").is_bounded == False, "interior point method should detect the unbounded model"
+
+    for (options, message) in [({"presolve": True}, "doesn't support presolving"), ({"start_basis": expected.basis}, "can't be warm started")]:
+        try:
+            model.solve("ipm", **options)
+            assert False, f"solving with the interior point method should reject {list(options)[0]}"
+        except Exception as exception:
+            assert message in str(exception), "unexpected exception"
+
+    # the assignment problem has a unique optimum, the crossover needs just a few pivots
+    model = create_assignment_model(12)
+    solution = model.solve("ipm")
+    assert np.isclose(solution.objective_value(), model.solve().objective_value()), "interior point method found a different optimal assignment"
+    assert np.allclose(solution.assignment, np.round(solution.assignment)), "crossover should give an integral (basic) assignment"
+
+    logging.info("Congratulations! The interior point method with the crossover works :)")
+
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    run()
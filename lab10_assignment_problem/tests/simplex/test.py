@@ -1,6 +1,6 @@
 import importlib
 import os
-test_modules = ['example_01_solvable', 'example_02_solvable', 'example_03_unbounded', 'example_04_solvable_artificial_vars', 'example_05_unfeasible', 'example_06_dual', 'example_07_cost_sensitivity']
+test_modules = ['example_01_solvable', 'example_02_solvable', 'example_03_unbounded', 'example_04_solvable_artificial_vars', 'example_05_unfeasible', 'example_06_dual', 'example_07_cost_sensitivity', 'example_08_revised_simplex', 'example_09_sparse_matrix', 'example_10_basis_tracking', 'example_11_pricing_rules', 'example_12_bounded_variables', 'example_13_dual_simplex', 'example_14_warm_start', 'example_15_matrix_form', 'example_16_expression_builder', 'example_17_compiled_expressions', 'example_18_variable_lookup', 'example_19_model_snapshots', 'example_20_presolve', 'example_21_scaling', 'example_22_iteration_limits', 'example_23_solver_stats', 'example_24_lightweight_solutions', 'example_25_multiple_objectives', 'example_26_rhs_sensitivity', 'example_27_dual_values', 'example_28_dual_models', 'example_29_solve_strategy', 'example_30_interior_point']
 test_dir = 'tests.simplex'
 print("Running tests...")
 success = True